@@ -5,17 +5,27 @@ from flightdeck_contrib.ingestion.media_enhancements import (
     build_proxy_command,
     build_tonemap_filter,
     detect_device,
+    detect_device_batch,
     detect_hdr,
     detect_vfr,
+    detect_vfr_batch,
+    measure_loudnorm,
     parse_fraction,
+    parse_fractions,
 )
+from flightdeck_contrib.ingestion.probe_cache import probe
 
 __all__ = [
     "build_normalize_command",
     "build_proxy_command",
     "build_tonemap_filter",
     "detect_device",
+    "detect_device_batch",
     "detect_hdr",
     "detect_vfr",
+    "detect_vfr_batch",
+    "measure_loudnorm",
     "parse_fraction",
+    "parse_fractions",
+    "probe",
 ]
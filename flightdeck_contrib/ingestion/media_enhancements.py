@@ -4,28 +4,139 @@ Extracted from Skyforge's core/media.py and core/pipeline.py for FlightDeck
 integration. Place in FlightDeck at: ingestion/src/media_enhancements.py
 
 These utilities extend FlightDeck's existing ingestion/src/media.py with:
-- Device detection from filename patterns (DJI, iPhone, GoPro, Meta glasses, etc.)
+- Device detection from filename patterns (DJI, iPhone, GoPro, Meta glasses, etc.),
+  per file or in one pass over an ingest directory
 - HDR detection from color_transfer metadata
-- VFR (variable frame rate) detection
+- VFR (variable frame rate) detection, per stream or vectorized over a probe batch
+- Two-pass loudnorm measurement for accurate -16 LUFS audio normalization
 - FFmpeg command builders for normalization and proxy generation
 
 Integration note: Import these functions alongside FlightDeck's existing
 probe_file() in ingestion/src/media.py, or call them in the ingestion worker
 after probing to populate the new DB columns added in migrations/add_quality_metrics.sql.
 
-Dependencies: ffmpeg (system binary)
+Dependencies: ffmpeg (system binary); numpy for the *_batch VFR helpers
 """
 
 from __future__ import annotations
 
+import json
+import math
+import os
+import re
+import subprocess
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import numpy as np
+
+TonemapBackend = Literal["cpu", "libplacebo", "vaapi"]
+HwAccel = Literal["cuda", "videotoolbox", "vaapi"]
 
 # Known HDR color transfer functions reported by ffprobe
 _HDR_TRANSFER_FUNCTIONS = frozenset({"smpte2084", "arib-std-b67"})
 
+# Device classes in priority order, one compiled pattern per class. Patterns run
+# against the upper-cased POSIX path: directory tokens must match a whole path
+# component, filename prefixes are anchored to the last component.
+_DEVICE_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("drone", re.compile(r"(?:^|/)(?:ATOM_001|ATOM|DCIM)(?:/|$)|(?:^|/)PTSC_[^/]*$")),
+    ("iphone", re.compile(r"(?:^|/)(?:IPHONE|APPLE)(?:/|$)")),
+    ("meta_glasses", re.compile(r"(?:^|/)(?:META_GLASSES|META|RAY-BAN)(?:/|$)")),
+    ("gopro", re.compile(r"(?:^|/)GOPRO(?:/|$)|(?:^|/)G[HX][^/]*$")),
+    ("dji", re.compile(r"(?:^|/)DJI(?:/|$)|(?:^|/)DJI_[^/]*$")),
+    ("insta360", re.compile(r"(?:^|/)INSTA360(?:/|$)")),
+    ("meta_glasses", re.compile(r"SINGULAR_DISPLAY[^/]*$")),
+)
+
 # VFR detection tolerance: if nominal vs average fps differ by more than 1%
 _VFR_TOLERANCE = 0.01
 
+# EBU R128 loudness target shared by the measurement and encode passes
+_LOUDNORM_TARGET = "I=-16:TP=-1.5:LRA=11"
+
+# Shared FFmpeg argv fragments — every builder splices these instead of
+# rebuilding the same literals per call
+_FFMPEG_HEAD = ("ffmpeg", "-hide_banner", "-y")
+_H264_BASE = ("-c:v", "libx264", "-pix_fmt", "yuv420p", "-preset", "veryfast")
+_X264_FIXED_GOP = ("-x264-params", "keyint=60:min-keyint=60:scenecut=0")
+_AAC_256 = ("-c:a", "aac", "-b:a", "256k")
+_NO_AUDIO = ("-an",)
+_FASTSTART_TAIL = ("-movflags", "+faststart")
+
+# Hardware device setup each GPU tonemap backend needs ahead of -i
+_TONEMAP_DEVICE_ARGS: dict[str, tuple[str, ...]] = {
+    "cpu": (),
+    "libplacebo": ("-init_hw_device", "vulkan=vk", "-filter_hw_device", "vk"),
+    "vaapi": (
+        "-init_hw_device", "vaapi=va:/dev/dri/renderD128",
+        "-filter_hw_device", "va",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class _HwAccelProfile:
+    """FFmpeg arguments for one hardware decode/encode backend."""
+
+    decode: tuple[str, ...]  # before -i; decoded frames stay in device memory
+    sw_decode: tuple[str, ...]  # before -i; decoded frames land in system memory
+    scale: str  # on-device scale filter, formatted with the scale value
+    download: str  # prefix moving device frames to system memory for CPU filters
+    upload: str  # suffix moving system-memory frames back for the encoder
+    encoder: tuple[str, ...]
+    quality: str  # constant-quality flag taking the CRF value
+    gop: tuple[str, ...]
+
+
+_VAAPI_DEVICE = (
+    "-init_hw_device", "vaapi=va:/dev/dri/renderD128",
+    "-hwaccel", "vaapi", "-hwaccel_device", "va",
+)
+
+# cuda and vaapi decode, filter and encode on the GPU. VideoToolbox only
+# accelerates decode: frames come back to system memory and libx264 encodes,
+# keeping output identical to the CPU path.
+_HWACCEL_PROFILES: dict[str, _HwAccelProfile] = {
+    "cuda": _HwAccelProfile(
+        decode=("-hwaccel", "cuda", "-hwaccel_output_format", "cuda"),
+        sw_decode=("-hwaccel", "cuda"),
+        scale="scale_cuda={}:format=yuv420p",
+        download="hwdownload,format=yuv420p,",
+        upload="",  # h264_nvenc uploads system-memory frames itself
+        encoder=("-c:v", "h264_nvenc", "-preset", "p4"),
+        quality="-cq",
+        gop=("-g", "60", "-no-scenecut", "1"),
+    ),
+    "vaapi": _HwAccelProfile(
+        decode=(*_VAAPI_DEVICE, "-hwaccel_output_format", "vaapi", "-filter_hw_device", "va"),
+        sw_decode=(*_VAAPI_DEVICE, "-filter_hw_device", "va"),
+        scale="scale_vaapi={}:format=nv12",
+        download="hwdownload,format=nv12,",
+        upload=",format=nv12,hwupload",
+        encoder=("-c:v", "h264_vaapi"),
+        quality="-qp",
+        gop=("-g", "60"),
+    ),
+    "videotoolbox": _HwAccelProfile(
+        decode=("-hwaccel", "videotoolbox"),
+        sw_decode=("-hwaccel", "videotoolbox"),
+        scale="scale={}",
+        download="",
+        upload="",
+        encoder=_H264_BASE,
+        quality="-crf",
+        gop=_X264_FIXED_GOP,
+    ),
+}
+
+# loudnorm JSON keys required to drive a linear second pass
+_LOUDNORM_KEYS = ("input_i", "input_tp", "input_lra", "input_thresh", "target_offset")
+
 
 def detect_device(file_path: Path) -> str:
     """Detect the capture device from filename and path conventions.
@@ -50,27 +161,48 @@ def detect_device(file_path: Path) -> str:
         Device string: "drone", "iphone", "gopro", "dji", "meta_glasses",
         "insta360", or "unknown".
     """
-    parts = [p.upper() for p in file_path.parts]
-    name = file_path.stem.upper()
-
-    if any(d in parts for d in ("ATOM_001", "ATOM", "DCIM")) or name.startswith("PTSC_"):
-        return "drone"
-    if "IPHONE" in parts or "APPLE" in parts:
-        return "iphone"
-    if "META_GLASSES" in parts or "META" in parts or "RAY-BAN" in parts:
-        return "meta_glasses"
-    if "GOPRO" in parts or name.startswith("GH") or name.startswith("GX"):
-        return "gopro"
-    if "DJI" in parts or name.startswith("DJI_"):
-        return "dji"
-    if "INSTA360" in parts:
-        return "insta360"
-    if "SINGULAR_DISPLAY" in name:
-        return "meta_glasses"
+    return _match_device(file_path.as_posix().upper())
 
-    return "unknown"
 
+def detect_device_batch(root: Path) -> Iterator[tuple[Path, str]]:
+    """Walk an ingest directory once and classify every file's capture device.
+
+    Uses os.scandir directly (DirEntry caches the file type, so no extra stat
+    per file) and the same compiled patterns as detect_device(). Prefer this
+    over calling detect_device() per file when registering a whole upload or
+    NAS-mounted volume — the directory walk dominates either way, and this
+    does it once. Symlinked directories are not followed.
+
+    The walk is blocking; run it off the event loop in async workers::
+
+        pairs = await asyncio.to_thread(lambda: list(detect_device_batch(upload_dir)))
+        await db.executemany(
+            "UPDATE assets SET device_type = $1 WHERE original_path = $2",
+            [(device, str(path)) for path, device in pairs],
+        )
+
+    Args:
+        root: Directory to walk recursively.
 
+    Yields:
+        (path, device) pairs for every regular file under root, with device as
+        returned by detect_device().
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        path = Path(entry.path)
+                        yield path, _match_device(path.as_posix().upper())
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=64)
 def detect_hdr(color_transfer: str) -> bool:
     """Detect HDR content from the color_transfer field reported by ffprobe.
 
@@ -124,11 +256,14 @@ def detect_vfr(r_frame_rate: str, avg_frame_rate: str) -> bool:
     return abs(r_fps - avg_fps) / r_fps > _VFR_TOLERANCE
 
 
+@lru_cache(maxsize=1024)
 def parse_fraction(frac_str: str) -> float:
     """Parse a frame rate fraction string into a float.
 
     Handles both fraction format ("30000/1001") and plain float format ("30.0").
     Returns 0.0 on any parse error to allow safe downstream comparisons.
+    Results are memoized — ffprobe reports the same handful of rate strings
+    for nearly every clip in a batch.
 
     Args:
         frac_str: Frame rate string as returned by ffprobe (e.g. "30000/1001").
@@ -148,33 +283,152 @@ def parse_fraction(frac_str: str) -> float:
         return 0.0
 
 
-def build_tonemap_filter() -> str:
+def parse_fractions(frac_strs: Iterable[str]) -> np.ndarray:
+    """Parse many frame rate strings into a float64 array.
+
+    Each string goes through the memoized parse_fraction, so the distinct rate
+    strings in a batch (usually a handful) are parsed once and the rest are
+    cache hits.
+
+    Args:
+        frac_strs: Frame rate strings as returned by ffprobe.
+
+    Returns:
+        1-D float64 array, 0.0 where a string is unparseable.
+    """
+    import numpy as np
+
+    return np.fromiter(map(parse_fraction, frac_strs), dtype=np.float64)
+
+
+def detect_vfr_batch(r_frame_rates: Iterable[str], avg_frame_rates: Iterable[str]) -> np.ndarray:
+    """Vectorized detect_vfr over a batch of probed streams.
+
+    Integrate with FlightDeck's ingestion worker when back-filling a directory
+    or a page of DB rows, then write the flags in one executemany::
+
+        is_vfr = detect_vfr_batch(
+            [row.r_frame_rate for row in rows],
+            [row.avg_frame_rate for row in rows],
+        )
+        await conn.executemany(
+            "UPDATE assets SET is_vfr = $1 WHERE id = $2",
+            zip(is_vfr.tolist(), (row.id for row in rows)),
+        )
+
+    Args:
+        r_frame_rates: Nominal (container) frame rate strings, one per stream.
+        avg_frame_rates: Average frame rate strings, aligned with r_frame_rates.
+
+    Returns:
+        Boolean array, True where the stream is VFR under the same 1% rule as
+        detect_vfr (False where either rate is missing or non-positive).
+    """
+    import numpy as np
+
+    r_fps = parse_fractions(r_frame_rates)
+    avg_fps = parse_fractions(avg_frame_rates)
+
+    valid = (r_fps > 0) & (avg_fps > 0)
+    delta = np.abs(r_fps - avg_fps)
+    ratio = np.divide(delta, r_fps, out=np.zeros_like(delta), where=valid)
+    return valid & (ratio > _VFR_TOLERANCE)
+
+
+def build_tonemap_filter(backend: TonemapBackend = "cpu") -> str:
     """Build the HDR-to-SDR Hable tonemapping FFmpeg filter chain.
 
-    Uses zscale for colorspace conversion (more accurate than FFmpeg's built-in
-    colormatrix) with Hable tonemapping for natural-looking SDR output from
-    PQ/HLG HDR sources. This is the same filter used in Skyforge's ingest pipeline.
+    The default "cpu" backend uses zscale for colorspace conversion (more
+    accurate than FFmpeg's built-in colormatrix) with Hable tonemapping for
+    natural-looking SDR output from PQ/HLG HDR sources. This is the same filter
+    used in Skyforge's ingest pipeline.
 
-    The filter chain:
+    The CPU filter chain:
     1. zscale to linear light (npl=100 for SDR brightness normalization)
     2. Hable tonemap (desat=0 preserves saturation)
     3. zscale to BT.709 for standard SDR delivery
     4. format=yuv420p for H.264 compatibility
 
+    GPU backends run the same EOTF/tonemap/OETF on the GPU and download the
+    result as yuv420p, so the rest of the encode is unchanged:
+    - "libplacebo": Vulkan shaders (needs an ffmpeg built with libplacebo)
+    - "vaapi": tonemap_vaapi on Intel/AMD render nodes (10-bit upload)
+
+    GPU chains need a filter device; build_normalize_command() adds the
+    matching -init_hw_device flags when given tonemap_backend.
+
     Integrate with FlightDeck's FFmpeg command builders::
 
         if asset.is_hdr:
             cmd.extend(["-vf", build_tonemap_filter()])
 
+    Args:
+        backend: "cpu" (zscale), "libplacebo" or "vaapi". Default "cpu".
+
     Returns:
         FFmpeg -vf filter string for HDR tonemapping.
+
+    Raises:
+        ValueError: If backend is not a known tonemap backend.
     """
-    return (
-        "zscale=t=linear:npl=100,"
-        "tonemap=tonemap=hable:desat=0,"
-        "zscale=t=bt709:m=bt709:r=tv,"
-        "format=yuv420p"
-    )
+    if backend == "cpu":
+        return (
+            "zscale=t=linear:npl=100,"
+            "tonemap=tonemap=hable:desat=0,"
+            "zscale=t=bt709:m=bt709:r=tv,"
+            "format=yuv420p"
+        )
+    if backend == "libplacebo":
+        return (
+            "hwupload,"
+            "libplacebo=tonemapping=hable:colorspace=bt709:"
+            "color_primaries=bt709:color_trc=bt709:format=yuv420p,"
+            "hwdownload,format=yuv420p"
+        )
+    if backend == "vaapi":
+        return (
+            "format=p010,hwupload,"
+            "tonemap_vaapi=format=nv12:t=bt709:m=bt709:p=bt709,"
+            "hwdownload,format=nv12,format=yuv420p"
+        )
+    raise ValueError(f"Unknown tonemap backend: {backend!r}")
+
+
+def measure_loudnorm(source: Path) -> dict[str, str]:
+    """Run the loudnorm measurement pass (first pass of two-pass normalization).
+
+    Decodes only the audio stream through loudnorm with print_format=json and
+    returns the measured loudness values. Feed the result to
+    build_normalize_command(loudnorm_measured=...) so the encode pass applies a
+    linear gain correction instead of single-pass dynamic normalization, which
+    under/overshoots the target on dynamic material.
+
+    Measurements are cached per (path, size, mtime), so re-exporting an
+    unchanged source skips the extra pass.
+
+    Integrate with FlightDeck's ingestion worker::
+
+        measured = measure_loudnorm(tmp_path) if asset.has_audio else None
+        cmd = build_normalize_command(
+            source=tmp_path,
+            output=norm_path,
+            has_audio=asset.has_audio,
+            loudnorm_measured=measured,
+        )
+
+    Args:
+        source: Local path to the source video or audio file.
+
+    Returns:
+        Dict with input_i, input_tp, input_lra, input_thresh and target_offset
+        as strings, or an empty dict if the file has no measurable audio
+        (callers then fall back to single-pass loudnorm).
+    """
+    try:
+        stat = source.stat()
+    except OSError:
+        return {}
+    return dict(_measure_loudnorm_cached(str(source), stat.st_size, stat.st_mtime_ns))
 
 
 def build_normalize_command(
@@ -185,6 +439,9 @@ def build_normalize_command(
     target_fps: int = 30,
     crf: int = 18,
     audio_normalize: bool = True,
+    loudnorm_measured: dict[str, str] | None = None,
+    tonemap_backend: TonemapBackend = "cpu",
+    hwaccel: HwAccel | None = None,
 ) -> list[str]:
     """Build the FFmpeg command for normalizing a video to the FlightDeck baseline.
 
@@ -193,7 +450,8 @@ def build_normalize_command(
     - Video codec: H.264 (libx264), yuv420p
     - Frame rate: CFR at target_fps (default 30)
     - HDR: Hable tonemapped to SDR if is_hdr is True
-    - Audio: AAC 256k, optionally loudnorm normalized to -16 LUFS
+    - Audio: AAC 256k, optionally loudnorm normalized to -16 LUFS (two-pass
+      linear when loudnorm_measured is supplied from measure_loudnorm())
     - Keyframe interval: every 60 frames (2s at 30fps) for seek accuracy
 
     This mirrors Skyforge's pipeline._run_normalize() exactly. The resulting
@@ -217,34 +475,62 @@ def build_normalize_command(
         target_fps: Target constant frame rate. Default 30.
         crf: H.264 CRF quality (lower = higher quality). Default 18.
         audio_normalize: If True, applies loudnorm to -16 LUFS.
+        loudnorm_measured: Result of measure_loudnorm() for this source. When
+            given, the encode runs as the second loudnorm pass with the measured
+            values; when None or empty, single-pass loudnorm is used.
+        tonemap_backend: Tonemap backend for HDR sources ("cpu", "libplacebo"
+            or "vaapi"). GPU backends add the hardware device setup flags.
+        hwaccel: Hardware decode/encode backend ("cuda", "vaapi" or
+            "videotoolbox"), or None for software. See _HWACCEL_PROFILES.
 
     Returns:
         List of strings suitable for subprocess.run().
-    """
-    cmd = ["ffmpeg", "-hide_banner", "-y", "-i", str(source)]
-
-    if is_hdr:
-        cmd.extend(["-vf", build_tonemap_filter()])
-
-    cmd.extend(["-fps_mode", "cfr", "-r", str(target_fps)])
 
-    cmd.extend([
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-preset", "veryfast",
-        "-crf", str(crf),
-        "-x264-params", "keyint=60:min-keyint=60:scenecut=0",
-    ])
-
-    if has_audio:
-        cmd.extend(["-c:a", "aac", "-b:a", "256k"])
-        if audio_normalize:
-            cmd.extend(["-af", "loudnorm=I=-16:TP=-1.5:LRA=11"])
+    Raises:
+        ValueError: If an HDR source combines hwaccel="vaapi" with
+            tonemap_backend="libplacebo". The Vulkan tonemap and the VAAPI
+            encoder upload each need their own -filter_hw_device, and FFmpeg
+            takes only one.
+    """
+    tonemap = build_tonemap_filter(tonemap_backend) if is_hdr else None
+    device_args = _TONEMAP_DEVICE_ARGS[tonemap_backend] if tonemap else ()
+    video_filter = ("-vf", tonemap) if tonemap else ()
+    encoder: tuple[str, ...] = (*_H264_BASE, "-crf", str(crf), *_X264_FIXED_GOP)
+
+    if hwaccel:
+        hw = _HWACCEL_PROFILES[hwaccel]
+        encoder = (*hw.encoder, hw.quality, str(crf), *hw.gop)
+        if tonemap:
+            # Tonemap chains start from system-memory frames, so decode there
+            # and only upload the SDR result for the encoder
+            decode_args = hw.sw_decode
+            video_filter = ("-vf", f"{tonemap}{hw.upload}")
+            if hwaccel == "vaapi" and tonemap_backend == "libplacebo":
+                raise ValueError(
+                    'hwaccel="vaapi" cannot encode a tonemap_backend="libplacebo" '
+                    'chain; use tonemap_backend="vaapi" or "cpu"'
+                )
+            if hwaccel == "vaapi" and tonemap_backend == "vaapi":
+                device_args = ()  # sw_decode already opened the "va" device
+        else:
+            decode_args = hw.decode
+        device_args = (*device_args, *decode_args)
+
+    if not has_audio:
+        audio: tuple[str, ...] = _NO_AUDIO
+    elif audio_normalize:
+        audio = (*_AAC_256, "-af", _loudnorm_filter(loudnorm_measured))
     else:
-        cmd.extend(["-an"])
-
-    cmd.extend(["-movflags", "+faststart", str(output)])
-    return cmd
+        audio = _AAC_256
+
+    return [
+        *_FFMPEG_HEAD, *device_args, "-i", str(source),
+        *video_filter,
+        "-fps_mode", "cfr", "-r", str(target_fps),
+        *encoder,
+        *audio,
+        *_FASTSTART_TAIL, str(output),
+    ]
 
 
 def build_proxy_command(
@@ -254,6 +540,7 @@ def build_proxy_command(
     scale: str = "1920:-2",
     crf: int = 28,
     audio_bitrate: str = "128k",
+    hwaccel: HwAccel | None = None,
 ) -> list[str]:
     """Build the FFmpeg command for generating a lightweight editing proxy.
 
@@ -277,32 +564,89 @@ def build_proxy_command(
         scale: FFmpeg scale filter value. Default "1920:-2" (1080p, keep AR).
         crf: H.264 CRF. Higher = smaller files. Default 28.
         audio_bitrate: AAC audio bitrate for the proxy. Default "128k".
+        hwaccel: Hardware decode/encode backend ("cuda", "vaapi" or
+            "videotoolbox"), or None for software. Decode, scale and encode
+            then stay on the GPU.
 
     Returns:
         List of strings suitable for subprocess.run().
     """
+    audio = ("-c:a", "aac", "-b:a", audio_bitrate) if has_audio else _NO_AUDIO
+
+    if hwaccel:
+        hw = _HWACCEL_PROFILES[hwaccel]
+        decode_args = hw.decode
+        scale_filter = hw.scale.format(scale)
+        encoder: tuple[str, ...] = (*hw.encoder, hw.quality, str(crf))
+    else:
+        decode_args = ()
+        scale_filter = f"scale={scale}"
+        encoder = (*_H264_BASE, "-crf", str(crf))
+
+    return [
+        *_FFMPEG_HEAD, *decode_args, "-i", str(source),
+        "-vf", scale_filter,
+        *encoder,
+        *audio,
+        *_FASTSTART_TAIL, str(output),
+    ]
+
+
+# ============================================================================
+# Internal helpers
+# ============================================================================
+
+
+def _match_device(path_upper: str) -> str:
+    """Classify an upper-cased POSIX path against the compiled device patterns."""
+    for device, pattern in _DEVICE_PATTERNS:
+        if pattern.search(path_upper):
+            return device
+    return "unknown"
+
+
+@lru_cache(maxsize=256)
+def _measure_loudnorm_cached(source: str, size: int, mtime_ns: int) -> dict[str, str]:
+    """Measure loudness once per (path, size, mtime) — size/mtime key the cache only."""
     cmd = [
-        "ffmpeg",
-        "-hide_banner",
-        "-y",
-        "-i",
-        str(source),
-        "-vf",
-        f"scale={scale}",
-        "-c:v",
-        "libx264",
-        "-pix_fmt",
-        "yuv420p",
-        "-preset",
-        "veryfast",
-        "-crf",
-        str(crf),
+        "ffmpeg", "-hide_banner", "-nostats",
+        "-i", source,
+        "-vn",
+        "-af", f"loudnorm={_LOUDNORM_TARGET}:print_format=json",
+        "-f", "null", "-",
     ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
 
-    if has_audio:
-        cmd.extend(["-c:a", "aac", "-b:a", audio_bitrate])
-    else:
-        cmd.extend(["-an"])
+    # loudnorm prints its JSON block as the last thing on stderr
+    stderr = result.stderr
+    start, end = stderr.rfind("{"), stderr.rfind("}")
+    if result.returncode != 0 or start < 0 or end < start:
+        return {}
+    try:
+        data = json.loads(stderr[start:end + 1])
+        measured = {key: str(data[key]) for key in _LOUDNORM_KEYS}
+    except (json.JSONDecodeError, KeyError):
+        return {}
 
-    cmd.extend(["-movflags", "+faststart", str(output)])
-    return cmd
+    # Silent tracks measure as -inf, which loudnorm rejects as a measured_* input
+    try:
+        if not all(math.isfinite(float(v)) for v in measured.values()):
+            return {}
+    except ValueError:
+        return {}
+    return measured
+
+
+def _loudnorm_filter(measured: dict[str, str] | None) -> str:
+    """Return the loudnorm filter — linear second pass if measurements are given."""
+    if not measured:
+        return f"loudnorm={_LOUDNORM_TARGET}"
+    return (
+        f"loudnorm={_LOUDNORM_TARGET}"
+        f":measured_I={measured['input_i']}"
+        f":measured_TP={measured['input_tp']}"
+        f":measured_LRA={measured['input_lra']}"
+        f":measured_thresh={measured['input_thresh']}"
+        f":offset={measured['target_offset']}"
+        ":linear=true:print_format=summary"
+    )
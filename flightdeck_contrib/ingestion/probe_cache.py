@@ -0,0 +1,70 @@
+"""Cached ffprobe for FlightDeck ingestion and export workers.
+
+Place in FlightDeck at: ingestion/src/probe_cache.py
+
+ffprobe opens the container, parses the moov atom, and reads packet timestamps
+to compute avg_frame_rate — tens of milliseconds per call on local disk, far
+more on NAS mounts. Workers that probe the same source for HDR/VFR detection
+and again for every deliverable export repeat that work. probe() caches the
+parsed result per (path, size, mtime), so an unchanged file is probed once per
+process and a rewritten file is re-probed automatically.
+
+Dependencies: ffprobe (system binary)
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+def probe(path: Path) -> dict[str, Any]:
+    """Return ffprobe's streams/format JSON for a file, cached per file version.
+
+    Integrate with FlightDeck's ingestion worker instead of re-probing::
+
+        info = probe(tmp_path)
+        video = next(s for s in info["streams"] if s["codec_type"] == "video")
+        is_hdr = detect_hdr(video.get("color_transfer", ""))
+        is_vfr = detect_vfr(video.get("r_frame_rate", "0/1"),
+                            video.get("avg_frame_rate", "0/1"))
+
+    Args:
+        path: Local path to the media file.
+
+    Returns:
+        Parsed ffprobe output with "streams" and "format" keys, or an empty
+        dict if the file is missing or ffprobe fails. The result is a copy, so
+        callers may modify it freely.
+    """
+    try:
+        stat = path.stat()
+        data = _probe_cached(str(path), stat.st_size, stat.st_mtime_ns)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        # Failures raise out of _probe_cached, so they are never cached
+        return {}
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=512)
+def _probe_cached(path: str, size: int, mtime_ns: int) -> dict[str, Any]:
+    """Run ffprobe once per (path, size, mtime_ns); size/mtime only key the cache."""
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v", "error",
+            "-print_format", "json",
+            "-show_streams",
+            "-show_format",
+            path,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    return json.loads(result.stdout)
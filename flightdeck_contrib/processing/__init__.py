@@ -3,6 +3,7 @@
 from flightdeck_contrib.processing.deliverable_exporter import DeliverableExporter
 from flightdeck_contrib.processing.quality_analyzer import QualityAnalyzer
 from flightdeck_contrib.processing.segment_scorer import (
+    FrameArrays,
     ScoredSegment,
     SegmentScorer,
     SelectionResult,
@@ -10,6 +11,7 @@ from flightdeck_contrib.processing.segment_scorer import (
 
 __all__ = [
     "DeliverableExporter",
+    "FrameArrays",
     "QualityAnalyzer",
     "ScoredSegment",
     "SegmentScorer",
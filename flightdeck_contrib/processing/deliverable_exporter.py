@@ -10,18 +10,112 @@ Generates two output types:
 
 All FFmpeg commands are ported directly from Skyforge's exporter.py. The output
 filename convention mirrors Skyforge's for cross-system compatibility:
-    <source>__seg###__<MM:SS>-<MM:SS>__<tags>.mp4
+    <source>__seg###__<MMmSSsmmm>-<MMmSSsmmm>__<tags>.mp4
 
-Dependencies: ffmpeg (system binary), flightdeck_contrib.schemas.quality
+Async workers can use trim_segment_async() / export_report_ready_async(), or
+export_many() to run a batch of exports concurrently with bounded parallelism.
+
+Dependencies: ffmpeg (system binary), flightdeck_contrib.schemas.quality,
+POSIX fcntl (output locking)
 """
 
 from __future__ import annotations
 
+import asyncio
+import fcntl
+import os
 import subprocess
+import tempfile
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO, Literal
 
 from flightdeck_contrib.schemas.quality import DeliverableRequest
 
+HwAccel = Literal["cuda", "videotoolbox", "vaapi"]
+
+# Shared FFmpeg argv fragments for both export types
+_FFMPEG_HEAD = ("ffmpeg", "-hide_banner", "-nostats", "-y")
+_H264_BASE = ("-c:v", "libx264", "-pix_fmt", "yuv420p", "-preset", "veryfast")
+_CFR_30 = ("-fps_mode", "cfr", "-r", "30")
+_AAC_256 = ("-c:a", "aac", "-b:a", "256k")
+_AAC_192 = ("-c:a", "aac", "-b:a", "192k")
+_NO_AUDIO = ("-an",)
+_FASTSTART_TAIL = ("-movflags", "+faststart")
+
+# Outputs are written to a ".part" staging file, so the muxer can't be
+# inferred from the extension
+_MP4_STAGING_TAIL = (*_FASTSTART_TAIL, "-f", "mp4")
+
+# Per-export FFmpeg timeout in seconds
+_FFMPEG_TIMEOUT = 300
+
+# How often an async export retries a contended output lock, in seconds
+_LOCK_POLL_INTERVAL = 0.1
+
+# Timecode sprite: one MM:SS label per second of the hour, stacked vertically
+_TC_SPRITE_LABELS = 3600
+_TC_CELL_WIDTH = 100
+_TC_CELL_HEIGHT = 36
+
+
+@dataclass(frozen=True)
+class _HwAccelProfile:
+    """FFmpeg arguments for one hardware decode/encode backend."""
+
+    decode: tuple[str, ...]  # before -i; decoded frames stay in device memory
+    scale: str  # on-device scale filter, formatted with the scale value
+    download: str  # appended to the scale when CPU-only burn-in filters follow
+    upload: str  # appended after the burn-in filters, ahead of the encoder
+    encoder: tuple[str, ...]
+    quality: str  # constant-quality flag taking the CRF value
+
+
+# cuda and vaapi decode, scale and encode on the GPU; drawtext/overlay only run
+# on the CPU, so burned-in reports pay one 1080p download (and upload for vaapi)
+# per frame after the on-device scale. VideoToolbox only accelerates decode and
+# keeps libx264. Mirrors the profiles in ingestion/media_enhancements.py.
+_HWACCEL_PROFILES: dict[str, _HwAccelProfile] = {
+    "cuda": _HwAccelProfile(
+        decode=("-hwaccel", "cuda", "-hwaccel_output_format", "cuda"),
+        scale="scale_cuda={}:format=yuv420p",
+        download=",hwdownload,format=yuv420p",
+        upload="",  # h264_nvenc uploads system-memory frames itself
+        encoder=("-c:v", "h264_nvenc", "-preset", "p4"),
+        quality="-cq",
+    ),
+    "vaapi": _HwAccelProfile(
+        decode=(
+            "-init_hw_device", "vaapi=va:/dev/dri/renderD128",
+            "-hwaccel", "vaapi", "-hwaccel_device", "va",
+            "-hwaccel_output_format", "vaapi", "-filter_hw_device", "va",
+        ),
+        scale="scale_vaapi={}:format=nv12",
+        download=",hwdownload,format=nv12",
+        upload=",format=nv12,hwupload",
+        encoder=("-c:v", "h264_vaapi"),
+        quality="-qp",
+    ),
+    "videotoolbox": _HwAccelProfile(
+        decode=("-hwaccel", "videotoolbox"),
+        scale="scale={}",
+        download="",
+        upload="",
+        encoder=_H264_BASE,
+        quality="-crf",
+    ),
+}
+
+# drawtext font, passed explicitly when present so FFmpeg skips the
+# fontconfig lookup on every start
+_DEFAULT_FONTFILE = Path("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
+
+# How much of the FFmpeg log to keep in errors after a failed export
+_LOG_TAIL_BYTES = 4096
+
 
 class DeliverableExporter:
     """Trims video segments and creates report-ready deliverables via FFmpeg.
@@ -32,8 +126,80 @@ class DeliverableExporter:
         output = exporter.export_report_ready(request, output_dir=Path("/tmp/exports"))
         if output:
             s3_path = await upload_to_s3(output)
+
+    Batch exports from an async worker, two libx264 threads per FFmpeg so the
+    concurrent processes share the cores instead of oversubscribing them::
+
+        exporter = DeliverableExporter(threads=2)
+        outputs = await exporter.export_many(requests, Path("/tmp/exports"))
+
+    FFmpeg output is never buffered in Python: stdout is discarded and
+    stderr goes straight to a per-process log file in log_dir (or is
+    discarded when log_dir is None). After a failed export, errors maps its
+    output path to the tail of that log (processes exporting concurrently
+    share the log, so the tail can include their lines too). The entry is
+    removed once that output exports successfully, so concurrent exports
+    in export_many() never overwrite each other's error.
+
+    The timecode burn-in is drawn by drawtext by default, which rasterizes
+    the text with FreeType on every frame. With timecode_overlay="sprite",
+    a strip of pre-rendered MM:SS labels (rendered once per host with
+    Pillow) is cropped per frame and overlaid instead, which is a plain
+    blend. The sprite shows source time as MM:SS without hours or
+    milliseconds and wraps after 60 minutes. Without Pillow it falls back to
+    drawtext.
+
+    With hwaccel set, segments are decoded, scaled and (for cuda/vaapi)
+    encoded on the GPU: h264_nvenc/h264_vaapi take the CRF value as their
+    constant-quality setting. Stream-copied keyframe-aligned trims never
+    decode and are unaffected.
+
+    Filename labels are escaped for the drawtext, option and filtergraph
+    levels, so names containing quotes, colons, backslashes or % burn in
+    literally. Setting text_shaping=False skips drawtext's bidi/shaping pass
+    for ASCII labels; it needs an FFmpeg built with the text_shaping option
+    (libfribidi before 7.0), which is why it is not the default.
+
+    Args:
+        threads: If set, passed to FFmpeg as -threads for every export. Leave
+            None to let FFmpeg pick (one process at a time).
+        log_dir: Directory for the FFmpeg log (ffmpeg-<pid>.log), opened once
+            per worker process. None discards FFmpeg's stderr.
+        timecode_overlay: "drawtext" (default) or "sprite" for the
+            pre-rendered timecode overlay.
+        hwaccel: Hardware decode/encode backend ("cuda", "vaapi" or
+            "videotoolbox"), or None (default) for software.
+        text_shaping: If False, pass text_shaping=0 to drawtext for ASCII text.
+        fontfile: Font for drawtext. Defaults to DejaVu Sans Bold when
+            installed, else FFmpeg's fontconfig default.
     """
 
+    def __init__(
+        self,
+        threads: int | None = None,
+        log_dir: Path | None = None,
+        timecode_overlay: Literal["drawtext", "sprite"] = "drawtext",
+        hwaccel: HwAccel | None = None,
+        text_shaping: bool = True,
+        fontfile: Path | None = None,
+    ) -> None:
+        self.threads = threads
+        self.log_dir = log_dir
+        self.timecode_overlay = timecode_overlay
+        self._hw = _HWACCEL_PROFILES[hwaccel] if hwaccel else None
+        self.text_shaping = text_shaping
+        if fontfile is None and _DEFAULT_FONTFILE.is_file():
+            fontfile = _DEFAULT_FONTFILE
+        self.fontfile = fontfile
+        self.errors: dict[Path, str] = {}
+        self._log_fh: BinaryIO | None = None
+
+    def close(self) -> None:
+        """Close the FFmpeg log file, if one was opened."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
     def trim_segment(
         self,
         request: DeliverableRequest,
@@ -43,10 +209,15 @@ class DeliverableExporter:
         """Trim a selected segment from its source video.
 
         Uses stream-copy-safe re-encoding to H.264/yuv420p at CFR 30fps.
-        Skips if the output file already exists (idempotent).
+        When request.keyframe_aligned is set, the segment is stream-copied
+        instead (no decode or encode). Normalized sources use a fixed 60-frame
+        GOP, so any start on a 2-second multiple of a normalized file is
+        aligned. Report-ready exports always re-encode because drawtext needs
+        decoded frames. Skips if the output file already exists (idempotent); see
+        _output_lock() for how concurrent workers avoid duplicate encodes.
 
         Output filename format::
-            <source_stem>__seg###__<MM:SS>-<MM:SS>__<tags>.mp4
+            <source_stem>__seg###__<MMmSSsmmm>-<MMmSSsmmm>__<tags>.mp4
 
         Args:
             request: DeliverableRequest describing the segment to export.
@@ -56,56 +227,41 @@ class DeliverableExporter:
         Returns:
             Path to the output file, or None if FFmpeg failed.
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        source = Path(request.source_path)
-
-        filename = self.build_export_filename(
-            source_name=source.stem,
-            segment_id=int(request.segment_id) if request.segment_id.isdigit() else 0,
-            start=request.start_time,
-            end=request.end_time,
-            suffix="clip",
-        )
-        output = output_dir / filename
-
+        output, cmd = self._trim_command(request, output_dir, crf)
         if output.exists():
             return output
 
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-y",
-            "-ss",
-            str(request.start_time),
-            "-i",
-            str(source),
-            "-t",
-            str(request.duration),
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-preset",
-            "veryfast",
-            "-crf",
-            str(crf),
-            "-fps_mode",
-            "cfr",
-            "-r",
-            "30",
-        ]
+        with _output_lock(output):
+            if output.exists():
+                return output
+            returncode, error = self._run_ffmpeg(cmd)
+            return self._publish(output, returncode, error)
 
-        if request.has_audio:
-            cmd.extend(["-c:a", "aac", "-b:a", "256k"])
-        else:
-            cmd.extend(["-an"])
+    async def trim_segment_async(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+        crf: int = 18,
+    ) -> Path | None:
+        """Async variant of trim_segment() that does not block the event loop.
 
-        cmd.extend(["-movflags", "+faststart", str(output)])
-        subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        Args:
+            request: DeliverableRequest describing the segment to export.
+            output_dir: Directory to write the trimmed segment into.
+            crf: H.264 constant rate factor (lower = higher quality). Default 18.
 
+        Returns:
+            Path to the output file, or None if FFmpeg failed.
+        """
+        output, cmd = self._trim_command(request, output_dir, crf)
         if output.exists():
             return output
-        return None
+
+        async with _output_lock_async(output):
+            if output.exists():
+                return output
+            returncode, error = await self._run_ffmpeg_async(cmd)
+            return self._publish(output, returncode, error)
 
     def export_report_ready(
         self,
@@ -128,80 +284,137 @@ class DeliverableExporter:
         Returns:
             Path to the output file, or None if FFmpeg failed.
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        source = Path(request.source_path)
-        src_stem = source.stem.replace("_norm", "")
+        output, cmd = self._report_command(request, output_dir)
+        if output.exists():
+            return output
 
-        source_label = request.source_label or src_stem
-        filename = self.build_export_filename(
-            source_name=src_stem,
-            segment_id=int(request.segment_id) if request.segment_id.isdigit() else 0,
-            start=request.start_time,
-            end=request.end_time,
-            suffix="report",
-        )
-        output = output_dir / filename
+        with _output_lock(output):
+            if output.exists():
+                return output
+            returncode, error = self._run_ffmpeg(cmd)
+            return self._publish(output, returncode, error)
 
+    async def export_report_ready_async(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+    ) -> Path | None:
+        """Async variant of export_report_ready() that does not block the event loop.
+
+        Args:
+            request: DeliverableRequest describing the segment and burn-in settings.
+            output_dir: Directory to write the report clip into.
+
+        Returns:
+            Path to the output file, or None if FFmpeg failed.
+        """
+        output, cmd = self._report_command(request, output_dir)
         if output.exists():
             return output
 
-        # Build video filter chain
-        filters: list[str] = [f"scale={request.target_width}:-2"]
+        async with _output_lock_async(output):
+            if output.exists():
+                return output
+            returncode, error = await self._run_ffmpeg_async(cmd)
+            return self._publish(output, returncode, error)
 
-        if request.burn_timecode:
-            tc_offset = request.start_time
-            filters.append(
-                f"drawtext=text='%{{pts\\:hms\\:{tc_offset}}}'"
-                f":fontsize=24:fontcolor=white:borderw=2:bordercolor=black"
-                f":x=10:y=h-40"
+    def export_both(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+        crf: int = 18,
+    ) -> tuple[Path | None, Path | None]:
+        """Create the trimmed clip and the report-ready clip in one FFmpeg pass.
+
+        Equivalent to trim_segment() followed by export_report_ready(), but
+        the source segment is demuxed and decoded once and fanned out to both
+        encoders with a split filter. Prefer this whenever a segment needs
+        both deliverables. Sources are expected to be normalized SDR; HDR
+        tonemapping happens once at ingest (build_normalize_command).
+
+        Args:
+            request: DeliverableRequest describing the segment and burn-in settings.
+            output_dir: Directory to write both outputs into.
+            crf: H.264 CRF for the trimmed clip. The report clip uses request.crf.
+
+        Returns:
+            (clip_path, report_path), each None if FFmpeg failed.
+        """
+        clip, report, cmd = self._both_command(request, output_dir, crf)
+        if clip.exists() and report.exists():
+            return clip, report
+
+        with _output_lock(clip), _output_lock(report):
+            if clip.exists() and report.exists():
+                return clip, report
+            returncode, error = self._run_ffmpeg(cmd)
+            return (
+                self._publish(clip, returncode, error),
+                self._publish(report, returncode, error),
             )
 
-        if request.burn_filename:
-            filters.append(
-                f"drawtext=text='{source_label}'"
-                f":fontsize=18:fontcolor=white@0.7:borderw=1:bordercolor=black"
-                f":x=10:y=10"
+    async def export_both_async(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+        crf: int = 18,
+    ) -> tuple[Path | None, Path | None]:
+        """Async variant of export_both() that does not block the event loop.
+
+        Args:
+            request: DeliverableRequest describing the segment and burn-in settings.
+            output_dir: Directory to write both outputs into.
+            crf: H.264 CRF for the trimmed clip. The report clip uses request.crf.
+
+        Returns:
+            (clip_path, report_path), each None if FFmpeg failed.
+        """
+        clip, report, cmd = self._both_command(request, output_dir, crf)
+        if clip.exists() and report.exists():
+            return clip, report
+
+        async with _output_lock_async(clip), _output_lock_async(report):
+            if clip.exists() and report.exists():
+                return clip, report
+            returncode, error = await self._run_ffmpeg_async(cmd)
+            return (
+                self._publish(clip, returncode, error),
+                self._publish(report, returncode, error),
             )
 
-        vf = ",".join(filters)
+    async def export_many(
+        self,
+        requests: Iterable[DeliverableRequest],
+        output_dir: Path,
+        report_ready: bool = True,
+        concurrency: int | None = None,
+    ) -> list[Path | None]:
+        """Export a batch of segments with at most `concurrency` FFmpeg processes.
 
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-y",
-            "-ss",
-            str(request.start_time),
-            "-i",
-            str(source),
-            "-t",
-            str(request.duration),
-            "-vf",
-            vf,
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-preset",
-            "veryfast",
-            "-crf",
-            str(request.crf),
-            "-fps_mode",
-            "cfr",
-            "-r",
-            "30",
-        ]
+        Wall time drops from the sum of all exports to roughly
+        ceil(N / concurrency) exports, since each libx264 process alone does
+        not saturate a multi-core worker.
 
-        if request.has_audio:
-            cmd.extend(["-c:a", "aac", "-b:a", "192k"])
-        else:
-            cmd.extend(["-an"])
+        Args:
+            requests: Segments to export.
+            output_dir: Directory to write all outputs into.
+            report_ready: If True, create report-ready clips; otherwise trims.
+            concurrency: Maximum simultaneous FFmpeg processes. Defaults to
+                half the CPU count, leaving headroom for libx264's own threads.
 
-        cmd.extend(["-movflags", "+faststart", str(output)])
-        subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        Returns:
+            Output paths (None for failures) in the same order as requests.
+        """
+        limit = concurrency or max(1, (os.cpu_count() or 2) // 2)
+        semaphore = asyncio.Semaphore(limit)
 
-        if output.exists():
-            return output
-        return None
+        async def _export(request: DeliverableRequest) -> Path | None:
+            async with semaphore:
+                if report_ready:
+                    return await self.export_report_ready_async(request, output_dir)
+                return await self.trim_segment_async(request, output_dir)
+
+        return list(await asyncio.gather(*(_export(r) for r in requests)))
 
     @staticmethod
     def build_export_filename(
@@ -213,7 +426,7 @@ class DeliverableExporter:
     ) -> str:
         """Build a standardized export filename.
 
-        Format: ``<source>__seg###__<MM:SS>-<MM:SS>__<suffix>.mp4``
+        Format: ``<source>__seg###__<MMmSSsmmm>-<MMmSSsmmm>__<suffix>.mp4``
 
         This convention is shared with Skyforge so files produced by either
         system are immediately identifiable by name.
@@ -233,6 +446,294 @@ class DeliverableExporter:
         end_str = _time_str(end)
         return f"{clean_source}__seg{segment_id:03d}__{start_str}-{end_str}__{suffix}.mp4"
 
+    def _trim_command(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+        crf: int,
+    ) -> tuple[Path, list[str]]:
+        """Return the trim output path and the FFmpeg command that writes it."""
+        output = self._output_path(request, output_dir, "clip")
+
+        if request.keyframe_aligned:
+            cmd = [
+                *_FFMPEG_HEAD,
+                "-ss", str(request.start_time), "-i", request.source_path,
+                "-t", str(request.duration),
+                "-c", "copy", "-avoid_negative_ts", "make_zero",
+                *(() if request.has_audio else _NO_AUDIO),
+                *_MP4_STAGING_TAIL, str(_staging_path(output)),
+            ]
+        else:
+            cmd = [
+                *_FFMPEG_HEAD, *self._decode_args(),
+                "-ss", str(request.start_time), "-i", request.source_path,
+                "-t", str(request.duration),
+                *self._encoder_args(crf), *_CFR_30,
+                *(_AAC_256 if request.has_audio else _NO_AUDIO),
+                *self._thread_args(),
+                *_MP4_STAGING_TAIL, str(_staging_path(output)),
+            ]
+        return output, cmd
+
+    def _report_command(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+    ) -> tuple[Path, list[str]]:
+        """Return the report-ready output path and the FFmpeg command that writes it."""
+        output = self._output_path(request, output_dir, "report")
+        extra_inputs, graph = self._report_graph(request)
+
+        if extra_inputs:
+            video_args: tuple[str, ...] = (
+                "-filter_complex", graph, "-map", "[report]",
+                *(("-map", "0:a:0?") if request.has_audio else ()),
+            )
+        else:
+            video_args = ("-vf", graph)
+
+        cmd = [
+            *_FFMPEG_HEAD, *self._decode_args(),
+            "-ss", str(request.start_time), "-i", request.source_path,
+            *extra_inputs,
+            "-t", str(request.duration),
+            *video_args,
+            *self._encoder_args(request.crf), *_CFR_30,
+            *(_AAC_192 if request.has_audio else _NO_AUDIO),
+            *self._thread_args(),
+            *_MP4_STAGING_TAIL, str(_staging_path(output)),
+        ]
+        return output, cmd
+
+    def _both_command(
+        self,
+        request: DeliverableRequest,
+        output_dir: Path,
+        crf: int,
+    ) -> tuple[Path, Path, list[str]]:
+        """Return clip and report paths and one FFmpeg command writing both.
+
+        The segment is demuxed and decoded once; split feeds the same frames
+        to the clip encoder and to the report scale/burn-in chain. A
+        keyframe-aligned clip is stream-copied straight from the input.
+        """
+        clip = self._output_path(request, output_dir, "clip")
+        report = self._output_path(request, output_dir, "report")
+        if request.keyframe_aligned:
+            extra_inputs, graph = self._report_graph(request, "[0:v]", "[report]")
+            clip_video: tuple[str, ...] = ("-map", "0:v:0")
+            clip_codec: tuple[str, ...] = ("-c", "copy", "-avoid_negative_ts", "make_zero")
+        else:
+            extra_inputs, rv_graph = self._report_graph(request, "[rv]", "[report]")
+            graph = f"[0:v]split=2[clip][rv];{rv_graph}"
+            clip_video = ("-map", "[clip]")
+            clip_codec = (
+                *self._encoder_args(crf), *_CFR_30,
+                *(_AAC_256 if request.has_audio else ()),
+                *self._thread_args(),
+            )
+        audio_map = ("-map", "0:a:0?") if request.has_audio else _NO_AUDIO
+
+        cmd = [
+            *_FFMPEG_HEAD, *self._decode_args(),
+            # Input-side -t bounds the decode for both outputs
+            "-ss", str(request.start_time), "-t", str(request.duration),
+            "-i", request.source_path,
+            *extra_inputs,
+            "-filter_complex", graph,
+            *clip_video, *audio_map, *clip_codec,
+            *_MP4_STAGING_TAIL, str(_staging_path(clip)),
+            "-map", "[report]", *audio_map,
+            *self._encoder_args(request.crf), *_CFR_30,
+            *(_AAC_192 if request.has_audio else ()),
+            *self._thread_args(),
+            *_MP4_STAGING_TAIL, str(_staging_path(report)),
+        ]
+        return clip, report, cmd
+
+    def _output_path(self, request: DeliverableRequest, output_dir: Path, suffix: str) -> Path:
+        """Return the export path for a request, creating output_dir if needed."""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        filename = self.build_export_filename(
+            source_name=_source_stem(request.source_path),
+            segment_id=int(request.segment_id) if request.segment_id.isdigit() else 0,
+            start=request.start_time,
+            end=request.end_time,
+            suffix=suffix,
+        )
+        return output_dir / filename
+
+    def _report_graph(
+        self,
+        request: DeliverableRequest,
+        src: str = "",
+        out: str = "",
+    ) -> tuple[tuple[str, ...], str]:
+        """Build the report-ready scale + burn-in filter graph.
+
+        Args:
+            request: DeliverableRequest with burn-in settings.
+            src: Input pad label for the source video (e.g. "[0:v]").
+            out: Output pad label for the finished report video.
+
+        Returns:
+            (extra_inputs, graph). extra_inputs is empty for a plain filter
+            chain usable with -vf; with the sprite timecode it holds the
+            sprite "-i" arguments (input 1) and graph needs -filter_complex.
+        """
+        source_label = request.source_label or _source_stem(request.source_path).replace(
+            "_norm", ""
+        )
+        scale = f"scale={request.target_width}:-2"
+        upload = ""
+        if self._hw is not None:
+            scale = self._hw.scale.format(f"{request.target_width}:-2")
+            if request.burn_timecode or request.burn_filename:
+                scale += self._hw.download
+                upload = self._hw.upload
+
+        filename_text = ""
+        if request.burn_filename:
+            filename_text = (
+                f"drawtext=text={_escape_drawtext(source_label)}"
+                f"{self._drawtext_options(source_label.isascii())}"
+                f":fontsize=18:fontcolor=white@0.7:borderw=1:bordercolor=black"
+                f":x=10:y=10"
+            )
+
+        sprite = None
+        if request.burn_timecode and self.timecode_overlay == "sprite":
+            sprite = _timecode_sprite()
+
+        if sprite is not None:
+            tc_offset = request.start_time
+            crop_y = f"mod(trunc(t+{tc_offset}),{_TC_SPRITE_LABELS})*{_TC_CELL_HEIGHT}"
+            graph = (
+                f"[1:v]loop=loop=-1:size=1,setpts=N/30/TB,"
+                f"crop=w={_TC_CELL_WIDTH}:h={_TC_CELL_HEIGHT}:x=0:y='{crop_y}'[tc];"
+                f"{src or '[0:v]'}{scale}[rbase];"
+                f"[rbase][tc]overlay=x=10:y=main_h-40:shortest=1"
+                f"{',' + filename_text if filename_text else ''}"
+                f"{upload}{out or '[report]'}"
+            )
+            return ("-i", str(sprite)), graph
+
+        filters: list[str] = [scale]
+
+        if request.burn_timecode:
+            tc_offset = request.start_time
+            filters.append(
+                f"drawtext=text='%{{pts\\:hms\\:{tc_offset}}}'"
+                f"{self._drawtext_options(True)}"
+                f":fontsize=24:fontcolor=white:borderw=2:bordercolor=black"
+                f":x=10:y=h-40"
+            )
+
+        if filename_text:
+            filters.append(filename_text)
+
+        return (), f"{src}{','.join(filters)}{upload}{out}"
+
+    def _drawtext_options(self, ascii_text: bool) -> str:
+        """Return the fontfile/text_shaping options appended to each drawtext."""
+        options = ""
+        if self.fontfile is not None:
+            options += f":fontfile={_escape_filter_value(os.fspath(self.fontfile))}"
+        if not self.text_shaping and ascii_text:
+            options += ":text_shaping=0"
+        return options
+
+    def _run_ffmpeg(self, cmd: list[str]) -> tuple[int, str | None]:
+        """Run FFmpeg to completion with output routed away from Python memory.
+
+        Returns:
+            The FFmpeg exit code and, if it failed, its error (see _error_for()).
+        """
+        result = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr_target(),
+            timeout=_FFMPEG_TIMEOUT,
+            check=False,
+        )
+        return result.returncode, self._error_for(result.returncode)
+
+    async def _run_ffmpeg_async(self, cmd: list[str]) -> tuple[int | None, str | None]:
+        """Run FFmpeg without blocking the event loop; kill it on timeout or cancel.
+
+        A cancelled export must not leave FFmpeg writing the staging file
+        after the output lock is released.
+
+        Returns:
+            The FFmpeg exit code (None if it timed out) and, if it failed, its error.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=self._stderr_target(),
+        )
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=_FFMPEG_TIMEOUT)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None, f"ffmpeg timed out after {_FFMPEG_TIMEOUT}s"
+        except asyncio.CancelledError:
+            proc.kill()
+            raise
+        return proc.returncode, self._error_for(proc.returncode)
+
+    def _stderr_target(self) -> BinaryIO | int:
+        """Return the open log file for FFmpeg's stderr, or DEVNULL."""
+        if self.log_dir is None:
+            return subprocess.DEVNULL
+        if self._log_fh is None:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            # Readable as well, so _error_for() can pread the tail
+            self._log_fh = open(  # noqa: SIM115 - held open for the worker's lifetime
+                self.log_dir / f"ffmpeg-{os.getpid()}.log", "a+b", buffering=0
+            )
+        return self._log_fh
+
+    def _error_for(self, returncode: int) -> str | None:
+        """Return the log tail (or exit status) when FFmpeg failed, else None."""
+        if returncode == 0:
+            return None
+        if self._log_fh is None:
+            return f"ffmpeg exited with status {returncode}"
+        fd = self._log_fh.fileno()
+        size = os.fstat(fd).st_size
+        offset = max(0, size - _LOG_TAIL_BYTES)
+        return os.pread(fd, size - offset, offset).decode("utf-8", "replace")
+
+    def _publish(self, output: Path, returncode: int | None, error: str | None) -> Path | None:
+        """Publish an export's staging file and record or clear its error."""
+        published = _publish_staging(output, returncode)
+        if published is None:
+            self.errors[output] = error or "ffmpeg wrote no output"
+        else:
+            self.errors.pop(output, None)
+        return published
+
+    def _decode_args(self) -> tuple[str, ...]:
+        """Return the hardware decode flags that go before -i (empty in software)."""
+        return self._hw.decode if self._hw is not None else ()
+
+    def _encoder_args(self, crf: int) -> tuple[str, ...]:
+        """Return the video encoder and its constant-quality setting."""
+        if self._hw is not None:
+            return (*self._hw.encoder, self._hw.quality, str(crf))
+        return (*_H264_BASE, "-crf", str(crf))
+
+    def _thread_args(self) -> tuple[str, ...]:
+        """Return the -threads option when a per-process thread cap is configured."""
+        if self.threads is None:
+            return ()
+        return ("-threads", str(self.threads))
+
 
 # ============================================================================
 # Internal helpers
@@ -240,7 +741,190 @@ class DeliverableExporter:
 
 
 def _time_str(seconds: float) -> str:
-    """Format seconds as MM:SS suitable for filenames (e.g. 01m30s)."""
-    m = int(seconds // 60)
-    s = int(seconds % 60)
-    return f"{m:02d}m{s:02d}s"
+    """Format seconds as MMmSSsmmm for filenames (e.g. 01m30s250).
+
+    Milliseconds keep segments that start within the same second from
+    sharing a filename (and skipping each other's export as "done").
+    """
+    m, ms = divmod(round(seconds * 1000), 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{m:02d}m{s:02d}s{ms:03d}"
+
+
+def _escape_filter_value(value: str) -> str:
+    """Quote a literal option value for use inside an FFmpeg filtergraph.
+
+    Backslash-escapes the option-level specials (\\ ' :), then single-quotes
+    the result for the filtergraph parser, which would otherwise split on
+    , ; [ ].
+    """
+    value = value.replace("\\", "\\\\").replace("'", "\\'").replace(":", "\\:")
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def _escape_drawtext(text: str) -> str:
+    """Escape literal text for drawtext's text= option inside a filtergraph.
+
+    drawtext expands %{...} sequences and backslash escapes in its text, so
+    those are escaped first; the result is then quoted like any option value.
+    """
+    return _escape_filter_value(text.replace("\\", "\\\\").replace("%", "\\%"))
+
+
+@lru_cache(maxsize=1024)
+def _source_stem(source_path: str) -> str:
+    """Return the file stem of a source path, parsed once per distinct path.
+
+    A batch exports many segments of the same source, and each export needs
+    the stem for its filename and filename burn-in.
+    """
+    return Path(source_path).stem
+
+
+def _staging_path(output: Path) -> Path:
+    """Return the temporary path FFmpeg writes to before the atomic rename."""
+    return output.with_name(output.name + ".part")
+
+
+def _publish_staging(output: Path, returncode: int | None) -> Path | None:
+    """Atomically move a successful staging file into place; discard failures."""
+    staging = _staging_path(output)
+    if returncode == 0 and staging.exists():
+        os.replace(staging, output)
+        return output
+    staging.unlink(missing_ok=True)
+    return None
+
+
+def _lock_path(output: Path) -> Path:
+    """Return the ".lock" sidecar that serializes exports of an output."""
+    return output.with_name(output.name + ".lock")
+
+
+def _is_current_lock(fd: int, output: Path) -> bool:
+    """Return True if fd is still the lock file at output's lock path.
+
+    A holder unlinks the lock file before releasing it, so a waiter that
+    then gets the flock holds a stale file and must open the path again.
+    """
+    try:
+        current = os.stat(_lock_path(output))
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fd)
+    return (held.st_dev, held.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _acquire_lock(output: Path) -> int:
+    """Block until this process holds the exclusive lock for an output path."""
+    while True:
+        fd = os.open(_lock_path(output), os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        if _is_current_lock(fd, output):
+            return fd
+        os.close(fd)
+
+
+async def _acquire_lock_async(output: Path) -> int:
+    """Async _acquire_lock(): polls a non-blocking flock from the event loop.
+
+    Unlike a blocking flock in a worker thread, cancellation can't leave a
+    lock taken by a thread nobody waits for: the descriptor is closed and
+    the lock never acquired.
+    """
+    while True:
+        fd = os.open(_lock_path(output), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(_LOCK_POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+        if _is_current_lock(fd, output):
+            return fd
+        os.close(fd)
+
+
+def _release_lock(fd: int, output: Path) -> None:
+    """Remove the lock file, then release and close a lock taken by _acquire_lock().
+
+    Unlinking while still holding the lock means no ".lock" sidecars pile up
+    next to the outputs, and no other holder can be using that file.
+    """
+    _lock_path(output).unlink(missing_ok=True)
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+@contextmanager
+def _output_lock(output: Path) -> Iterator[None]:
+    """Serialize exports of the same output across processes and threads.
+
+    FFmpeg writes to a ".part" staging file that is renamed into place only on
+    success, so a finished output is never partial. The flock on a ".lock"
+    sidecar makes a second worker racing on the same segment wait, then find
+    the published output and return it instead of encoding it again. The
+    sidecar is removed when the lock is released.
+    """
+    fd = _acquire_lock(output)
+    try:
+        yield
+    finally:
+        _release_lock(fd, output)
+
+
+@asynccontextmanager
+async def _output_lock_async(output: Path) -> AsyncIterator[None]:
+    """Async _output_lock(), safe to cancel while waiting for the lock."""
+    fd = await _acquire_lock_async(output)
+    try:
+        yield
+    finally:
+        _release_lock(fd, output)
+
+
+@lru_cache(maxsize=1)
+def _timecode_sprite() -> Path | None:
+    """Render (once per host) the MM:SS label strip used by the sprite overlay.
+
+    Returns:
+        Path to the sprite PNG in the temp directory, or None if Pillow is not
+        installed (callers fall back to drawtext).
+    """
+    sprite_path = Path(tempfile.gettempdir()) / "flightdeck_tc_sprite.png"
+    if sprite_path.exists():
+        return sprite_path
+
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        return None
+
+    try:
+        font = ImageFont.truetype("DejaVuSans-Bold.ttf", 24)
+    except OSError:
+        font = ImageFont.load_default()
+
+    sprite = Image.new("RGBA", (_TC_CELL_WIDTH, _TC_CELL_HEIGHT * _TC_SPRITE_LABELS))
+    draw = ImageDraw.Draw(sprite)
+    for second in range(_TC_SPRITE_LABELS):
+        m, s = divmod(second, 60)
+        draw.text(
+            (2, second * _TC_CELL_HEIGHT + 2),
+            f"{m:02d}:{s:02d}",
+            font=font,
+            fill="white",
+            stroke_width=2,
+            stroke_fill="black",
+        )
+
+    # Write under a per-process name and rename, so concurrent workers never
+    # read a half-written sprite
+    staging = sprite_path.with_name(f"{sprite_path.stem}.{os.getpid()}.png")
+    sprite.save(staging, "PNG")
+    os.replace(staging, sprite_path)
+    return sprite_path
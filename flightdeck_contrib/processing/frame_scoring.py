@@ -0,0 +1,178 @@
+"""Frame scoring — the per-frame quality score shared by analysis and selection.
+
+Ported from Skyforge's core/selector.py for FlightDeck integration.
+Place in FlightDeck at: processing/src/frame_scoring.py
+
+QualityAnalyzer (score_frame/score_frames) and SegmentScorer (select_segments)
+both score frames through this module, so scoring weights are tuned in one place.
+score_frame() scores a single frame with its reason tags; score_frames() and
+tag_frames() compute the same scores and tags over whole per-frame arrays.
+
+Dependencies: numpy, flightdeck_contrib.schemas.quality
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from flightdeck_contrib.schemas.quality import FrameQualityMetrics
+
+# score_frame() tags in emission order; bit i of a tag_frames() mask is tag i
+FRAME_TAGS = (
+    "blurry",
+    "sharp",
+    "too_dark",
+    "dim",
+    "overexposed",
+    "low_contrast",
+    "good_motion",
+    "static",
+    "shaky",
+    "well_exposed",
+)
+
+
+def score_frame(
+    metrics: FrameQualityMetrics,
+    blur_threshold: float = 80.0,
+    dark_threshold: float = 40.0,
+) -> tuple[float, list[str]]:
+    """Score a single frame 0-1 and return descriptive reason tags.
+
+    Scoring algorithm ported exactly from Skyforge's selector.py:197-246.
+    Penalties are applied for blur, darkness, overexposure, and low contrast.
+    Bonuses reward moderate motion and good exposure.
+
+    Args:
+        metrics: Per-frame metrics from QualityAnalyzer.analyze_frames().
+        blur_threshold: Laplacian variance below this is considered blurry.
+        dark_threshold: Mean brightness below this is considered dark.
+
+    Returns:
+        Tuple of (score 0.0-1.0, list of string tags).
+    """
+    score = 1.0
+    tags: list[str] = []
+
+    # Penalize blur
+    if metrics.is_blurry:
+        score -= 0.5
+        tags.append("blurry")
+    elif metrics.blur_score > blur_threshold * 3:
+        tags.append("sharp")
+
+    # Penalize darkness
+    if metrics.is_dark:
+        score -= 0.6
+        tags.append("too_dark")
+    elif metrics.brightness < 60:
+        score -= 0.2
+        tags.append("dim")
+
+    # Penalize overexposure
+    if metrics.is_overexposed:
+        score -= 0.4
+        tags.append("overexposed")
+
+    # Low contrast (lens covered, fog, etc.)
+    if metrics.contrast < 15:
+        score -= 0.5
+        tags.append("low_contrast")
+
+    # Reward moderate motion (interesting content)
+    if 2.0 < metrics.motion_score < 20.0:
+        score += 0.1
+        tags.append("good_motion")
+    elif metrics.motion_score < 0.5:
+        tags.append("static")
+    elif metrics.motion_score > 30.0:
+        score -= 0.2
+        tags.append("shaky")
+
+    # Reward good exposure
+    if 80 < metrics.brightness < 180 and metrics.contrast > 30:
+        score += 0.1
+        tags.append("well_exposed")
+
+    return max(0.0, min(1.0, score)), tags
+
+
+def score_frames(
+    brightness: np.ndarray,
+    contrast: np.ndarray,
+    motion: np.ndarray,
+    is_dark: np.ndarray,
+    is_overexposed: np.ndarray,
+    is_blurry: np.ndarray,
+) -> np.ndarray:
+    """Vectorized score_frame() scores over per-frame metric arrays.
+
+    Applies the same weights in the same order as score_frame(); a skipped
+    branch subtracts or adds 0.0, so the float64 results match it exactly.
+    The thresholds only affect tags, so they are not needed here.
+
+    Args:
+        brightness, contrast, motion: Per-frame metric arrays.
+        is_dark, is_overexposed, is_blurry: Per-frame boolean flags.
+
+    Returns:
+        float64 scores clipped to 0.0-1.0.
+    """
+    score = np.ones(len(brightness), dtype=np.float64)
+    score -= 0.5 * is_blurry
+    score -= 0.6 * is_dark
+    score -= 0.2 * (~is_dark & (brightness < 60))
+    score -= 0.4 * is_overexposed
+    score -= 0.5 * (contrast < 15)
+    score += 0.1 * ((motion > 2.0) & (motion < 20.0))
+    score -= 0.2 * (motion > 30.0)
+    score += 0.1 * ((brightness > 80) & (brightness < 180) & (contrast > 30))
+    return np.clip(score, 0.0, 1.0, out=score)
+
+
+def tag_frames(
+    blur: np.ndarray,
+    brightness: np.ndarray,
+    contrast: np.ndarray,
+    motion: np.ndarray,
+    is_dark: np.ndarray,
+    is_overexposed: np.ndarray,
+    is_blurry: np.ndarray,
+    blur_threshold: float = 80.0,
+) -> np.ndarray:
+    """Vectorized score_frame() tags, as one bitmask per frame.
+
+    Bit i is set when the frame gets FRAME_TAGS[i]; expand a mask with
+    frame_tags() only for frames that need the list.
+
+    Args:
+        blur, brightness, contrast, motion: Per-frame metric arrays.
+        is_dark, is_overexposed, is_blurry: Per-frame boolean flags.
+        blur_threshold: Laplacian variance below this is considered blurry.
+
+    Returns:
+        uint16 tag bitmasks.
+    """
+    good_motion = (motion > 2.0) & (motion < 20.0)
+    static = ~good_motion & (motion < 0.5)
+    flags = (
+        is_blurry,
+        ~is_blurry & (blur > blur_threshold * 3),
+        is_dark,
+        ~is_dark & (brightness < 60),
+        is_overexposed,
+        contrast < 15,
+        good_motion,
+        static,
+        ~good_motion & ~static & (motion > 30.0),
+        (brightness > 80) & (brightness < 180) & (contrast > 30),
+    )
+    mask = np.zeros(len(blur), dtype=np.uint16)
+    for bit, flag in enumerate(flags):
+        mask |= flag.astype(np.uint16) << bit
+    return mask
+
+
+def frame_tags(mask: int) -> list[str]:
+    """Expand a tag_frames() bitmask into score_frame()'s tag list."""
+    return [tag for bit, tag in enumerate(FRAME_TAGS) if mask >> bit & 1]
@@ -7,19 +7,29 @@ This module runs synchronously. Wrap calls in asyncio.to_thread() when
 integrating with FlightDeck's async pipeline workers. FlightDeck workers
 should download the asset from S3 to a temp path before calling these functions.
 
-Dependencies: opencv-python-headless, numpy, scenedetect, ffmpeg (system binary)
+Dependencies: opencv-python-headless, numpy, scenedetect, ffmpeg (system binary);
+av (PyAV) optional for decoder="pyav"
 """
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import os
 import re
 import subprocess
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 import cv2
 import numpy as np
 
+from flightdeck_contrib.processing import frame_scoring
 from flightdeck_contrib.schemas.quality import (
     AudioAnalysisResult,
     AudioPeak,
@@ -29,6 +39,38 @@ from flightdeck_contrib.schemas.quality import (
     VideoQualityReport,
 )
 
+HwAccel = Literal["cuda", "vaapi", "videotoolbox"]
+FrameDecoder = Literal["opencv", "pyav"]
+
+# FFmpeg stderr patterns, each scanned over the whole log in one finditer pass.
+# _ffmpeg_events() keeps only the stderr lines containing one of the markers.
+_EVENT_MARKERS = ("silence_", "lavfi.scd.")
+_SILENCE_RE = re.compile(r"silence_(start|end):\s*([\d.]+)")
+_SCDET_RE = re.compile(r"lavfi\.scd\.time:\s*([\d.]+).*?lavfi\.scd\.score:\s*([\d.]+)")
+
+# Container probing is capped at 1 MB / 1 s for MP4-family files, whose moov
+# atom describes every stream; other containers keep FFmpeg's 5 MB / 5 s
+# defaults, which transport streams need to find late-starting streams.
+_PROBE_LIMITS = ("-analyzeduration", "1000000", "-probesize", "1000000")
+_PROBE_LIMITED_SUFFIXES = frozenset({".mp4", ".mov", ".m4v"})
+
+# Per-thread scratch images for _frame_stats (Laplacian, frame difference)
+_scratch = threading.local()
+
+# Per-frame fields aggregated into VideoQualityReport averages and ratios,
+# packed to 13 bytes per frame. The metrics are already rounded to 2
+# decimals, well within float32 precision; means accumulate in float64.
+_AGGREGATE_DTYPE = np.dtype(
+    [
+        ("blur", np.float32),
+        ("brightness", np.float32),
+        ("motion", np.float32),
+        ("flags", np.uint8),
+    ]
+)
+_AGG_DARK = 1
+_AGG_BLURRY = 2
+
 
 class QualityAnalyzer:
     """Analyzes video assets for frame quality, scene structure, and audio.
@@ -44,8 +86,42 @@ class QualityAnalyzer:
                 QualityAnalyzer().analyze_video, tmp, tmp.parent / "analysis"
             )
             return report
+
+    On GPU workers, pass hwaccel to decode on the GPU. OpenCV picks its
+    hardware backend itself (any available); the FFmpeg contact sheet and
+    scene passes use -hwaccel with frames returned to system memory, so the
+    CPU filters are unchanged. Audio-only passes never decode video.
+
+    With decoder="pyav", analyze_frames decodes through PyAV with libav's
+    frame+slice threading enabled, instead of OpenCV's single-threaded
+    VideoCapture read path. Falls back to OpenCV if PyAV is not installed.
+
+    With opencl=True, analyze_frames uploads each sampled frame once and keeps
+    the gray image, Laplacian and frame difference on the OpenCL device.
+
+    Args:
+        hwaccel: "cuda", "vaapi" or "videotoolbox" to enable hardware
+            decode, or None (default) for software decode. Applies to the
+            OpenCV decoder and the FFmpeg passes.
+        decoder: Frame decoder for analyze_frames, "opencv" (default) or
+            "pyav".
+        opencl: Run analyze_frames' gray conversion, resize and metrics on
+            cv2.UMat (OpenCV T-API), which OpenCV dispatches to OpenCL on a
+            GPU or iGPU. Ignored if OpenCV has no OpenCL device.
     """
 
+    def __init__(
+        self,
+        hwaccel: HwAccel | None = None,
+        decoder: FrameDecoder = "opencv",
+        opencl: bool = False,
+    ) -> None:
+        self.hwaccel = hwaccel
+        self.decoder = decoder
+        self.opencl = opencl and cv2.ocl.haveOpenCL()
+        if self.opencl:
+            cv2.ocl.setUseOpenCL(True)
+
     def analyze_frames(
         self,
         video_path: Path,
@@ -53,10 +129,18 @@ class QualityAnalyzer:
         blur_threshold: float = 80.0,
         dark_threshold: float = 40.0,
         bright_threshold: float = 230.0,
+        max_analysis_dim: int | None = None,
+        workers: int | None = None,
+        early_exit: bool = False,
     ) -> list[FrameQualityMetrics]:
         """Sample frames from a video and compute per-frame quality metrics.
 
-        Uses OpenCV to read frames at ``sample_interval`` second intervals.
+        Reads frames at ``sample_interval`` second intervals with the
+        configured decoder. The stream is decoded sequentially and only
+        sampled frames are converted to BGR, so there is no per-sample seek
+        and no re-decode from the previous keyframe.
+        Decoding stays on the calling thread; per-frame metrics run on a
+        thread pool and are collected in frame order.
         Computes Laplacian variance for sharpness, mean pixel intensity for
         brightness, standard deviation for contrast, and frame-diff for motion.
 
@@ -66,90 +150,123 @@ class QualityAnalyzer:
             blur_threshold: Laplacian variance below this is flagged as blurry.
             dark_threshold: Mean brightness below this is flagged as dark.
             bright_threshold: Mean brightness above this is flagged as overexposed.
+            max_analysis_dim: If set, gray frames whose long side exceeds this
+                are downscaled (INTER_AREA) before computing metrics, e.g. 480
+                cuts a 4K frame's pixels ~64x. Brightness, contrast and motion
+                are nearly resolution-independent; the Laplacian variance is
+                multiplied by scale**2 to stay comparable with blur_threshold,
+                which is an approximation. None (default) analyzes full frames.
+            workers: Threads computing frame metrics while this thread keeps
+                decoding. OpenCV releases the GIL, so this scales with cores.
+                Defaults to os.cpu_count(). Unused with opencl=True.
+            early_exit: Skip the Laplacian on frames where it is wasted work:
+                frames darker than dark_threshold / 2 get a blur score of 0,
+                and frames whose mean difference from the previous sample is
+                below 0.1 (static shots, frozen frames) reuse its blur score.
+                Applies to the CPU path; off by default.
 
         Returns:
             List of FrameQualityMetrics, one per sampled frame.
         """
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
-            return []
+        workers = workers or os.cpu_count() or 1
+        dark_cutoff = dark_threshold * 0.5 if early_exit else -1.0
+        static_cutoff = 0.1 if early_exit else -1.0
+        # (timestamp, blur, brightness, contrast, motion) per sampled frame
+        rows: list[tuple[float, ...]] = []
+        # Frames in flight, oldest first; bounded so decode can't run ahead
+        # of the metric workers and hold every sampled frame in memory
+        pending: deque[tuple[float, Future[tuple[float, ...]]]] = deque()
+        prev_gray = None
+        # Gray frames are written into a ring of reused buffers instead of a
+        # fresh allocation per sample. A slot is only rewritten once every job
+        # reading it (as gray or prev_gray) has been collected: at most
+        # 2 * workers jobs are in flight, so 2 * workers + 2 slots suffice.
+        ring: list[np.ndarray | None] = [None] * (2 * workers + 2)
+        full_gray: np.ndarray | None = None
+        sample_idx = 0
+
+        if self.opencl:
+            # T-API path: pixels stay on the OpenCL device and only the
+            # scalar stats come back, so metrics run inline on this thread
+            rows = self._umat_rows(video_path, sample_interval, max_analysis_dim)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for timestamp, frame in self._sampled_frames(video_path, sample_interval):
+                    slot = sample_idx % len(ring)
+                    sample_idx += 1
+                    height, width = frame.shape[:2]
+
+                    scale = 1.0
+                    if max_analysis_dim and max(height, width) > max_analysis_dim:
+                        scale = max_analysis_dim / max(height, width)
+                        full_gray = _reuse_buffer(full_gray, (height, width), np.uint8)
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=full_gray)
+                        size = (round(width * scale), round(height * scale))
+                        gray = ring[slot] = _reuse_buffer(ring[slot], (size[1], size[0]), np.uint8)
+                        cv2.resize(full_gray, size, dst=gray, interpolation=cv2.INTER_AREA)
+                    else:
+                        gray = ring[slot] = _reuse_buffer(ring[slot], (height, width), np.uint8)
+                        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+                    job = pool.submit(
+                        _frame_stats, gray, prev_gray, scale, dark_cutoff, static_cutoff
+                    )
+                    pending.append((timestamp, job))
+                    prev_gray = gray
 
-        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-        frame_interval = int(fps * sample_interval)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                    if len(pending) >= 2 * workers:
+                        timestamp, stats = pending.popleft()
+                        rows.append((timestamp, *stats.result()))
 
-        analyses: list[FrameQualityMetrics] = []
-        prev_gray = None
-        frame_idx = 0
-
-        while frame_idx < total_frames:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            timestamp = frame_idx / fps
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-            # Blur detection (Laplacian variance — higher = sharper)
-            blur_score = float(cv2.Laplacian(gray, cv2.CV_64F).var())
-
-            # Brightness
-            brightness = float(np.mean(gray))
-
-            # Contrast (std dev of intensity)
-            contrast = float(np.std(gray))
-
-            # Motion (frame difference)
-            motion_score = 0.0
-            if prev_gray is not None:
-                diff = cv2.absdiff(prev_gray, gray)
-                motion_score = float(np.mean(diff))
-
-            is_dark = bool(brightness < dark_threshold)
-            is_overexposed = bool(brightness > bright_threshold)
-            is_blurry = bool(blur_score < blur_threshold)
-
-            quality_score, _ = self.score_frame(
-                FrameQualityMetrics(
-                    timestamp=timestamp,
-                    blur_score=blur_score,
-                    brightness=brightness,
-                    contrast=contrast,
-                    motion_score=motion_score,
-                    is_dark=is_dark,
-                    is_overexposed=is_overexposed,
-                    is_blurry=is_blurry,
-                    quality_score=0.0,
-                ),
-                blur_threshold=blur_threshold,
-                dark_threshold=dark_threshold,
-            )
+                while pending:
+                    timestamp, stats = pending.popleft()
+                    rows.append((timestamp, *stats.result()))
 
-            analyses.append(
-                FrameQualityMetrics(
-                    timestamp=timestamp,
-                    blur_score=round(blur_score, 2),
-                    brightness=round(brightness, 2),
-                    contrast=round(contrast, 2),
-                    motion_score=round(motion_score, 2),
-                    is_dark=is_dark,
-                    is_overexposed=is_overexposed,
-                    is_blurry=is_blurry,
-                    quality_score=round(quality_score, 3),
-                )
-            )
+        if not rows:
+            return []
 
-            prev_gray = gray
-            frame_idx += frame_interval
+        # Flag and score every frame in one vectorized pass
+        _timestamps, blur, brightness, contrast, motion = np.array(rows, dtype=np.float64).T
+        if early_exit:
+            # Static frames carry NaN blur; forward-fill from the previous
+            # sample (the first sample never has a predecessor to match)
+            last = np.where(np.isnan(blur), 0, np.arange(len(blur)))
+            blur = blur[np.maximum.accumulate(last)]
+        is_dark = brightness < dark_threshold
+        is_overexposed = brightness > bright_threshold
+        is_blurry = blur < blur_threshold
+        scores = frame_scoring.score_frames(
+            brightness, contrast, motion, is_dark, is_overexposed, is_blurry
+        )
 
-        cap.release()
-        return analyses
+        return [
+            FrameQualityMetrics(
+                timestamp=row[0],
+                blur_score=round(blur_score, 2),
+                brightness=round(row[2], 2),
+                contrast=round(row[3], 2),
+                motion_score=round(row[4], 2),
+                is_dark=dark,
+                is_overexposed=over,
+                is_blurry=blurry,
+                quality_score=round(score, 3),
+            )
+            for row, blur_score, dark, over, blurry, score in zip(
+                rows,
+                blur.tolist(),
+                is_dark.tolist(),
+                is_overexposed.tolist(),
+                is_blurry.tolist(),
+                scores.tolist(),
+                strict=True,
+            )
+        ]
 
     def detect_scene_changes(
         self,
         video_path: Path,
         threshold: float = 27.0,
+        frame_skip: int = 0,
     ) -> list[SceneChange]:
         """Detect scene changes using PySceneDetect with FFmpeg fallback.
 
@@ -160,6 +277,10 @@ class QualityAnalyzer:
             video_path: Local path to the video file.
             threshold: Detection sensitivity. Higher = fewer cuts detected.
                 PySceneDetect uses 27.0 as default; FFmpeg scdet uses 0.3.
+            frame_skip: PySceneDetect only: frames skipped after each
+                processed frame (e.g. fps // 4). Cuts detection work
+                proportionally but cut timestamps are only accurate to
+                frame_skip + 1 frames. Default 0 processes every frame.
 
         Returns:
             List of SceneChange with timestamp and confidence score.
@@ -171,7 +292,9 @@ class QualityAnalyzer:
             video = open_video(str(video_path))
             scene_manager = SceneManager()
             scene_manager.add_detector(ContentDetector(threshold=threshold))
-            scene_manager.detect_scenes(video, show_progress=False)
+            # auto_downscale (the default) already shrinks frames to ~256px
+            # wide before the detector runs
+            scene_manager.detect_scenes(video, frame_skip=frame_skip, show_progress=False)
 
             scene_list = scene_manager.get_scene_list()
             changes = []
@@ -191,6 +314,8 @@ class QualityAnalyzer:
         self,
         video_path: Path,
         output_dir: Path,
+        duration: float | None = None,
+        has_audio: bool | None = None,
     ) -> AudioAnalysisResult:
         """Analyze audio track: detect silence regions, peaks, and generate waveform.
 
@@ -201,14 +326,19 @@ class QualityAnalyzer:
         Args:
             video_path: Local path to the video file.
             output_dir: Directory for the waveform image output.
+            duration: Asset duration in seconds, if already probed.
+            has_audio: Whether the asset has an audio stream, if already probed.
+                Missing values are read with a single ffprobe.
 
         Returns:
             AudioAnalysisResult with silence regions, peaks, and waveform path.
         """
-        result = AudioAnalysisResult()
-        result.has_audio = _has_audio(video_path)
-        if not result.has_audio:
-            return result
+        if duration is None or has_audio is None:
+            meta = _get_metadata(video_path)
+            duration = meta.duration if duration is None else duration
+            has_audio = meta.has_audio if has_audio is None else has_audio
+        if not has_audio:
+            return AudioAnalysisResult()
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -218,8 +348,10 @@ class QualityAnalyzer:
             "ffmpeg",
             "-hide_banner",
             "-y",
+            *_probe_args(video_path),
             "-i",
             str(video_path),
+            "-vn",
             "-filter_complex",
             "showwavespic=s=1200x200:colors=cyan",
             "-frames:v",
@@ -232,60 +364,17 @@ class QualityAnalyzer:
         silence_cmd = [
             "ffmpeg",
             "-hide_banner",
+            *_probe_args(video_path),
             "-i",
             str(video_path),
+            "-vn",
             "-af",
             "silencedetect=noise=-30dB:d=1",
             "-f",
             "null",
             "-",
         ]
-        silence_result = subprocess.run(
-            silence_cmd, capture_output=True, text=True, timeout=120
-        )
-
-        silence_starts: list[float] = []
-        silence_ends: list[float] = []
-        for line in silence_result.stderr.split("\n"):
-            if "silence_start:" in line:
-                m = re.search(r"silence_start:\s*([\d.]+)", line)
-                if m:
-                    silence_starts.append(float(m.group(1)))
-            elif "silence_end:" in line:
-                m = re.search(r"silence_end:\s*([\d.]+)", line)
-                if m:
-                    silence_ends.append(float(m.group(1)))
-
-        # Build SilenceRegion pairs
-        for i, start in enumerate(silence_starts):
-            end = silence_ends[i] if i < len(silence_ends) else start + 1.0
-            result.silence_regions.append(SilenceRegion(start=start, end=end))
-
-        # Derive audio peaks as midpoints of non-silent regions
-        duration = _get_duration(video_path)
-        if not silence_starts:
-            # No silence detected — audio throughout
-            result.audio_peaks.append(AudioPeak(timestamp=duration / 2, amplitude=0.8))
-        else:
-            prev_end = 0.0
-            for ss in silence_starts:
-                if ss > prev_end + 1.0:
-                    result.audio_peaks.append(
-                        AudioPeak(timestamp=(prev_end + ss) / 2, amplitude=0.7)
-                    )
-                prev_end = ss
-            for se in silence_ends:
-                prev_end = max(prev_end, se)
-            if duration > prev_end + 1.0:
-                result.audio_peaks.append(
-                    AudioPeak(timestamp=(prev_end + duration) / 2, amplitude=0.7)
-                )
-
-        # waveform_s3_path is populated by the caller after uploading to S3
-        if waveform_path.exists():
-            result.waveform_s3_path = str(waveform_path)
-
-        return result
+        return _audio_result(_ffmpeg_events(silence_cmd, timeout=120), duration, waveform_path)
 
     def extract_contact_sheet(
         self,
@@ -294,6 +383,8 @@ class QualityAnalyzer:
         cols: int = 5,
         interval: float = 5.0,
         thumb_width: int = 320,
+        duration: float | None = None,
+        keyframes_only: bool = False,
     ) -> Path | None:
         """Create a single montage image of keyframes using FFmpeg tile filter.
 
@@ -306,27 +397,46 @@ class QualityAnalyzer:
             cols: Number of columns in the tile grid.
             interval: Seconds between thumbnails.
             thumb_width: Width of each thumbnail in pixels.
+            duration: Asset duration in seconds, if already probed.
+            keyframes_only: Decode only keyframes (``-skip_frame nokey``) and
+                take the first keyframe at least ``interval`` seconds after
+                the previous thumbnail. Far less decode work on long assets,
+                but thumbnails snap to keyframes and the sheet has fewer
+                tiles when the GOP is longer than ``interval``.
 
         Returns:
             Path to the generated montage, or None on failure.
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        duration = _get_duration(video_path)
+        if duration is None:
+            duration = _get_metadata(video_path).duration
         if duration <= 0:
             return None
 
         total_frames = int(duration / interval) + 1
         rows = (total_frames + cols - 1) // cols
 
+        if keyframes_only:
+            # fps= would duplicate keyframes to fill the timeline; select
+            # keeps one per interval and tile flushes a short final row
+            skip_args = ["-skip_frame", "nokey"]
+            sampler = f"select='isnan(prev_selected_t)+gte(t-prev_selected_t,{interval})'"
+        else:
+            skip_args = []
+            sampler = f"fps=1/{interval}"
+
         cmd = [
             "ffmpeg",
             "-hide_banner",
             "-y",
+            *self._hwaccel_args(),
+            *skip_args,
+            *_probe_args(video_path),
             "-i",
             str(video_path),
             "-vf",
-            f"fps=1/{interval},scale={thumb_width}:-1,tile={cols}x{rows}",
+            f"{sampler},scale={thumb_width}:-1,tile={cols}x{rows}",
             "-frames:v",
             "1",
             "-q:v",
@@ -347,9 +457,10 @@ class QualityAnalyzer:
     ) -> tuple[float, list[str]]:
         """Score a single frame 0-1 and return descriptive reason tags.
 
-        Scoring algorithm ported exactly from Skyforge's selector.py:197-246.
-        Penalties are applied for blur, darkness, overexposure, and low contrast.
-        Bonuses reward moderate motion and good exposure.
+        Delegates to frame_scoring.score_frame(), the implementation
+        SegmentScorer also scores with. Penalties are applied for blur,
+        darkness, overexposure, and low contrast. Bonuses reward moderate
+        motion and good exposure.
 
         Args:
             metrics: Per-frame metrics from analyze_frames().
@@ -359,50 +470,55 @@ class QualityAnalyzer:
         Returns:
             Tuple of (score 0.0-1.0, list of string tags).
         """
-        score = 1.0
-        tags: list[str] = []
-
-        # Penalize blur
-        if metrics.is_blurry:
-            score -= 0.5
-            tags.append("blurry")
-        elif metrics.blur_score > blur_threshold * 3:
-            tags.append("sharp")
-
-        # Penalize darkness
-        if metrics.is_dark:
-            score -= 0.6
-            tags.append("too_dark")
-        elif metrics.brightness < 60:
-            score -= 0.2
-            tags.append("dim")
-
-        # Penalize overexposure
-        if metrics.is_overexposed:
-            score -= 0.4
-            tags.append("overexposed")
-
-        # Low contrast (lens covered, fog, etc.)
-        if metrics.contrast < 15:
-            score -= 0.5
-            tags.append("low_contrast")
-
-        # Reward moderate motion (interesting content)
-        if 2.0 < metrics.motion_score < 20.0:
-            score += 0.1
-            tags.append("good_motion")
-        elif metrics.motion_score < 0.5:
-            tags.append("static")
-        elif metrics.motion_score > 30.0:
-            score -= 0.2
-            tags.append("shaky")
-
-        # Reward good exposure
-        if 80 < metrics.brightness < 180 and metrics.contrast > 30:
-            score += 0.1
-            tags.append("well_exposed")
-
-        return max(0.0, min(1.0, score)), tags
+        return frame_scoring.score_frame(metrics, blur_threshold, dark_threshold)
+
+    @staticmethod
+    def score_frames(
+        blur: np.ndarray,
+        brightness: np.ndarray,
+        contrast: np.ndarray,
+        motion: np.ndarray,
+        is_dark: np.ndarray,
+        is_overexposed: np.ndarray,
+        is_blurry: np.ndarray,
+        blur_threshold: float = 80.0,
+        dark_threshold: float = 40.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized score_frame() over per-frame metric arrays.
+
+        Scores come from frame_scoring.score_frames() and match score_frame()
+        exactly. Tags are returned as a bitmask from frame_scoring.tag_frames()
+        (bit i set = frame_scoring.FRAME_TAGS[i]); expand one with
+        frame_tags() only for frames that need them.
+
+        Args:
+            blur, brightness, contrast, motion: Per-frame metric arrays.
+            is_dark, is_overexposed, is_blurry: Per-frame boolean flags.
+            blur_threshold: Laplacian variance below this is considered blurry.
+            dark_threshold: Mean brightness below this is considered dark.
+
+        Returns:
+            Tuple of (float64 scores clipped to 0.0-1.0, uint16 tag bitmasks).
+        """
+        scores = frame_scoring.score_frames(
+            brightness, contrast, motion, is_dark, is_overexposed, is_blurry
+        )
+        masks = frame_scoring.tag_frames(
+            blur,
+            brightness,
+            contrast,
+            motion,
+            is_dark,
+            is_overexposed,
+            is_blurry,
+            blur_threshold=blur_threshold,
+        )
+        return scores, masks
+
+    @staticmethod
+    def frame_tags(mask: int) -> list[str]:
+        """Expand a score_frames() tag bitmask into score_frame()'s tag list."""
+        return frame_scoring.frame_tags(mask)
 
     def analyze_video(
         self,
@@ -414,8 +530,11 @@ class QualityAnalyzer:
         """Run complete quality analysis on a single video file.
 
         Orchestrates scene detection, contact sheet extraction, audio analysis,
-        and frame-level analysis into a single VideoQualityReport. Writes an
-        analysis.json to output_dir for persistence.
+        and frame-level analysis into a single VideoQualityReport. The contact
+        sheet, waveform, silence detection and (without PySceneDetect) scdet
+        share a single FFmpeg decode of the file, which runs concurrently with
+        frame analysis and PySceneDetect. Writes an analysis.json to
+        output_dir for persistence.
 
         Args:
             video_path: Local path to the video file.
@@ -434,58 +553,85 @@ class QualityAnalyzer:
             source_file=str(video_path),
         )
 
-        # Basic metadata via ffprobe
-        meta = _get_metadata(video_path)
-        report.duration = meta.get("duration", 0.0)
-        report.width = meta.get("width", 0)
-        report.height = meta.get("height", 0)
-        report.fps = meta.get("fps", 0.0)
-        report.has_audio = meta.get("has_audio", False)
-        report.codec = meta.get("codec", "")
-
-        # Dump full ffprobe output for debugging
-        _dump_ffprobe(video_path, output_dir / "ffprobe.json")
-
-        # Scene change detection
-        report.scene_changes = self.detect_scene_changes(video_path)
-
-        # Contact sheet
-        self.extract_contact_sheet(
-            video_path,
-            output_dir / "contact_sheet.jpg",
-            interval=5.0,
-        )
-
-        # Audio analysis
-        report.audio_analysis = self.analyze_audio(video_path, output_dir)
+        # Basic metadata via ffprobe; the full probe JSON is dumped for debugging
+        meta = _get_metadata(video_path, dump_path=output_dir / "ffprobe.json")
+        report.duration = meta.duration
+        report.width = meta.width
+        report.height = meta.height
+        report.fps = meta.fps
+        report.has_audio = meta.has_audio
+        report.codec = meta.codec
+
+        # Scene change detection: PySceneDetect runs its own decode; the scdet
+        # fallback joins the fused FFmpeg pass below
+        try:
+            import scenedetect  # noqa: F401
 
-        # Frame-level analysis
-        report.frame_analyses = self.analyze_frames(
-            video_path, sample_interval=sample_interval
-        )
+            use_scdet = False
+        except ImportError:
+            use_scdet = True
 
-        # Compute aggregates
-        if report.frame_analyses:
-            n = len(report.frame_analyses)
-            report.avg_blur = round(
-                sum(f.blur_score for f in report.frame_analyses) / n, 2
-            )
-            report.avg_brightness = round(
-                sum(f.brightness for f in report.frame_analyses) / n, 2
+        # The independent passes run concurrently: FFmpeg runs in a subprocess
+        # and OpenCV releases the GIL, so wall time is the slowest pass
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            scenes_future = (
+                None if use_scdet else pool.submit(self.detect_scene_changes, video_path)
             )
-            report.avg_motion = round(
-                sum(f.motion_score for f in report.frame_analyses) / n, 2
+            # Contact sheet, waveform, silence (and scdet) from one FFmpeg decode
+            fused_future = pool.submit(
+                self._fused_pass,
+                video_path,
+                output_dir,
+                duration=report.duration,
+                has_audio=report.has_audio,
+                detect_scenes=use_scdet,
             )
-            report.dark_ratio = round(
-                sum(1 for f in report.frame_analyses if f.is_dark) / n, 3
-            )
-            report.blurry_ratio = round(
-                sum(1 for f in report.frame_analyses if f.is_blurry) / n, 3
+            # Frame-level analysis
+            frames_future = pool.submit(
+                self.analyze_frames, video_path, sample_interval=sample_interval
             )
 
-        # Persist analysis JSON
+            stderr = fused_future.result()
+            if scenes_future is not None:
+                report.scene_changes = scenes_future.result()
+            else:
+                report.scene_changes = _parse_scdet(stderr)
+
+            # Audio analysis
+            if report.has_audio:
+                report.audio_analysis = _audio_result(
+                    stderr, report.duration, output_dir / "waveform.png"
+                )
+
+            report.frame_analyses = frames_future.result()
+
+        # Compute aggregates in one structured-array pass
+        if report.frame_analyses:
+            n = len(report.frame_analyses)
+            stats = np.fromiter(
+                (
+                    (
+                        f.blur_score,
+                        f.brightness,
+                        f.motion_score,
+                        _AGG_DARK * f.is_dark | _AGG_BLURRY * f.is_blurry,
+                    )
+                    for f in report.frame_analyses
+                ),
+                dtype=_AGGREGATE_DTYPE,
+                count=n,
+            )
+            flags = stats["flags"]
+            report.avg_blur = round(float(stats["blur"].mean(dtype=np.float64)), 2)
+            report.avg_brightness = round(float(stats["brightness"].mean(dtype=np.float64)), 2)
+            report.avg_motion = round(float(stats["motion"].mean(dtype=np.float64)), 2)
+            report.dark_ratio = round(np.count_nonzero(flags & _AGG_DARK) / n, 3)
+            report.blurry_ratio = round(np.count_nonzero(flags & _AGG_BLURRY) / n, 3)
+
+        # Persist analysis JSON (pydantic-core serializes straight to JSON,
+        # skipping the intermediate dict and the pure-Python indent encoder)
         (output_dir / "analysis.json").write_text(
-            json.dumps(report.model_dump(), indent=2)
+            report.model_dump_json(indent=2), encoding="utf-8"
         )
 
         return report
@@ -494,6 +640,67 @@ class QualityAnalyzer:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _sampled_frames(
+        self, video_path: Path, sample_interval: float
+    ) -> Iterator[tuple[float, np.ndarray]]:
+        """Yield (timestamp, BGR frame) every ``sample_interval`` seconds."""
+        if self.decoder == "pyav" and importlib.util.find_spec("av") is not None:
+            yield from _pyav_frames(video_path, sample_interval)
+            return
+
+        if self.hwaccel:
+            cap = cv2.VideoCapture(
+                str(video_path),
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+        else:
+            cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            return
+
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            frame_interval = max(1, int(fps * sample_interval))
+            frame_idx = -1
+
+            # grab() every frame, retrieve() (BGR conversion) only sampled ones
+            while cap.grab():
+                frame_idx += 1
+                if frame_idx % frame_interval:
+                    continue
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                yield frame_idx / fps, frame
+        finally:
+            cap.release()
+
+    def _umat_rows(
+        self, video_path: Path, sample_interval: float, max_analysis_dim: int | None
+    ) -> list[tuple[float, ...]]:
+        """Compute (timestamp, blur, brightness, contrast, motion) rows on UMat."""
+        rows: list[tuple[float, ...]] = []
+        prev_gray = None
+        for timestamp, frame in self._sampled_frames(video_path, sample_interval):
+            gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
+
+            scale = 1.0
+            long_side = max(frame.shape[:2])
+            if max_analysis_dim and long_side > max_analysis_dim:
+                scale = max_analysis_dim / long_side
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+            rows.append((timestamp, *_frame_stats_umat(gray, prev_gray, scale)))
+            prev_gray = gray
+        return rows
+
+    def _hwaccel_args(self) -> list[str]:
+        """Return FFmpeg hardware decode flags (before -i), empty in software."""
+        if self.hwaccel is None:
+            return []
+        return ["-hwaccel", self.hwaccel]
+
     def _detect_scenes_ffmpeg(
         self, video_path: Path, threshold: float = 0.3
     ) -> list[SceneChange]:
@@ -501,6 +708,8 @@ class QualityAnalyzer:
         cmd = [
             "ffmpeg",
             "-hide_banner",
+            *self._hwaccel_args(),
+            *_probe_args(video_path),
             "-i",
             str(video_path),
             "-vf",
@@ -510,21 +719,65 @@ class QualityAnalyzer:
             "null",
             "-",
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        stderr = result.stderr
+        return _parse_scdet(_ffmpeg_events(cmd, timeout=300))
 
-        changes: list[SceneChange] = []
-        pattern = re.compile(
-            r"lavfi\.scd\.time:\s*([\d.]+).*?lavfi\.scd\.score:\s*([\d.]+)"
-        )
-        for match in pattern.finditer(stderr):
-            changes.append(
-                SceneChange(
-                    timestamp=float(match.group(1)),
-                    score=float(match.group(2)),
-                )
-            )
-        return changes
+    def _fused_pass(
+        self,
+        video_path: Path,
+        output_dir: Path,
+        duration: float,
+        has_audio: bool,
+        detect_scenes: bool,
+    ) -> str:
+        """Run contact sheet, waveform, silencedetect and scdet in one FFmpeg.
+
+        The file is demuxed and decoded once; split/asplit fan the frames out
+        to each analysis. Produces the same artifacts as extract_contact_sheet()
+        (5s interval) and analyze_audio(), and returns FFmpeg's filter event
+        lines for _audio_result() and _parse_scdet().
+        """
+        chains: list[str] = []
+        outputs: list[str] = []
+
+        video_branches: list[str] = []
+        if duration > 0:
+            cols, interval = 5, 5.0
+            rows = (int(duration / interval) + 1 + cols - 1) // cols
+            video_branches.append(f"fps=1/{interval},scale=320:-1,tile={cols}x{rows}[sheet]")
+            outputs += ["-map", "[sheet]", "-frames:v", "1", "-q:v", "3",
+                        str(output_dir / "contact_sheet.jpg")]
+        if detect_scenes:
+            video_branches.append("scdet=threshold=0.3:sc_pass=1,nullsink")
+
+        if len(video_branches) == 2:
+            chains.append("[0:v:0]split=2[vsheet][vscd]")
+            chains.append(f"[vsheet]{video_branches[0]}")
+            chains.append(f"[vscd]{video_branches[1]}")
+        elif video_branches:
+            chains.append(f"[0:v:0]{video_branches[0]}")
+
+        if has_audio:
+            chains.append("[0:a:0]asplit=2[awave][asil]")
+            chains.append("[awave]showwavespic=s=1200x200:colors=cyan[wave]")
+            chains.append("[asil]silencedetect=noise=-30dB:d=1,anullsink")
+            outputs += ["-map", "[wave]", "-frames:v", "1", str(output_dir / "waveform.png")]
+
+        if not outputs:
+            return ""
+
+        cmd = [
+            "ffmpeg",
+            "-hide_banner",
+            "-y",
+            *(self._hwaccel_args() if video_branches else []),
+            *_probe_args(video_path),
+            "-i",
+            str(video_path),
+            "-filter_complex",
+            ";".join(chains),
+            *outputs,
+        ]
+        return _ffmpeg_events(cmd, timeout=600)
 
 
 # ============================================================================
@@ -532,97 +785,260 @@ class QualityAnalyzer:
 # ============================================================================
 
 
-def _get_duration(video_path: Path) -> float:
-    """Return video duration in seconds via ffprobe."""
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=nw=1:nk=1",
-        str(video_path),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+def _pyav_frames(video_path: Path, sample_interval: float) -> Iterator[tuple[float, np.ndarray]]:
+    """Decode with PyAV (threaded), yielding sampled (timestamp, BGR frame).
+
+    Frames are converted to bgr24 so the gray conversion, and with it every
+    metric, matches the OpenCV path exactly.
+    """
+    import av
+
     try:
-        return float(result.stdout.strip())
-    except ValueError:
-        return 0.0
+        container = av.open(str(video_path))
+    except av.error.FFmpegError:
+        return
+
+    with container:
+        if not container.streams.video:
+            return
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"  # frame + slice threading
+        stream.codec_context.thread_count = 0  # one thread per core
+        fps = float(stream.average_rate or 30.0)
+        frame_interval = max(1, int(fps * sample_interval))
+
+        for frame_idx, frame in enumerate(container.decode(stream)):
+            if frame_idx % frame_interval == 0:
+                yield frame_idx / fps, frame.to_ndarray(format="bgr24")
+
+
+def _frame_stats(
+    gray: np.ndarray,
+    prev_gray: np.ndarray | None,
+    scale: float,
+    dark_cutoff: float = -1.0,
+    static_cutoff: float = -1.0,
+) -> tuple[float, float, float, float]:
+    """Return (blur, brightness, contrast, motion) for one gray frame.
+
+    scale is the downscale factor already applied to gray (1.0 for full
+    size); it normalizes the Laplacian variance back to full resolution.
+    Intermediate images go into per-thread scratch buffers.
+
+    The Laplacian is skipped for frames with brightness below dark_cutoff
+    (blur 0.0) and frames with motion below static_cutoff (blur NaN, to be
+    filled from the previous sample); the negative defaults disable both.
+    """
+    # Brightness and contrast (mean / std dev of intensity) in one pass
+    mean, std = cv2.meanStdDev(gray)
+    brightness = float(mean[0, 0])
+    contrast = float(std[0, 0])
+
+    # Motion (frame difference)
+    motion_score = 0.0
+    if prev_gray is not None and prev_gray.shape == gray.shape:
+        _scratch.diff = diff = _reuse_buffer(getattr(_scratch, "diff", None), gray.shape, np.uint8)
+        cv2.absdiff(prev_gray, gray, dst=diff)
+        motion_score = float(cv2.mean(diff)[0])
+        if motion_score < static_cutoff:
+            return float("nan"), brightness, contrast, motion_score
+
+    if brightness < dark_cutoff:
+        return 0.0, brightness, contrast, motion_score
+
+    # Blur detection (Laplacian variance — higher = sharper). The
+    # 3x3 Laplacian of uint8 fits int16, so skip the float64 image.
+    _scratch.lap = lap = _reuse_buffer(getattr(_scratch, "lap", None), gray.shape, np.int16)
+    cv2.Laplacian(gray, cv2.CV_16S, dst=lap)
+    _, lap_std = cv2.meanStdDev(lap)
+    blur_score = float(lap_std[0, 0]) ** 2 * scale**2
+
+    return blur_score, brightness, contrast, motion_score
+
+
+def _frame_stats_umat(
+    gray: cv2.UMat, prev_gray: cv2.UMat | None, scale: float
+) -> tuple[float, float, float, float]:
+    """_frame_stats for OpenCL-resident frames; only the scalars are read back."""
+    _, lap_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    blur_score = float(lap_std[0, 0]) ** 2 * scale**2
+
+    mean, std = cv2.meanStdDev(gray)
+    brightness = float(mean[0, 0])
+    contrast = float(std[0, 0])
+
+    motion_score = 0.0
+    if prev_gray is not None:
+        motion_score = float(cv2.mean(cv2.absdiff(prev_gray, gray))[0])
+
+    return blur_score, brightness, contrast, motion_score
+
+
+def _reuse_buffer(
+    buf: np.ndarray | None, shape: tuple[int, ...], dtype: type[np.generic]
+) -> np.ndarray:
+    """Return buf if it already has the shape and dtype, else a new empty array."""
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buf
+
+
+def _probe_args(video_path: Path) -> tuple[str, ...]:
+    """Input options capping FFmpeg/ffprobe stream probing for MP4/MOV files."""
+    if video_path.suffix.lower() in _PROBE_LIMITED_SUFFIXES:
+        return _PROBE_LIMITS
+    return ()
+
+
+def _ffmpeg_events(cmd: list[str], timeout: float) -> str:
+    """Run FFmpeg and return only its silencedetect/scdet stderr lines.
+
+    stderr is read line by line as FFmpeg writes it, so the progress and
+    banner output of a long run is never buffered. Raises
+    subprocess.TimeoutExpired if FFmpeg runs longer than timeout, like
+    subprocess.run(timeout=...).
+    """
+    timed_out = threading.Event()
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as proc:
+
+        def _kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            events = [
+                line
+                for line in proc.stderr or ()
+                if any(marker in line for marker in _EVENT_MARKERS)
+            ]
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return "".join(events)
+
+
+def _audio_result(stderr: str, duration: float, waveform_path: Path) -> AudioAnalysisResult:
+    """Build an AudioAnalysisResult from silencedetect's stderr log."""
+    result = AudioAnalysisResult(has_audio=True)
+
+    silence_starts: list[float] = []
+    silence_ends: list[float] = []
+    for m in _SILENCE_RE.finditer(stderr):
+        (silence_starts if m.group(1) == "start" else silence_ends).append(float(m.group(2)))
+
+    # Build SilenceRegion pairs
+    for i, start in enumerate(silence_starts):
+        end = silence_ends[i] if i < len(silence_ends) else start + 1.0
+        result.silence_regions.append(SilenceRegion(start=start, end=end))
+
+    # Derive audio peaks as midpoints of non-silent regions
+    if not silence_starts:
+        # No silence detected — audio throughout
+        result.audio_peaks.append(AudioPeak(timestamp=duration / 2, amplitude=0.8))
+    else:
+        prev_end = 0.0
+        for ss in silence_starts:
+            if ss > prev_end + 1.0:
+                result.audio_peaks.append(
+                    AudioPeak(timestamp=(prev_end + ss) / 2, amplitude=0.7)
+                )
+            prev_end = ss
+        for se in silence_ends:
+            prev_end = max(prev_end, se)
+        if duration > prev_end + 1.0:
+            result.audio_peaks.append(
+                AudioPeak(timestamp=(prev_end + duration) / 2, amplitude=0.7)
+            )
 
+    # waveform_s3_path is populated by the caller after uploading to S3
+    if waveform_path.exists():
+        result.waveform_s3_path = str(waveform_path)
 
-def _has_audio(video_path: Path) -> bool:
-    """Return True if the video file contains at least one audio stream."""
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "a",
-        "-show_entries",
-        "stream=codec_type",
-        "-of",
-        "csv=p=0",
-        str(video_path),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-    return len(result.stdout.strip()) > 0
+    return result
 
 
-def _get_metadata(video_path: Path) -> dict:
-    """Extract basic video metadata via ffprobe. Returns a flat dict."""
-    cmd = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-select_streams",
-        "v:0",
-        "-show_entries",
-        "stream=codec_name,width,height,r_frame_rate,duration",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "json",
-        str(video_path),
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    try:
-        data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        return {}
+def _parse_scdet(stderr: str) -> list[SceneChange]:
+    """Parse scene changes from FFmpeg scdet's stderr log."""
+    changes: list[SceneChange] = []
+    for match in _SCDET_RE.finditer(stderr):
+        changes.append(
+            SceneChange(
+                timestamp=float(match.group(1)),
+                score=float(match.group(2)),
+            )
+        )
+    return changes
 
-    meta: dict = {}
-    streams = data.get("streams", [])
-    if streams:
-        vs = streams[0]
-        meta["codec"] = vs.get("codec_name", "")
-        meta["width"] = int(vs.get("width", 0))
-        meta["height"] = int(vs.get("height", 0))
-        fps_str = vs.get("r_frame_rate", "0/1")
-        if "/" in fps_str:
-            num, den = fps_str.split("/")
-            meta["fps"] = float(num) / max(float(den), 1)
-        else:
-            meta["fps"] = float(fps_str)
-        dur = vs.get("duration") or data.get("format", {}).get("duration")
-        if dur:
-            meta["duration"] = float(dur)
 
-    meta["has_audio"] = _has_audio(video_path)
-    return meta
+@dataclass(frozen=True)
+class _VideoMetadata:
+    """Basic asset metadata from a single ffprobe call."""
+
+    codec: str = ""
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    duration: float = 0.0
+    has_audio: bool = False
 
 
-def _dump_ffprobe(video_path: Path, output_path: Path) -> None:
-    """Write full ffprobe JSON output to a file for debugging."""
+def _get_metadata(video_path: Path, dump_path: Path | None = None) -> _VideoMetadata:
+    """Extract basic video metadata, including audio presence, via one ffprobe.
+
+    If dump_path is given, the full streams/format JSON from the same probe
+    is also written there for debugging.
+    """
     cmd = [
         "ffprobe",
         "-v",
-        "quiet",
+        "error",
         "-print_format",
         "json",
         "-show_format",
         "-show_streams",
+        *_probe_args(video_path),
         str(video_path),
     ]
     result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-    output_path.write_text(result.stdout)
+    if dump_path is not None:
+        dump_path.write_text(result.stdout)
+    try:
+        data = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return _VideoMetadata()
+
+    streams = data.get("streams", [])
+    has_audio = any(st.get("codec_type") == "audio" for st in streams)
+    vs = next((st for st in streams if st.get("codec_type") == "video"), None)
+    if vs is None:
+        return _VideoMetadata(has_audio=has_audio)
+
+    fps_str = vs.get("r_frame_rate", "0/1")
+    if "/" in fps_str:
+        num, den = fps_str.split("/")
+        fps = float(num) / max(float(den), 1)
+    else:
+        fps = float(fps_str)
+    dur = vs.get("duration") or data.get("format", {}).get("duration")
+
+    return _VideoMetadata(
+        codec=vs.get("codec_name", ""),
+        width=int(vs.get("width", 0)),
+        height=int(vs.get("height", 0)),
+        fps=fps,
+        duration=float(dur) if dur else 0.0,
+        has_audio=has_audio,
+    )
@@ -8,19 +8,59 @@ not currently have. It walks frame-level quality metrics, groups consecutive
 good frames into candidate segments, splits at scene changes, and applies
 duration constraints before tagging each segment.
 
-Dependencies: flightdeck_contrib.schemas.quality
+Dependencies: numpy, flightdeck_contrib.schemas.quality,
+flightdeck_contrib.processing.frame_scoring; orjson optional for
+select_segments_from_json()
 """
 
 from __future__ import annotations
 
+import json
+import weakref
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, overload
+
+import numpy as np
 from pydantic import BaseModel, Field
 
+from flightdeck_contrib.processing import frame_scoring
 from flightdeck_contrib.schemas.quality import (
     FrameQualityMetrics,
     SegmentQualityReport,
     VideoQualityReport,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A frame within this many seconds of a scene change splits candidates there
+_SCENE_TOLERANCE = 0.05
+
+# tag_segment() bands: bisect a value into its band, then index the tag table.
+# Motion bands are [lo, hi); blur bands are (lo, hi].
+_MOTION_EDGES = (1.0, 5.0, 15.0)
+_MOTION_TAGS = ("static_shot", "slow_pan", "moderate_motion", "fast_motion")
+_BLUR_EDGES = (100, 200)
+_BLUR_TAGS = (None, "clear", "very_sharp")
+
+# One row per segment for SelectionResult.to_array()
+_SEGMENT_DTYPE = np.dtype(
+    [
+        ("segment_id", np.int32),
+        ("start_time", np.float64),
+        ("end_time", np.float64),
+        ("duration", np.float64),
+        ("confidence", np.float64),
+        ("avg_blur", np.float64),
+        ("avg_brightness", np.float64),
+        ("avg_motion", np.float64),
+    ]
+)
+
 
 class ScoredSegment(BaseModel):
     """A single selected segment with its quality report."""
@@ -41,12 +81,54 @@ class SelectionResult(BaseModel):
     selected_duration: float = 0.0
     rejected_duration: float = 0.0
 
+    def to_array(self) -> np.ndarray:
+        """Return the segments as a structured array, one row per segment.
+
+        Fields are segment_id, start_time, end_time, duration, confidence,
+        avg_blur, avg_brightness and avg_motion, so downstream code can sort,
+        mask and sum segments with NumPy instead of walking the models.
+        """
+        return np.array(
+            [
+                (
+                    s.segment_id,
+                    s.start_time,
+                    s.end_time,
+                    s.duration,
+                    s.quality.confidence,
+                    s.quality.avg_blur,
+                    s.quality.avg_brightness,
+                    s.quality.avg_motion,
+                )
+                for s in self.segments
+            ],
+            dtype=_SEGMENT_DTYPE,
+        )
+
+    def top_k(self, k: int) -> list[ScoredSegment]:
+        """Return the k most confident segments, highest first (ties in time order)."""
+        order = np.argsort(-self._confidences(), kind="stable")[:k]
+        return [self.segments[i] for i in order.tolist()]
+
+    def filter(self, min_confidence: float) -> list[ScoredSegment]:
+        """Return the segments with confidence >= min_confidence, in time order."""
+        keep = np.flatnonzero(self._confidences() >= min_confidence)
+        return [self.segments[i] for i in keep.tolist()]
+
+    def _confidences(self) -> np.ndarray:
+        """Segment confidences as a float64 array, in segment order."""
+        return np.fromiter(
+            (s.quality.confidence for s in self.segments),
+            dtype=np.float64,
+            count=len(self.segments),
+        )
+
 
 class SegmentScorer:
     """Scores and selects usable video segments from a VideoQualityReport.
 
     Strategy:
-    1. Walk frame analyses in time order.
+    1. Walk frame analyses in time order (sorted by timestamp if needed).
     2. Score each frame on quality (sharpness, brightness, motion).
     3. Merge consecutive good frames into candidate segments.
     4. Split candidates at scene change boundaries.
@@ -59,8 +141,19 @@ class SegmentScorer:
         result = scorer.select_segments(quality_report, min_confidence=0.4)
         for seg in result.segments:
             print(seg.segment_id, seg.quality.confidence, seg.quality.reason_tags)
+
+    A scorer remembers the frame arrays of the reports it has seen, so
+    repeated select_segments() calls on one report (e.g. a min_confidence
+    sweep) extract them once. Replacing or resizing a report's frame or scene
+    lists invalidates the entry (the frames themselves are frozen), and the
+    entry is dropped as soon as the report is garbage collected.
     """
 
+    def __init__(self) -> None:
+        # id(report) -> (weakref to report, frame list, scene list,
+        #                (frame count, scene count), arrays, scene times)
+        self._arrays_cache: dict[int, tuple[Any, ...]] = {}
+
     def select_segments(
         self,
         quality_report: VideoQualityReport,
@@ -83,64 +176,133 @@ class SegmentScorer:
         Returns:
             SelectionResult containing all selected ScoredSegments.
         """
-        result = SelectionResult(
+        arrays, scene_times = self._arrays_for(quality_report)
+        return self.select_segments_from_arrays(
+            arrays,
             source_file=quality_report.source_file,
-            total_duration=quality_report.duration,
+            duration=quality_report.duration,
+            width=quality_report.width,
+            height=quality_report.height,
+            has_audio=quality_report.has_audio,
+            scene_times=scene_times,
+            min_segment=min_segment,
+            max_segment=max_segment,
+            min_confidence=min_confidence,
+            blur_threshold=blur_threshold,
+            dark_threshold=dark_threshold,
         )
 
-        if not quality_report.frame_analyses:
-            return result
+    def select_segments_from_json(
+        self,
+        report: bytes | str | Mapping[str, Any],
+        min_segment: float = 5.0,
+        max_segment: float = 25.0,
+        min_confidence: float = 0.3,
+        blur_threshold: float = 80.0,
+        dark_threshold: float = 40.0,
+    ) -> SelectionResult:
+        """Select segments from a serialized VideoQualityReport.
 
-        # Build scene change timestamps for splitting
-        scene_times = {
-            round(sc.timestamp, 1) for sc in quality_report.scene_changes
-        }
-
-        # Score each frame
-        scored_frames: list[tuple[FrameQualityMetrics, float, list[str]]] = []
-        for fa in quality_report.frame_analyses:
-            score, tags = _score_frame(fa, blur_threshold, dark_threshold)
-            scored_frames.append((fa, score, tags))
-
-        # Group consecutive good frames into candidate segments
-        candidates: list[tuple[float, list[tuple[FrameQualityMetrics, float, list[str]]]]] = []
-        current_start: float | None = None
-        current_frames: list[tuple[FrameQualityMetrics, float, list[str]]] = []
-
-        for fa, score, tags in scored_frames:
-            is_good = score >= min_confidence
-            at_scene_change = round(fa.timestamp, 1) in scene_times
-
-            if is_good and not at_scene_change:
-                if current_start is None:
-                    current_start = fa.timestamp
-                current_frames.append((fa, score, tags))
-            else:
-                if current_frames and current_start is not None:
-                    candidates.append((current_start, current_frames))
-                current_start = None
-                current_frames = []
+        Same result as select_segments(VideoQualityReport.model_validate_json(report)),
+        but frame_analyses are read straight into arrays without building a
+        FrameQualityMetrics per frame, and without validation. Use it for
+        reports FlightDeck produced itself, e.g. the dict returned by
+        FlightDeckClient.get_quality_report() or a stored analysis.json::
 
-                # Good frame at scene change starts a new segment
-                if is_good:
-                    current_start = fa.timestamp
-                    current_frames = [(fa, score, tags)]
+            result = scorer.select_segments_from_json(Path("analysis.json").read_bytes())
 
-        if current_frames and current_start is not None:
-            candidates.append((current_start, current_frames))
+        Args:
+            report: Report JSON (parsed with orjson when installed), or the
+                already-parsed dict.
+            min_segment: Minimum segment duration in seconds.
+            max_segment: Maximum segment duration in seconds before splitting.
+            min_confidence: Minimum per-frame score to include a frame.
+            blur_threshold: Laplacian variance below this is considered blurry.
+            dark_threshold: Mean brightness below this is considered dark.
 
-        # Convert candidates to ScoredSegments with duration constraints
-        seg_id = 1
-        for start, frames in candidates:
-            end = frames[-1][0].timestamp + 1.0  # extend ~1s past last sample
-            end = min(end, quality_report.duration)
-            duration = end - start
+        Returns:
+            SelectionResult containing all selected ScoredSegments.
+        """
+        if isinstance(report, (bytes, str)):
+            report = orjson.loads(report) if orjson is not None else json.loads(report)
+        return self.select_segments_from_arrays(
+            FrameArrays.from_records(report.get("frame_analyses", [])),
+            source_file=report["source_file"],
+            duration=report.get("duration", 0.0),
+            width=report.get("width", 0),
+            height=report.get("height", 0),
+            has_audio=report.get("has_audio", False),
+            scene_times=[sc["timestamp"] for sc in report.get("scene_changes", [])],
+            min_segment=min_segment,
+            max_segment=max_segment,
+            min_confidence=min_confidence,
+            blur_threshold=blur_threshold,
+            dark_threshold=dark_threshold,
+        )
+
+    def select_segments_from_arrays(
+        self,
+        arrays: FrameArrays,
+        *,
+        source_file: str,
+        duration: float,
+        width: int,
+        height: int,
+        has_audio: bool,
+        scene_times: Sequence[float] = (),
+        min_segment: float = 5.0,
+        max_segment: float = 25.0,
+        min_confidence: float = 0.3,
+        blur_threshold: float = 80.0,
+        dark_threshold: float = 40.0,
+    ) -> SelectionResult:
+        """Select segments from per-field frame arrays and report metadata.
 
-            if duration < min_segment:
-                result.rejected_duration += duration
-                continue
+        select_segments() and select_segments_from_json() both end up here.
 
+        Args:
+            arrays: Frame metrics, from FrameArrays.from_report() or from_records().
+            source_file: Source file name reported on the result.
+            duration: Asset duration in seconds.
+            width: Video width in pixels.
+            height: Video height in pixels.
+            has_audio: Whether the asset has an audio track.
+            scene_times: Scene change timestamps in seconds.
+            min_segment: Minimum segment duration in seconds.
+            max_segment: Maximum segment duration in seconds before splitting.
+            min_confidence: Minimum per-frame score to include a frame.
+            blur_threshold: Laplacian variance below this is considered blurry.
+            dark_threshold: Mean brightness below this is considered dark.
+
+        Returns:
+            SelectionResult containing all selected ScoredSegments.
+        """
+        result = SelectionResult(source_file=source_file, total_duration=duration)
+
+        if not len(arrays.timestamp):
+            return result
+
+        # Score, group and length-filter every frame in one array pass
+        scores, candidates = _score_and_group(
+            arrays,
+            scene_times,
+            min_confidence=min_confidence,
+            duration=duration,
+            min_segment=min_segment,
+        )
+
+        # Per-frame columns as lists; each sub-segment sums only its own slice
+        timestamps = arrays.timestamp
+        blur = arrays.blur_score.tolist()
+        brightness = arrays.brightness.tolist()
+        motion = arrays.motion_score.tolist()
+        frame_scores = scores.tolist()
+
+        # Convert candidates to ScoredSegments with duration constraints
+        seg_id = 1
+        for first, stop, start, end in candidates:
             # Split long segments at max_segment boundaries
+            run_times = timestamps[first:stop]
             seg_start = start
             while seg_start < end:
                 seg_end = min(seg_start + max_segment, end)
@@ -150,46 +312,47 @@ class SegmentScorer:
                     # Remainder too short — discard tail
                     break
 
-                seg_frames = [
-                    f for f, s, t in frames if seg_start <= f.timestamp < seg_end
-                ]
-                if not seg_frames:
+                # Frames with seg_start <= timestamp < seg_end
+                lo, hi = (first + np.searchsorted(run_times, [seg_start, seg_end])).tolist()
+                if hi == lo:
                     seg_start = seg_end
                     continue
 
-                avg_blur = sum(f.blur_score for f in seg_frames) / len(seg_frames)
-                avg_brightness = sum(f.brightness for f in seg_frames) / len(seg_frames)
-                avg_motion = sum(f.motion_score for f in seg_frames) / len(seg_frames)
-                avg_score = (
-                    sum(s for f, s, t in frames if seg_start <= f.timestamp < seg_end)
-                    / len(seg_frames)
-                )
+                count = hi - lo
+                seg_frames = arrays.frames[lo:hi]
+                avg_blur = sum(blur[lo:hi]) / count
+                avg_brightness = sum(brightness[lo:hi]) / count
+                avg_motion = sum(motion[lo:hi]) / count
+                avg_score = sum(frame_scores[lo:hi]) / count
 
                 reason_tags = self.tag_segment(
                     seg_frames,
                     avg_motion=avg_motion,
                     avg_blur=avg_blur,
                     avg_brightness=avg_brightness,
-                    width=quality_report.width,
-                    height=quality_report.height,
-                    has_audio=quality_report.has_audio,
+                    width=width,
+                    height=height,
+                    has_audio=has_audio,
+                    motion=motion[lo:hi],
                 )
 
                 confidence = round(min(avg_score, 1.0), 3)
                 notes = self.generate_notes(confidence, reason_tags)
 
-                quality = SegmentQualityReport(
+                # Values are computed and range-checked here (confidence is a
+                # mean of clipped 0-1 scores), so skip per-field validation
+                quality = SegmentQualityReport.model_construct(
                     confidence=confidence,
                     reason_tags=reason_tags,
                     notes=notes,
                     avg_blur=round(avg_blur, 2),
                     avg_brightness=round(avg_brightness, 2),
                     avg_motion=round(avg_motion, 2),
-                    has_audio=quality_report.has_audio,
+                    has_audio=has_audio,
                 )
 
                 result.segments.append(
-                    ScoredSegment(
+                    ScoredSegment.model_construct(
                         segment_id=seg_id,
                         start_time=round(seg_start, 2),
                         end_time=round(seg_end, 2),
@@ -206,15 +369,45 @@ class SegmentScorer:
         )
         return result
 
+    def _arrays_for(self, report: VideoQualityReport) -> tuple[FrameArrays, list[float]]:
+        """Return the report's frame arrays and scene times, extracting on a miss."""
+        frames, scenes = report.frame_analyses, report.scene_changes
+        sizes = (len(frames), len(scenes))
+        cached = self._arrays_cache.get(id(report))
+        if cached is not None:
+            ref, cached_frames, cached_scenes, cached_sizes, arrays, scene_times = cached
+            if (
+                ref() is report
+                and cached_frames is frames
+                and cached_scenes is scenes
+                and cached_sizes == sizes
+            ):
+                return arrays, scene_times
+
+        arrays = FrameArrays.from_report(report)
+        scene_times = [sc.timestamp for sc in scenes]
+        key = id(report)
+        cache = self._arrays_cache
+
+        def evict(ref: weakref.ref) -> None:
+            # Runs when the report is collected, so its arrays go with it
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
+
+        cache[key] = (weakref.ref(report, evict), frames, scenes, sizes, arrays, scene_times)
+        return arrays, scene_times
+
     @staticmethod
     def tag_segment(
-        frames: list[FrameQualityMetrics],
+        frames: Sequence[FrameQualityMetrics],
         avg_motion: float,
         avg_blur: float,
         avg_brightness: float,
         width: int,
         height: int,
         has_audio: bool,
+        motion: Sequence[float] | None = None,
     ) -> list[str]:
         """Generate descriptive tags for a segment based on aggregate statistics.
 
@@ -228,27 +421,19 @@ class SegmentScorer:
             width: Video width in pixels.
             height: Video height in pixels.
             has_audio: Whether the source asset has an audio track.
+            motion: The frames' motion scores, if already extracted; read
+                from frames otherwise.
 
         Returns:
             List of string tags (e.g. "establishing_shot", "slow_pan", "4k").
         """
-        tags: list[str] = []
-
         # Motion-based shot classification
-        if avg_motion < 1.0:
-            tags.append("static_shot")
-        elif avg_motion < 5.0:
-            tags.append("slow_pan")
-        elif avg_motion < 15.0:
-            tags.append("moderate_motion")
-        else:
-            tags.append("fast_motion")
+        tags: list[str] = [_MOTION_TAGS[bisect_right(_MOTION_EDGES, avg_motion)]]
 
         # Sharpness tags
-        if avg_blur > 200:
-            tags.append("very_sharp")
-        elif avg_blur > 100:
-            tags.append("clear")
+        blur_tag = _BLUR_TAGS[bisect_left(_BLUR_EDGES, avg_blur)]
+        if blur_tag is not None:
+            tags.append(blur_tag)
 
         # Exposure tags
         if 80 < avg_brightness < 180:
@@ -264,10 +449,11 @@ class SegmentScorer:
 
         # Shot type heuristics from motion patterns
         if len(frames) > 10:
-            motion_trend = [f.motion_score for f in frames]
-            if all(m < 2.0 for m in motion_trend[:3]) and avg_motion > 3.0:
+            if motion is None:
+                motion = [f.motion_score for f in frames]
+            if max(motion[:3]) < 2.0 and avg_motion > 3.0:
                 tags.append("reveal_shot")
-            if all(m < 1.5 for m in motion_trend):
+            if max(motion) < 1.5:
                 tags.append("establishing_shot")
 
         return tags
@@ -303,55 +489,191 @@ class SegmentScorer:
 
 
 # ============================================================================
-# Internal frame scoring (mirrors selector.py:197-246 exactly)
+# Internal selection helpers
 # ============================================================================
 
 
-def _score_frame(
-    fa: FrameQualityMetrics,
-    blur_threshold: float,
-    dark_threshold: float,
-) -> tuple[float, list[str]]:
-    """Score a single frame 0-1 and return reason tags.
+def _score_and_group(
+    arrays: FrameArrays,
+    scene_times: Sequence[float],
+    min_confidence: float,
+    duration: float,
+    min_segment: float,
+) -> tuple[np.ndarray, list[tuple[int, int, float, float]]]:
+    """Score frames and return candidate runs long enough to keep.
+
+    Runs the scoring, scene-change matching and run-length grouping back to
+    back over the frame arrays, then computes every candidate's time span
+    at once and drops those shorter than min_segment before any per-segment
+    Python work.
+
+    Returns:
+        (scores, candidates): per-frame scores, and (first, stop, start, end)
+        for each kept run of good frames, where [first, stop) indexes the
+        frames and end extends ~1s past the last sample (capped at duration).
+    """
+    scores = frame_scoring.score_frames(
+        arrays.brightness,
+        arrays.contrast,
+        arrays.motion_score,
+        arrays.is_dark,
+        arrays.is_overexposed,
+        arrays.is_blurry,
+    )
+    at_scene_change = _near_scene_change(arrays.timestamp, scene_times)
+    runs = _good_runs(scores >= min_confidence, at_scene_change)
+    if not runs:
+        return scores, []
+
+    first, stop = np.array(runs, dtype=np.intp).T
+    starts = arrays.timestamp[first]
+    ends = np.minimum(arrays.timestamp[stop - 1] + 1.0, duration)
+    keep = np.flatnonzero(ends - starts >= min_segment)
+    candidates = list(
+        zip(
+            first[keep].tolist(),
+            stop[keep].tolist(),
+            starts[keep].tolist(),
+            ends[keep].tolist(),
+            strict=True,
+        )
+    )
+    return scores, candidates
+
+
+def _near_scene_change(timestamps: np.ndarray, scene_times: Sequence[float]) -> np.ndarray:
+    """Flag frames within _SCENE_TOLERANCE seconds of any scene change.
+
+    Looks up each frame's neighbouring scene changes in a sorted array with
+    np.searchsorted, instead of matching timestamps rounded to 0.1s (which
+    missed frames straddling a rounding boundary, e.g. 30.04 vs 30.06).
+    """
+    if not len(scene_times):
+        return np.zeros(len(timestamps), dtype=np.bool_)
+    scenes = np.sort(np.asarray(scene_times, dtype=np.float64))
+    idx = np.searchsorted(scenes, timestamps)
+    after = scenes[np.minimum(idx, len(scenes) - 1)]
+    before = scenes[np.maximum(idx - 1, 0)]
+    distance = np.minimum(np.abs(after - timestamps), np.abs(timestamps - before))
+    return distance < _SCENE_TOLERANCE
+
+
+def _good_runs(good: np.ndarray, at_scene_change: np.ndarray) -> list[tuple[int, int]]:
+    """Return [first, stop) index pairs of runs of good frames.
+
+    Run-length encodes good: a run starts on a rising edge of good or on a
+    good frame at a scene change (which cuts the previous run), and stops
+    before the next frame that does not continue it.
+    """
+    edges = np.diff(good.astype(np.int8), prepend=0)
+    starts = good & ((edges == 1) | at_scene_change)
+    stops = good & ~np.append(good[1:] & ~at_scene_change[1:], False)
+    return list(
+        zip(np.flatnonzero(starts).tolist(), (np.flatnonzero(stops) + 1).tolist(), strict=True)
+    )
+
+
+@dataclass(frozen=True)
+class FrameArrays:
+    """Per-field arrays (structure of arrays) over a report's frame analyses.
+
+    frames holds the frames' FrameQualityMetrics; all fields are in timestamp
+    order and aligned index for index. Build with from_report() or
+    from_records().
+    """
+
+    frames: Sequence[FrameQualityMetrics]
+    timestamp: np.ndarray
+    blur_score: np.ndarray
+    brightness: np.ndarray
+    contrast: np.ndarray
+    motion_score: np.ndarray
+    is_blurry: np.ndarray
+    is_dark: np.ndarray
+    is_overexposed: np.ndarray
+
+    @classmethod
+    def from_report(cls, report: VideoQualityReport) -> FrameArrays:
+        """Copy each FrameQualityMetrics field of a report into its own array."""
+        frames, timestamp = _time_ordered(
+            report.frame_analyses, [f.timestamp for f in report.frame_analyses]
+        )
+        n = len(frames)
+
+        def column(field: str, dtype: type[np.generic]) -> np.ndarray:
+            return np.fromiter((getattr(f, field) for f in frames), dtype=dtype, count=n)
+
+        return cls(
+            frames=frames,
+            timestamp=timestamp,
+            blur_score=column("blur_score", np.float64),
+            brightness=column("brightness", np.float64),
+            contrast=column("contrast", np.float64),
+            motion_score=column("motion_score", np.float64),
+            is_blurry=column("is_blurry", np.bool_),
+            is_dark=column("is_dark", np.bool_),
+            is_overexposed=column("is_overexposed", np.bool_),
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> FrameArrays:
+        """Build the arrays from frame_analyses dicts, as parsed from report JSON.
+
+        No FrameQualityMetrics are created up front: frames materializes them
+        (unvalidated) only for the entries that are indexed.
+        """
+        records, timestamp = _time_ordered(records, [r["timestamp"] for r in records])
+        n = len(records)
+
+        def column(field: str, dtype: type[np.generic], default: Any = None) -> np.ndarray:
+            if default is None:
+                values = (r[field] for r in records)
+            else:
+                values = (r.get(field, default) for r in records)
+            return np.fromiter(values, dtype=dtype, count=n)
+
+        return cls(
+            frames=_LazyFrames(records),
+            timestamp=timestamp,
+            blur_score=column("blur_score", np.float64),
+            brightness=column("brightness", np.float64),
+            contrast=column("contrast", np.float64),
+            motion_score=column("motion_score", np.float64),
+            is_blurry=column("is_blurry", np.bool_, False),
+            is_dark=column("is_dark", np.bool_, False),
+            is_overexposed=column("is_overexposed", np.bool_, False),
+        )
+
+
+class _LazyFrames(Sequence[FrameQualityMetrics]):
+    """Read-only frame sequence over raw dicts, building models on access."""
+
+    def __init__(self, records: list[Mapping[str, Any]]) -> None:
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> FrameQualityMetrics: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> _LazyFrames: ...
+
+    def __getitem__(self, index: int | slice) -> FrameQualityMetrics | _LazyFrames:
+        if isinstance(index, slice):
+            return _LazyFrames(self._records[index])
+        return FrameQualityMetrics.model_construct(**self._records[index])
+
+
+def _time_ordered(items: Sequence[Any], timestamps: list[float]) -> tuple[list[Any], np.ndarray]:
+    """Return items as a list sorted by timestamp, and the sorted timestamps.
 
-    This is the canonical scoring implementation. The same logic exists on
-    QualityAnalyzer.score_frame() — both must stay in sync when tuning weights.
+    Sorts once here (stable, and skipped when already in order), so run
+    grouping and searchsorted can rely on time order.
     """
-    score = 1.0
-    tags: list[str] = []
-
-    if fa.is_blurry:
-        score -= 0.5
-        tags.append("blurry")
-    elif fa.blur_score > blur_threshold * 3:
-        tags.append("sharp")
-
-    if fa.is_dark:
-        score -= 0.6
-        tags.append("too_dark")
-    elif fa.brightness < 60:
-        score -= 0.2
-        tags.append("dim")
-
-    if fa.is_overexposed:
-        score -= 0.4
-        tags.append("overexposed")
-
-    if fa.contrast < 15:
-        score -= 0.5
-        tags.append("low_contrast")
-
-    if 2.0 < fa.motion_score < 20.0:
-        score += 0.1
-        tags.append("good_motion")
-    elif fa.motion_score < 0.5:
-        tags.append("static")
-    elif fa.motion_score > 30.0:
-        score -= 0.2
-        tags.append("shaky")
-
-    if 80 < fa.brightness < 180 and fa.contrast > 30:
-        score += 0.1
-        tags.append("well_exposed")
-
-    return max(0.0, min(1.0, score)), tags
+    timestamp = np.array(timestamps, dtype=np.float64)
+    if np.any(timestamp[1:] < timestamp[:-1]):
+        order = np.argsort(timestamp, kind="stable")
+        return [items[i] for i in order.tolist()], timestamp[order]
+    return list(items), timestamp
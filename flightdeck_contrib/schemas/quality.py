@@ -6,11 +6,17 @@ Place in FlightDeck at: shared/src/schemas/quality.py
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FrameQualityMetrics(BaseModel):
-    """Per-frame quality metrics from OpenCV analysis."""
+    """Per-frame quality metrics from OpenCV analysis.
+
+    Frozen: a report holds thousands of these, and consumers (e.g.
+    SegmentScorer's per-report array cache) rely on them not changing.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     timestamp: float = Field(description="Frame timestamp in seconds")
     blur_score: float = Field(description="Laplacian variance - higher means sharper")
@@ -58,6 +64,8 @@ class AudioAnalysisResult(BaseModel):
 class SegmentQualityReport(BaseModel):
     """Quality metrics and tags for a video segment."""
 
+    model_config = ConfigDict(frozen=True)
+
     confidence: float = Field(ge=0, le=1, description="Composite quality confidence")
     reason_tags: list[str] = Field(
         default_factory=list,
@@ -105,3 +113,4 @@ class DeliverableRequest(BaseModel):
     target_width: int = 1920
     crf: int = 22
     source_label: str = ""
+    keyframe_aligned: bool = False  # start lies on a source keyframe; trim by stream copy
@@ -1,45 +1,73 @@
 """Skyforge CLI — companion tool for FlightDeck drone platform."""
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperCommand, TyperGroup
 
 from skyforge import __version__
-from skyforge.commands import (
-    analyze,
-    auth,
-    detect,
-    export,
-    flights,
-    ingest,
-    init,
-    process,
-    status,
-    telemetry,
-    transcode,
-    vision,
-)
+
+# Subcommand name -> help. Each skyforge.commands.<name> module is imported only
+# when its command runs, so `skyforge --help` and `skyforge version` load none.
+_SUBCOMMANDS = {
+    "init": "Create a new flight project",
+    "ingest": "Import, scan, and normalize aerial footage",
+    "flights": "Track and manage flight sessions",
+    "process": "AI/ML processing on aerial media",
+    "telemetry": "Extract and analyze drone flight telemetry",
+    "analyze": "Analyze footage, select segments, export clips",
+    "export": "Export deliverables via FlightDeck",
+    "status": "Check FlightDeck job status",
+    "auth": "Authenticate with FlightDeck API",
+    "transcode": "Transcode normalized footage to shareable formats",
+    "detect": "Detect objects in footage with YOLOv8",
+    "vision": "AI vision analysis of aerial footage",
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Root group that imports a subcommand's module the first time it is resolved."""
+
+    _listing_help = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*super().list_commands(ctx), *_SUBCOMMANDS]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> TyperCommand | TyperGroup | None:
+        if cmd_name not in _SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+        help_text = _SUBCOMMANDS[cmd_name]
+        if self._listing_help:
+            # The help listing only needs each command's name and help text
+            return TyperCommand(cmd_name, help=help_text)
+        module = importlib.import_module(f"skyforge.commands.{cmd_name}")
+        group = typer.main.get_group(module.app)
+        group.name = cmd_name
+        group.help = help_text
+        return group
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
 
 app = typer.Typer(
     name="skyforge",
+    cls=_LazyGroup,
     help="AI Aerial Solutions — manage footage locally or via FlightDeck API.",
     no_args_is_help=True,
 )
 
-app.add_typer(init.app, name="init", help="Create a new flight project")
-app.add_typer(ingest.app, name="ingest", help="Import, scan, and normalize aerial footage")
-app.add_typer(flights.app, name="flights", help="Track and manage flight sessions")
-app.add_typer(process.app, name="process", help="AI/ML processing on aerial media")
-app.add_typer(telemetry.app, name="telemetry", help="Extract and analyze drone flight telemetry")
-app.add_typer(analyze.app, name="analyze", help="Analyze footage, select segments, export clips")
-app.add_typer(export.app, name="export", help="Export deliverables via FlightDeck")
-app.add_typer(status.app, name="status", help="Check FlightDeck job status")
-app.add_typer(auth.app, name="auth", help="Authenticate with FlightDeck API")
-app.add_typer(
-    transcode.app,
-    name="transcode",
-    help="Transcode normalized footage to shareable formats",
-)
-app.add_typer(detect.app, name="detect", help="Detect objects in footage with YOLOv8")
-app.add_typer(vision.app, name="vision", help="AI vision analysis of aerial footage")
+
+@app.callback()
+def main() -> None:
+    # Subcommands are registered lazily by _LazyGroup; an explicit callback keeps
+    # Typer from collapsing the app into its single eager `version` command.
+    pass
 
 
 @app.command()
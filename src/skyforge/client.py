@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import random
 import time
-from collections.abc import Callable
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import httpx
 
 from skyforge.config import SkyforgeConfig
+from skyforge.utils import jsonio
+
+# Connection pool shared by the sync and async clients' HTTP/2 transports
+_POOL_LIMITS = httpx.Limits(
+    max_connections=40,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# Request bodies are pre-encoded with jsonio (orjson when installed)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upload read size: large reads amortise syscalls and TLS record framing
+_UPLOAD_CHUNK = 4 * 1024 * 1024
+
+# Escapes for multipart field and file names (as browsers and httpx apply)
+_MULTIPART_ESCAPES = str.maketrans({"\\": "\\\\", '"': "%22", "\r": "%0D", "\n": "%0A"})
 
 
 class FlightDeckError(Exception):
@@ -51,13 +73,14 @@ class FlightDeckClient:
     def client(self) -> httpx.Client:
         """Lazily initialise the underlying httpx.Client."""
         if self._client is None:
-            headers: dict[str, str] = {}
-            if self.config.api_key:
-                headers["Authorization"] = f"Bearer {self.config.api_key}"
+            # One pooled HTTP/2 connection multiplexes concurrent requests;
+            # retries only cover failed connects, never a sent request
+            transport = httpx.HTTPTransport(http2=True, limits=_POOL_LIMITS, retries=2)
             self._client = httpx.Client(
                 base_url=self.base_url,
-                headers=headers,
+                headers=_auth_headers(self.config),
                 timeout=httpx.Timeout(30.0, connect=10.0),
+                transport=transport,
             )
         return self._client
 
@@ -88,8 +111,9 @@ class FlightDeckClient:
     def upload(self, file_path: Path, metadata: dict | None = None) -> str:
         """Upload a media file to FlightDeck.
 
-        Uses multipart streaming to handle large files without loading them
-        fully into memory.
+        Streams the multipart body with a precomputed Content-Length, reading
+        the file in 4 MiB blocks, so large files are never loaded fully into
+        memory and each read amortises its syscall and TLS framing.
 
         Returns:
             asset_id assigned by FlightDeck.
@@ -99,17 +123,20 @@ class FlightDeckClient:
             FlightDeckError: Upload was rejected (HTTP error).
         """
         try:
-            with open(file_path, "rb") as f:
-                files = {"file": (file_path.name, f, "video/mp4")}
-                data = metadata or {}
-                resp = self.client.post(
-                    "/api/v1/upload",
-                    files=files,
-                    data=data,
-                    timeout=httpx.Timeout(600.0, connect=10.0),  # 10 min for large files
-                )
+            boundary = uuid.uuid4().hex
+            head, tail = _multipart_envelope(boundary, file_path.name, metadata or {})
+            length = len(head) + os.path.getsize(file_path) + len(tail)
+            resp = self.client.post(
+                "/api/v1/upload",
+                content=_multipart_stream(file_path, head, tail),
+                headers={
+                    "Content-Type": f"multipart/form-data; boundary={boundary}",
+                    "Content-Length": str(length),
+                },
+                timeout=httpx.Timeout(600.0, connect=10.0),  # 10 min for large files
+            )
             resp.raise_for_status()
-            return resp.json()["asset_id"]
+            return jsonio.loads(resp.content)["asset_id"]
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -127,9 +154,11 @@ class FlightDeckClient:
         """
         try:
             payload: dict = {"asset_id": asset_id, **(options or {})}
-            resp = self.client.post("/api/v1/processing/jobs", json=payload)
+            resp = self.client.post(
+                "/api/v1/processing/jobs", content=jsonio.dumps(payload), headers=_JSON_HEADERS
+            )
             resp.raise_for_status()
-            return resp.json()["job_id"]
+            return jsonio.loads(resp.content)["job_id"]
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -142,14 +171,7 @@ class FlightDeckClient:
         try:
             resp = self.client.get(f"/api/v1/processing/jobs/{job_id}")
             resp.raise_for_status()
-            data = resp.json()
-            return JobStatus(
-                job_id=data["job_id"],
-                status=data["status"],
-                progress=data.get("progress", 0.0),
-                message=data.get("message", ""),
-                result_url=data.get("result_url"),
-            )
+            return _job_status(jsonio.loads(resp.content))
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -163,14 +185,21 @@ class FlightDeckClient:
         interval: float = 2.0,
         timeout: float = 600.0,
         callback: Callable[[JobStatus], None] | None = None,
+        max_interval: float = 30.0,
     ) -> JobStatus:
         """Poll a job until it reaches a terminal state (completed or failed).
 
+        The delay between polls starts at ``interval`` and grows 1.5x per
+        poll up to ``max_interval``, with up to 10% random jitter so many
+        clients polling at once spread out. Short jobs are still seen
+        promptly; long ones cost far fewer requests.
+
         Args:
             job_id: Job to poll.
-            interval: Seconds between polls.
+            interval: Seconds before the second poll.
             timeout: Maximum seconds to wait before raising.
             callback: Optional function called with each JobStatus update.
+            max_interval: Upper bound on the delay between polls.
 
         Returns:
             Final JobStatus once the job reaches a terminal state.
@@ -179,13 +208,15 @@ class FlightDeckClient:
             FlightDeckError: Job did not complete within ``timeout`` seconds.
         """
         start = time.monotonic()
+        delay = interval
         while time.monotonic() - start < timeout:
             status = self.get_job_status(job_id)
             if callback is not None:
                 callback(status)
             if status.status in ("completed", "failed"):
                 return status
-            time.sleep(interval)
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 1.5, max_interval)
         raise FlightDeckError(f"Job {job_id} timed out after {timeout}s")
 
     # ── Quality analysis ────────────────────────────────────────────────────
@@ -199,7 +230,7 @@ class FlightDeckClient:
         try:
             resp = self.client.post(f"/api/v1/quality/analyze/{asset_id}")
             resp.raise_for_status()
-            return resp.json()["job_id"]
+            return jsonio.loads(resp.content)["job_id"]
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -212,7 +243,7 @@ class FlightDeckClient:
         try:
             resp = self.client.get(f"/api/v1/quality/report/{asset_id}")
             resp.raise_for_status()
-            return resp.json()
+            return jsonio.loads(resp.content)
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -230,9 +261,11 @@ class FlightDeckClient:
         """
         try:
             payload: dict = {"segment_id": segment_id, **(options or {})}
-            resp = self.client.post("/api/v1/deliverables/export", json=payload)
+            resp = self.client.post(
+                "/api/v1/deliverables/export", content=jsonio.dumps(payload), headers=_JSON_HEADERS
+            )
             resp.raise_for_status()
-            return resp.json()["job_id"]
+            return jsonio.loads(resp.content)["job_id"]
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -245,7 +278,7 @@ class FlightDeckClient:
         try:
             resp = self.client.get(f"/api/v1/deliverables/{segment_id}")
             resp.raise_for_status()
-            return resp.json()
+            return jsonio.loads(resp.content)
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
@@ -267,10 +300,306 @@ class FlightDeckClient:
                 params={"page": page, "per_page": per_page},
             )
             resp.raise_for_status()
-            return resp.json()
+            return jsonio.loads(resp.content)
         except httpx.ConnectError as e:
             raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
         except httpx.HTTPStatusError as e:
             raise FlightDeckError(
                 f"List assets failed: {e.response.status_code} {e.response.text}"
             ) from e
+
+
+class AsyncFlightDeckClient:
+    """Asynchronous client for the FlightDeck REST API.
+
+    Mirrors FlightDeckClient on httpx.AsyncClient, so independent calls can
+    be awaited together on one event loop — e.g. polling several jobs or
+    fetching every page of the asset list concurrently:
+
+        async with AsyncFlightDeckClient(config) as client:
+            statuses = await client.poll_many(job_ids)
+            assets = [a async for a in client.iter_all_assets()]
+    """
+
+    def __init__(self, config: SkyforgeConfig) -> None:
+        self.config = config
+        self.base_url = config.api_url.rstrip("/")
+        self._client: httpx.AsyncClient | None = None
+
+    # ── Internal HTTP client ────────────────────────────────────────────────
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazily initialise the underlying httpx.AsyncClient."""
+        if self._client is None:
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=_POOL_LIMITS, retries=2)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=_auth_headers(self.config),
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                transport=transport,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> AsyncFlightDeckClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def _send(self, action: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, mapping failures to FlightDeck errors like the sync client."""
+        try:
+            resp = await self.client.request(method, url, **kwargs)
+            resp.raise_for_status()
+            return resp
+        except httpx.ConnectError as e:
+            raise FlightDeckUnavailableError(f"Cannot reach FlightDeck at {self.base_url}") from e
+        except httpx.HTTPStatusError as e:
+            raise FlightDeckError(
+                f"{action} failed: {e.response.status_code} {e.response.text}"
+            ) from e
+
+    # ── Health ──────────────────────────────────────────────────────────────
+
+    async def health_check(self) -> bool:
+        """Return True if the FlightDeck API is reachable and responding."""
+        try:
+            resp = await self.client.get("/health")
+            return resp.status_code == 200
+        except (httpx.ConnectError, httpx.TimeoutException):
+            return False
+
+    # ── Upload ──────────────────────────────────────────────────────────────
+
+    async def upload(self, file_path: Path, metadata: dict | None = None) -> str:
+        """Upload a media file to FlightDeck; see FlightDeckClient.upload()."""
+        boundary = uuid.uuid4().hex
+        head, tail = _multipart_envelope(boundary, file_path.name, metadata or {})
+        length = len(head) + os.path.getsize(file_path) + len(tail)
+        resp = await self._send(
+            "Upload",
+            "POST",
+            "/api/v1/upload",
+            content=_multipart_astream(file_path, head, tail),
+            headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(length),
+            },
+            timeout=httpx.Timeout(600.0, connect=10.0),  # 10 min for large files
+        )
+        return jsonio.loads(resp.content)["asset_id"]
+
+    # ── Processing jobs ─────────────────────────────────────────────────────
+
+    async def start_processing(self, asset_id: str, options: dict | None = None) -> str:
+        """Submit a processing job for an uploaded asset and return its job_id."""
+        payload: dict = {"asset_id": asset_id, **(options or {})}
+        resp = await self._send(
+            "Processing",
+            "POST",
+            "/api/v1/processing/jobs",
+            content=jsonio.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        return jsonio.loads(resp.content)["job_id"]
+
+    async def get_job_status(self, job_id: str) -> JobStatus:
+        """Fetch the current status of a processing job."""
+        resp = await self._send("Status check", "GET", f"/api/v1/processing/jobs/{job_id}")
+        return _job_status(jsonio.loads(resp.content))
+
+    async def poll_job(
+        self,
+        job_id: str,
+        interval: float = 2.0,
+        timeout: float = 600.0,
+        callback: Callable[[JobStatus], None] | None = None,
+        max_interval: float = 30.0,
+    ) -> JobStatus:
+        """Poll a job until it reaches a terminal state; see FlightDeckClient.poll_job()."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        delay = interval
+        while loop.time() - start < timeout:
+            status = await self.get_job_status(job_id)
+            if callback is not None:
+                callback(status)
+            if status.status in ("completed", "failed"):
+                return status
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 1.5, max_interval)
+        raise FlightDeckError(f"Job {job_id} timed out after {timeout}s")
+
+    async def poll_many(
+        self,
+        job_ids: list[str],
+        interval: float = 2.0,
+        timeout: float = 600.0,
+    ) -> list[JobStatus]:
+        """Poll several jobs concurrently; returns final statuses in job_ids order."""
+        return list(
+            await asyncio.gather(*(self.poll_job(job_id, interval, timeout) for job_id in job_ids))
+        )
+
+    # ── Quality analysis ────────────────────────────────────────────────────
+
+    async def start_quality_analysis(self, asset_id: str) -> str:
+        """Submit a quality analysis job for an asset and return its job_id."""
+        resp = await self._send("Analysis request", "POST", f"/api/v1/quality/analyze/{asset_id}")
+        return jsonio.loads(resp.content)["job_id"]
+
+    async def get_quality_report(self, asset_id: str) -> dict:
+        """Retrieve the completed quality analysis report for an asset."""
+        resp = await self._send("Quality report", "GET", f"/api/v1/quality/report/{asset_id}")
+        return jsonio.loads(resp.content)
+
+    # ── Deliverables ────────────────────────────────────────────────────────
+
+    async def export_deliverable(self, segment_id: str, options: dict | None = None) -> str:
+        """Request a report-ready deliverable export and return its job_id."""
+        payload: dict = {"segment_id": segment_id, **(options or {})}
+        resp = await self._send(
+            "Export request",
+            "POST",
+            "/api/v1/deliverables/export",
+            content=jsonio.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        return jsonio.loads(resp.content)["job_id"]
+
+    async def get_deliverable(self, segment_id: str) -> dict:
+        """Get deliverable status and download URL for a segment."""
+        resp = await self._send("Deliverable fetch", "GET", f"/api/v1/deliverables/{segment_id}")
+        return jsonio.loads(resp.content)
+
+    # ── Asset listing ────────────────────────────────────────────────────────
+
+    async def list_assets(self, page: int = 1, per_page: int = 20) -> dict:
+        """List assets with pagination; returns ``items``, ``total`` and ``page``."""
+        resp = await self._send(
+            "List assets",
+            "GET",
+            "/api/v1/assets",
+            params={"page": page, "per_page": per_page},
+        )
+        return jsonio.loads(resp.content)
+
+    async def iter_all_assets(
+        self, per_page: int = 100, concurrency: int = 8
+    ) -> AsyncIterator[dict]:
+        """Yield every asset, fetching pages after the first concurrently.
+
+        Page 1 gives ``total``; the remaining pages are requested together
+        (at most ``concurrency`` in flight) and yielded in page order.
+        """
+        first = await self.list_assets(page=1, per_page=per_page)
+        for item in first.get("items", []):
+            yield item
+
+        pages = -(-first.get("total", 0) // per_page)  # ceil division
+        if pages <= 1:
+            return
+
+        limit = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> dict:
+            async with limit:
+                return await self.list_assets(page=page, per_page=per_page)
+
+        for page in await asyncio.gather(*(fetch(p) for p in range(2, pages + 1))):
+            for item in page.get("items", []):
+                yield item
+
+
+def check_health(config: SkyforgeConfig) -> bool:
+    """Return True if the FlightDeck API is reachable, for synchronous callers.
+
+    Runs AsyncFlightDeckClient.health_check() on its own event loop, the path
+    the CLI commands use for connectivity checks.
+    """
+    return asyncio.run(_check_health(config))
+
+
+async def _check_health(config: SkyforgeConfig) -> bool:
+    """Open an AsyncFlightDeckClient just long enough to probe /health."""
+    async with AsyncFlightDeckClient(config) as client:
+        return await client.health_check()
+
+
+# ── Shared helpers ───────────────────────────────────────────────────────────
+
+
+def _auth_headers(config: SkyforgeConfig) -> dict[str, str]:
+    """Default request headers, with a bearer token if an API key is configured."""
+    headers: dict[str, str] = {}
+    if config.api_key:
+        headers["Authorization"] = f"Bearer {config.api_key}"
+    return headers
+
+
+def _job_status(data: dict) -> JobStatus:
+    """Build a JobStatus from a processing job JSON payload."""
+    return JobStatus(
+        job_id=data["job_id"],
+        status=data["status"],
+        progress=data.get("progress", 0.0),
+        message=data.get("message", ""),
+        result_url=data.get("result_url"),
+    )
+
+
+# ── Multipart upload helpers ─────────────────────────────────────────────────
+
+
+def _multipart_envelope(boundary: str, filename: str, fields: dict) -> tuple[bytes, bytes]:
+    """Return the multipart bytes before and after the file's content."""
+
+    def quote(value: str) -> str:
+        return value.translate(_MULTIPART_ESCAPES)
+
+    parts = [
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{quote(str(name))}"'
+        f"\r\n\r\n{_form_value(value)}\r\n"
+        for name, value in fields.items()
+    ]
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+        f'filename="{quote(filename)}"\r\nContent-Type: video/mp4\r\n\r\n'
+    )
+    return "".join(parts).encode(), f"\r\n--{boundary}--\r\n".encode()
+
+
+def _form_value(value: object) -> str:
+    """Render a form field value the way httpx's data= encoding does."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _multipart_stream(file_path: Path, head: bytes, tail: bytes) -> Iterator[bytes]:
+    """Yield a multipart body, reading the file in _UPLOAD_CHUNK blocks."""
+    yield head
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_UPLOAD_CHUNK):
+            yield chunk
+    yield tail
+
+
+async def _multipart_astream(file_path: Path, head: bytes, tail: bytes) -> AsyncIterator[bytes]:
+    """Async _multipart_stream(); file reads run in a worker thread."""
+    yield head
+    with open(file_path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, _UPLOAD_CHUNK):
+            yield chunk
+    yield tail
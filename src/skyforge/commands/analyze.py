@@ -1,14 +1,16 @@
 """Analyze command — automated video analysis, segment selection, and export."""
 
+import os
+from itertools import islice
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
-from skyforge.core.media import VIDEO_EXTENSIONS
+from skyforge.core.media import list_device_videos
 from skyforge.core.project import detect_project_dir
+from skyforge.utils import jsonio
 
 app = typer.Typer()
 console = Console()
@@ -26,6 +28,9 @@ def run(
         False, "--dry-run", help="Analyze only, show what would be selected"
     ),
     local: bool = typer.Option(False, "--local", help="Force local processing (skip FlightDeck)"),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", min=0, help="Parallel analysis/export workers (0 = one per CPU core)"
+    ),
 ):
     """Run the full analysis -> select -> export pipeline.
 
@@ -53,12 +58,13 @@ def run(
         sample_interval,
         skip_export,
         dry_run,
+        jobs,
     )
 
 
 def _run_remote(project_dir: Path, config) -> None:
     """Run analysis via FlightDeck API."""
-    from skyforge.client import FlightDeckClient, FlightDeckError, FlightDeckUnavailableError
+    from skyforge.client import check_health
 
     proj = detect_project_dir(project_dir)
     if not proj:
@@ -69,26 +75,14 @@ def _run_remote(project_dir: Path, config) -> None:
     console.print(f"  Project: {proj}")
     console.print(f"  API:     {config.api_url}\n")
 
-    try:
-        with FlightDeckClient(config) as client:
-            if not client.health_check():
-                console.print(
-                    "[yellow]FlightDeck unreachable. Falling back to local mode.[/yellow]\n"
-                )
-                _run_local(project_dir, 5.0, 25.0, 0.3, 1.0, False, False)
-                return
-
-            console.print("[dim]Remote analysis via FlightDeck API.[/dim]")
-            console.print("[dim]Upload footage first with: skyforge ingest run[/dim]")
-            console.print("[dim]Then check results with: skyforge status job <job_id>[/dim]")
-
-    except FlightDeckUnavailableError:
+    if not check_health(config):
         console.print("[yellow]FlightDeck unreachable. Falling back to local mode.[/yellow]\n")
         _run_local(project_dir, 5.0, 25.0, 0.3, 1.0, False, False)
-    except FlightDeckError as e:
-        console.print(f"[red]FlightDeck error:[/red] {e}")
-        console.print("[yellow]Falling back to local mode.[/yellow]\n")
-        _run_local(project_dir, 5.0, 25.0, 0.3, 1.0, False, False)
+        return
+
+    console.print("[dim]Remote analysis via FlightDeck API.[/dim]")
+    console.print("[dim]Upload footage first with: skyforge ingest run[/dim]")
+    console.print("[dim]Then check results with: skyforge status job <job_id>[/dim]")
 
 
 def _run_local(
@@ -99,16 +93,23 @@ def _run_local(
     sample_interval: float,
     skip_export: bool,
     dry_run: bool,
+    jobs: int = 0,
 ) -> None:
-    """Run analysis locally using Skyforge core modules."""
-    from skyforge.core.analyzer import VideoAnalysis, analyze_video
+    """Run analysis locally using Skyforge core modules.
+
+    Videos are analyzed and selected in up to `jobs` worker processes (0 = one
+    per CPU core); each video is independent, and results keep the videos' order.
+    Clip exports run as concurrent FFmpeg processes, up to `jobs` (at most 8)
+    at a time.
+    """
+    # Pipeline-only imports stay out of module import, which `analyze summary`
+    # and `analyze export` also pay
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
     from skyforge.core.exporter import export_report_ready, trim_segment
-    from skyforge.core.selector import (
-        SelectsResult,
-        generate_master_timeline,
-        save_selects,
-        select_segments,
-    )
+    from skyforge.core.selector import SelectsResult, generate_master_timeline
 
     proj = detect_project_dir(project_dir)
     if not proj:
@@ -127,15 +128,7 @@ def _run_local(
         raise typer.Exit(1)
 
     # Collect all normalized videos
-    videos = sorted(
-        [
-            f
-            for d in norm_dir.iterdir()
-            if d.is_dir()
-            for f in d.iterdir()
-            if f.is_file() and f.suffix.lower() in VIDEO_EXTENSIONS
-        ]
-    )
+    videos = list_device_videos(norm_dir)
 
     if not videos:
         console.print("[yellow]No normalized videos found.[/yellow]")
@@ -148,10 +141,15 @@ def _run_local(
     console.print(f"  Min confidence: {min_confidence}")
     console.print()
 
-    # -- Phase 1: Analyze --
-    console.print("[bold cyan]Phase 1: Analyzing footage...[/bold cyan]")
-    all_analyses: list[VideoAnalysis] = []
+    # -- Phase 1: Analyze and select --
+    console.print("[bold cyan]Phase 1: Analyzing footage and selecting segments...[/bold cyan]")
     all_selects: list[SelectsResult] = []
+    select_options = {
+        "sample_interval": sample_interval,
+        "min_segment": min_segment,
+        "max_segment": max_segment,
+        "min_confidence": min_confidence,
+    }
 
     with Progress(
         SpinnerColumn(),
@@ -162,36 +160,44 @@ def _run_local(
         console=console,
     ) as progress:
         task = progress.add_task("Analyzing...", total=len(videos))
+        workers = min(jobs or os.cpu_count() or 1, len(videos))
 
-        for video in videos:
-            device = video.parent.name
-            progress.update(task, description=f"[cyan]{device}[/cyan] {video.name}")
-
-            video_analysis_dir = analysis_dir / video.stem
-            analysis = analyze_video(video, video_analysis_dir, sample_interval=sample_interval)
-            all_analyses.append(analysis)
-
-            progress.advance(task)
+        if workers == 1:
+            for video in videos:
+                device = video.parent.name
+                progress.update(task, description=f"[cyan]{device}[/cyan] {video.name}")
 
-    # -- Phase 2: Select segments --
-    console.print("\n[bold cyan]Phase 2: Selecting usable segments...[/bold cyan]")
-
-    for analysis in all_analyses:
-        selects = select_segments(
-            analysis,
-            min_segment=min_segment,
-            max_segment=max_segment,
-            min_confidence=min_confidence,
-        )
-        all_selects.append(selects)
+                all_selects.append(_analyze_and_select(video, analysis_dir, **select_options))
 
-        selects_json = analysis_dir / f"selects_{Path(analysis.source_file).stem}.json"
-        save_selects(selects, selects_json)
+                progress.advance(task)
+        else:
+            results: dict[int, SelectsResult] = {}
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_analyze_and_select, video, analysis_dir, **select_options): i
+                    for i, video in enumerate(videos)
+                }
+                try:
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        results[i] = future.result()
+                        video = videos[i]
+                        progress.update(
+                            task,
+                            advance=1,
+                            description=f"[cyan]{video.parent.name}[/cyan] {video.name}",
+                        )
+                except BaseException:
+                    # Don't start the queued videos once one has failed
+                    pool.shutdown(cancel_futures=True)
+                    raise
+            all_selects.extend(results[i] for i in range(len(videos)))
 
     master_path = analysis_dir / "master_selects.json"
     generate_master_timeline(all_selects, master_path)
 
-    _print_selection_summary(all_selects)
+    total_segments = sum(len(s.segments) for s in all_selects)
+    _print_selection_summary(all_selects, total_segments)
 
     if dry_run or skip_export:
         console.print(f"\n[bold]Analysis saved to:[/bold] {analysis_dir}")
@@ -199,10 +205,9 @@ def _run_local(
             console.print("[yellow]Dry run — no clips exported.[/yellow]")
         return
 
-    # -- Phase 3: Export selects --
-    console.print("\n[bold cyan]Phase 3: Exporting selected clips...[/bold cyan]")
+    # -- Phase 2: Export selects --
+    console.print("\n[bold cyan]Phase 2: Exporting selected clips...[/bold cyan]")
 
-    total_segments = sum(len(s.segments) for s in all_selects)
     exported = 0
     report_exported = 0
 
@@ -216,21 +221,31 @@ def _run_local(
     ) as progress:
         task = progress.add_task("Exporting...", total=total_segments * 2)
 
-        for selects in all_selects:
-            for segment in selects.segments:
-                src_name = Path(segment.source_file).stem
-                progress.update(task, description=f"Trimming {src_name} seg{segment.segment_id}")
-
-                clip = trim_segment(segment, selects_dir)
-                if clip:
-                    exported += 1
-                progress.advance(task)
-
-                progress.update(task, description=f"Report {src_name} seg{segment.segment_id}")
-                report = export_report_ready(segment, exports_dir)
-                if report:
-                    report_exported += 1
-                progress.advance(task)
+        # Each export is an FFmpeg subprocess, so threads just wait on them; capped
+        # at 8 so concurrent encodes don't oversubscribe the CPU and disk
+        workers = min(jobs or os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for selects in all_selects:
+                for segment in selects.segments:
+                    label = f"{Path(segment.source_file).stem} seg{segment.segment_id}"
+                    futures[pool.submit(trim_segment, segment, selects_dir)] = (
+                        "clip",
+                        f"Trimmed {label}",
+                    )
+                    futures[pool.submit(export_report_ready, segment, exports_dir)] = (
+                        "report",
+                        f"Report {label}",
+                    )
+
+            for future in as_completed(futures):
+                kind, description = futures[future]
+                if future.result():
+                    if kind == "clip":
+                        exported += 1
+                    else:
+                        report_exported += 1
+                progress.update(task, advance=1, description=description)
 
     # -- Summary --
     console.print()
@@ -257,9 +272,7 @@ def show_analysis_summary(
         console.print("[yellow]No analysis found. Run `skyforge analyze run` first.[/yellow]")
         raise typer.Exit(0)
 
-    import json
-
-    data = json.loads(master.read_text())
+    data = _read_master_head(master, limit=20)
 
     console.print("\n[bold]Analysis Summary[/bold]")
     console.print(f"  Sources:  {data['total_sources']}")
@@ -278,7 +291,7 @@ def show_analysis_summary(
         table.add_column("Conf", justify="right", style="magenta")
         table.add_column("Tags", style="yellow", max_width=40)
 
-        for seg in data["segments"][:20]:
+        for seg in data["segments"]:
             src = Path(seg["source_file"]).stem
             time_range = f"{seg['start_time']:.0f}-{seg['end_time']:.0f}s"
             table.add_row(
@@ -357,7 +370,65 @@ def export_report(
         raise typer.Exit(1)
 
 
-def _print_selection_summary(all_selects) -> None:
+def _analyze_and_select(
+    video: Path,
+    analysis_dir: Path,
+    sample_interval: float,
+    min_segment: float,
+    max_segment: float,
+    min_confidence: float,
+):
+    """Analyze one video and save its selects; returns the SelectsResult.
+
+    Runs in a worker process for parallel runs. Only the selects come back, so
+    the per-frame VideoAnalysis is never pickled and is freed once selected.
+    Outputs are keyed by device folder and stem, so same-named clips from two
+    devices never write the same files.
+    """
+    from skyforge.core.analyzer import analyze_video
+    from skyforge.core.selector import save_selects, select_segments
+
+    device = video.parent.name
+    analysis = analyze_video(
+        video, analysis_dir / device / video.stem, sample_interval=sample_interval
+    )
+    selects = select_segments(
+        analysis,
+        min_segment=min_segment,
+        max_segment=max_segment,
+        min_confidence=min_confidence,
+    )
+    save_selects(selects, analysis_dir / f"selects_{device}_{video.stem}.json")
+    return selects
+
+
+def _read_master_head(master: Path, limit: int) -> dict:
+    """Read master_selects.json's totals and its first `limit` segments.
+
+    The timeline is written sorted by confidence, so the first segments are
+    the top ones. With ijson installed (skyforge[fast]) the file is streamed
+    and each read stops as soon as it has its value, so large projects never
+    materialize every segment; otherwise the whole file is parsed.
+    """
+    try:
+        import ijson
+    except ImportError:
+        data = jsonio.loads(master.read_bytes())
+        data["segments"] = data["segments"][:limit]
+        return data
+
+    data = {}
+    with master.open("rb") as f:
+        # The totals precede the segments, so each of these reads stops early
+        for key in ("total_sources", "total_segments", "total_selected_duration"):
+            f.seek(0)
+            data[key] = next(ijson.items(f, key, use_float=True))
+        f.seek(0)
+        data["segments"] = list(islice(ijson.items(f, "segments.item", use_float=True), limit))
+    return data
+
+
+def _print_selection_summary(all_selects, total_segments: int) -> None:
     """Print a summary table of selections."""
     table = Table(title="Segment Selection Summary")
     table.add_column("Source", style="cyan", max_width=30)
@@ -369,18 +440,18 @@ def _print_selection_summary(all_selects) -> None:
 
     for sel in all_selects:
         src = Path(sel.source_file).stem
-        best_conf = max((s.confidence for s in sel.segments), default=0)
         table.add_row(
             src,
             f"{sel.total_duration:.0f}s",
             f"{sel.selected_duration:.0f}s",
             f"{sel.rejected_duration:.0f}s",
             str(len(sel.segments)),
-            f"{best_conf:.2f}",
+            f"{sel.best_confidence:.2f}",
         )
 
     console.print(table)
 
-    total_segs = sum(len(s.segments) for s in all_selects)
     total_selected = sum(s.selected_duration for s in all_selects)
-    console.print(f"\n[bold]Total:[/bold] {total_segs} segments, {total_selected:.0f}s selected")
+    console.print(
+        f"\n[bold]Total:[/bold] {total_segments} segments, {total_selected:.0f}s selected"
+    )
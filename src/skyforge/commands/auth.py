@@ -33,21 +33,18 @@ def login(
     console.print(f"[green]API key saved[/green] to {CREDENTIALS_FILE}")
 
     # Verify the connection with the newly saved key
-    from skyforge.client import FlightDeckClient
+    from skyforge.client import check_health
 
     config = load_config()
     config.api_key = api_key.strip()
 
-    with FlightDeckClient(config) as client:
-        if client.health_check():
-            console.print(f"[green]Connected[/green] to FlightDeck at {config.api_url}")
-        else:
-            console.print(
-                f"[yellow]Warning:[/yellow] Could not reach FlightDeck at {config.api_url}"
-            )
-            console.print(
-                "[dim]The key is saved - connection may work once the server is running.[/dim]"
-            )
+    if check_health(config):
+        console.print(f"[green]Connected[/green] to FlightDeck at {config.api_url}")
+    else:
+        console.print(f"[yellow]Warning:[/yellow] Could not reach FlightDeck at {config.api_url}")
+        console.print(
+            "[dim]The key is saved - connection may work once the server is running.[/dim]"
+        )
 
 
 @app.command("status")
@@ -71,13 +68,12 @@ def auth_status() -> None:
     console.print(f"Local:    {'yes' if config.local_mode else 'no'}")
 
     if config.is_configured:
-        from skyforge.client import FlightDeckClient
+        from skyforge.client import check_health
 
-        with FlightDeckClient(config) as client:
-            if client.health_check():
-                console.print("Health:   [green]connected[/green]")
-            else:
-                console.print("Health:   [red]unreachable[/red]")
+        if check_health(config):
+            console.print("Health:   [green]connected[/green]")
+        else:
+            console.print("Health:   [red]unreachable[/red]")
     else:
         console.print("Health:   [dim]not configured — run: skyforge auth login[/dim]")
 
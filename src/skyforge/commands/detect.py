@@ -1,5 +1,8 @@
 """Detect command — run YOLO object detection on normalized aerial footage."""
 
+import importlib.util
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
@@ -13,7 +16,7 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from skyforge.core.media import VIDEO_EXTENSIONS
+from skyforge.core.media import VIDEO_EXTENSIONS, walk_device_files
 from skyforge.core.project import detect_project_dir
 
 app = typer.Typer()
@@ -23,6 +26,10 @@ _INSTALL_HINT = (
     "[red]Error:[/red] ultralytics is not installed.\n"
     "  Install with: [cyan]pip install skyforge\\[detect][/cyan]"
 )
+_PYAV_HINT = (
+    "[red]Error:[/red] PyAV is not installed (needed for --decoder pyav).\n"
+    "  Install with: [cyan]pip install skyforge\\[detect][/cyan]"
+)
 
 
 @app.command("run")
@@ -36,6 +43,36 @@ def run(
     classes: str | None = typer.Option(
         None, "--classes", help="Comma-separated class filter (e.g. 'car,person,truck')"
     ),
+    batch_size: int = typer.Option(
+        16,
+        "--batch-size",
+        "-b",
+        min=1,
+        help="Sampled frames per detector inference call (about 2x this many "
+        "decoded frames are held in memory, ~25 MB each at 4K)",
+    ),
+    engine: str = typer.Option(
+        "pt",
+        "--engine",
+        help="Inference backend: auto, pt, trt-fp16 or trt-int8 (TensorRT engines are cached)",
+    ),
+    decoder: str = typer.Option(
+        "opencv", "--decoder", help="Frame decoder: opencv or pyav (threaded, sequential decode)"
+    ),
+    hwaccel: str | None = typer.Option(
+        None, "--hwaccel", help="PyAV hardware decode device (cuda, vaapi, videotoolbox)"
+    ),
+    half: bool | None = typer.Option(
+        None, "--half/--no-half", help="FP16 inference for .pt models (default: on with CUDA)"
+    ),
+    compress: bool = typer.Option(
+        False, "--compress", help="Write gzipped <stem>_detections.json.gz files"
+    ),
+    overwrite: bool = typer.Option(
+        False,
+        "--overwrite/--no-overwrite",
+        help="Re-run detection on videos whose results are already up to date",
+    ),
     dry_run: bool = typer.Option(
         False, "--dry-run", help="Preview files without running detection"
     ),
@@ -43,12 +80,15 @@ def run(
     """Run object detection on all normalized videos in a flight project.
 
     Reads from 02_NORMALIZED/<device>/, writes detection JSON to
-    07_DETECTIONS/<device>/<stem>_detections.json.
+    07_DETECTIONS/<device>/<stem>_detections.json (.json.gz with --compress).
 
     Example:
         skyforge detect run
         skyforge detect run "My Flight" --model yolov8s.pt --interval 1.0
         skyforge detect run . --classes car,person,truck --dry-run
+
+    Videos whose detection file was written by the same model and interval
+    since the video last changed are skipped unless --overwrite is given.
     """
     proj = detect_project_dir(project_dir)
     if not proj:
@@ -66,14 +106,7 @@ def run(
         raise typer.Exit(1)
 
     # Collect video files grouped by device subdirectory
-    video_files: list[tuple[Path, str]] = []
-    for device_dir in sorted(norm_dir.iterdir()):
-        if not device_dir.is_dir():
-            continue
-        device = device_dir.name
-        for f in sorted(device_dir.rglob("*")):
-            if f.is_file() and f.suffix.lower() in VIDEO_EXTENSIONS:
-                video_files.append((f, device))
+    video_files = walk_device_files(norm_dir, VIDEO_EXTENSIONS)
 
     if not video_files:
         console.print("[yellow]No normalized videos found.[/yellow]")
@@ -83,9 +116,10 @@ def run(
 
     console.print("\n[bold]Skyforge Object Detection Pipeline[/bold]")
     console.print(f"  Project:    {proj}")
-    console.print(f"  Model:      {model}")
+    console.print(f"  Model:      {model} ({engine})")
     console.print(f"  Confidence: {confidence}")
     console.print(f"  Interval:   {interval}s between frames")
+    console.print(f"  Batch size: {batch_size} frames")
     console.print(f"  Videos:     {len(video_files)}")
     if classes_filter:
         console.print(f"  Filter:     {', '.join(classes_filter)}")
@@ -100,29 +134,33 @@ def run(
         table.add_column("Output", style="dim")
         for video_path, device in video_files:
             out = detect_dir / device / f"{video_path.stem}_detections.json"
+            if compress:
+                out = out.with_name(out.name + ".gz")
             table.add_row(device, video_path.name, str(out.relative_to(proj)))
         console.print(table)
         return
 
     # Lazy import — fail gracefully if ultralytics not installed
     try:
-        from skyforge.core.detector import ObjectDetector, detect_video, save_detections
+        from skyforge.core.detector import detect_video, save_detections
     except ImportError:
         console.print(_INSTALL_HINT)
         raise typer.Exit(1) from None
 
-    try:
-        detector = ObjectDetector(
-            model_name=model,
-            confidence=confidence,
-            device=None,
-        )
-    except ImportError:
-        console.print(_INSTALL_HINT)
-        raise typer.Exit(1) from None
+    _check_decoder(decoder, hwaccel)
+    detector = _load_detector(
+        model,
+        confidence,
+        engine,
+        batch_size,
+        [video_path for video_path, _ in video_files],
+        classes_filter,
+        half,
+    )
 
     total_objects = 0
-    all_classes: dict[str, int] = {}
+    all_classes: Counter[str] = Counter()
+    skipped = 0
 
     with Progress(
         SpinnerColumn(),
@@ -131,6 +169,7 @@ def run(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task("Detecting...", total=len(video_files))
 
@@ -140,21 +179,37 @@ def run(
                 description=f"[cyan]{device}[/cyan] {video_path.name}",
             )
 
-            detections = detect_video(
-                video_path=video_path,
-                detector=detector,
-                sample_interval=interval,
-                classes_filter=classes_filter,
+            out_path = detect_dir / device / f"{video_path.stem}_detections.json"
+            existing = (
+                None
+                if overwrite
+                else _reusable_detections(out_path, video_path, detector, interval)
             )
 
-            out_path = detect_dir / device / f"{video_path.stem}_detections.json"
-            save_detections(detections, out_path)
+            if existing is not None:
+                skipped += 1
+                wanted = out_path.with_name(out_path.name + ".gz") if compress else out_path
+                if not wanted.exists():
+                    # Saved in the other format: convert it, no inference needed
+                    save_detections(existing, out_path, compress)
+                video_obj_count = sum(len(f["detections"]) for f in existing.get("frames", []))
+                unique_classes = existing.get("unique_classes", {})
+            else:
+                detections = detect_video(
+                    video_path=video_path,
+                    detector=detector,
+                    sample_interval=interval,
+                    batch_size=batch_size,
+                    decoder=decoder,
+                    hwaccel=hwaccel,
+                )
+                save_detections(detections, out_path, compress)
+                video_obj_count = sum(len(f.detections) for f in detections.frames)
+                unique_classes = detections.unique_classes
 
             # Accumulate stats
-            video_obj_count = sum(len(f.detections) for f in detections.frames)
             total_objects += video_obj_count
-            for cls_name, count in detections.unique_classes.items():
-                all_classes[cls_name] = all_classes.get(cls_name, 0) + count
+            all_classes.update(unique_classes)
 
             progress.advance(task)
 
@@ -163,10 +218,12 @@ def run(
     console.print(
         f"[bold green]Detection complete:[/bold green] {len(video_files)} videos processed"
     )
+    if skipped:
+        console.print(f"  Skipped (up to date): {skipped}")
     console.print(f"  Total objects detected: {total_objects}")
 
     if all_classes:
-        top_classes = sorted(all_classes.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_classes = all_classes.most_common(5)
         top_str = ", ".join(f"{name} ({count})" for name, count in top_classes)
         console.print(f"  Top classes: {top_str}")
 
@@ -185,10 +242,36 @@ def detect_single(
     classes: str | None = typer.Option(
         None, "--classes", help="Comma-separated class filter (e.g. 'car,person,truck')"
     ),
+    batch_size: int = typer.Option(
+        16,
+        "--batch-size",
+        "-b",
+        min=1,
+        help="Sampled frames per detector inference call (about 2x this many "
+        "decoded frames are held in memory, ~25 MB each at 4K)",
+    ),
+    engine: str = typer.Option(
+        "pt",
+        "--engine",
+        help="Inference backend: auto, pt, trt-fp16 or trt-int8 (TensorRT engines are cached)",
+    ),
+    decoder: str = typer.Option(
+        "opencv", "--decoder", help="Frame decoder: opencv or pyav (threaded, sequential decode)"
+    ),
+    hwaccel: str | None = typer.Option(
+        None, "--hwaccel", help="PyAV hardware decode device (cuda, vaapi, videotoolbox)"
+    ),
+    half: bool | None = typer.Option(
+        None, "--half/--no-half", help="FP16 inference for .pt models (default: on with CUDA)"
+    ),
+    compress: bool = typer.Option(
+        False, "--compress", help="Write gzipped <stem>_detections.json.gz files"
+    ),
 ) -> None:
     """Run object detection on a single video file.
 
-    Saves results as <stem>_detections.json next to the input file.
+    Saves results as <stem>_detections.json (or .json.gz with --compress)
+    next to the input file.
 
     Example:
         skyforge detect file video_norm.mp4
@@ -205,22 +288,16 @@ def detect_single(
 
     # Lazy import
     try:
-        from skyforge.core.detector import ObjectDetector, detect_video, save_detections
-    except ImportError:
-        console.print(_INSTALL_HINT)
-        raise typer.Exit(1) from None
-
-    try:
-        detector = ObjectDetector(
-            model_name=model,
-            confidence=confidence,
-            device=None,
-        )
+        from skyforge.core.detector import detect_video, save_detections
     except ImportError:
         console.print(_INSTALL_HINT)
         raise typer.Exit(1) from None
 
+    _check_decoder(decoder, hwaccel)
     classes_filter = [c.strip() for c in classes.split(",")] if classes else None
+    detector = _load_detector(
+        model, confidence, engine, batch_size, [input_file], classes_filter, half
+    )
 
     console.print(f"\n[bold]Detecting objects in:[/bold] {input_file.name}")
     console.print(f"  Model: {model}, Confidence: {confidence}, Interval: {interval}s")
@@ -234,6 +311,7 @@ def detect_single(
         BarColumn(),
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task(f"Detecting {input_file.name}...", total=None)
 
@@ -251,12 +329,15 @@ def detect_single(
             video_path=input_file,
             detector=detector,
             sample_interval=interval,
-            classes_filter=classes_filter,
             on_progress=on_progress,
+            batch_size=batch_size,
+            decoder=decoder,
+            hwaccel=hwaccel,
         )
 
-    out_path = input_file.parent / f"{input_file.stem}_detections.json"
-    save_detections(detections, out_path)
+    out_path = save_detections(
+        detections, input_file.parent / f"{input_file.stem}_detections.json", compress
+    )
 
     # Summary
     total_objects = sum(len(f.detections) for f in detections.frames)
@@ -279,15 +360,13 @@ def summary(
 ) -> None:
     """Show a summary of existing detection results for a project.
 
-    Reads from 07_DETECTIONS/**/*_detections.json and displays a table
+    Reads from 07_DETECTIONS/**/*_detections.json[.gz] and displays a table
     with per-video statistics and a grand total.
 
     Example:
         skyforge detect summary
         skyforge detect summary "My Flight"
     """
-    from skyforge.core.detector import load_detections
-
     proj = detect_project_dir(project_dir)
     if not proj:
         console.print("[red]Error:[/red] Not a skyforge project (no 01_RAW/ directory found).")
@@ -300,7 +379,9 @@ def summary(
         )
         raise typer.Exit(0)
 
-    json_files = sorted(detect_dir.rglob("*_detections.json"))
+    from skyforge.core.detector import find_detection_files
+
+    json_files = find_detection_files(detect_dir, recursive=True)
     if not json_files:
         console.print("[yellow]No detection JSON files found in 07_DETECTIONS/.[/yellow]")
         raise typer.Exit(0)
@@ -313,27 +394,26 @@ def summary(
 
     grand_frames = 0
     grand_objects = 0
-    grand_classes: dict[str, int] = {}
+    grand_classes: Counter[str] = Counter()
 
-    for jf in json_files:
-        data = load_detections(jf)
-        source = Path(data.get("source", jf.stem)).name
-        frames_sampled = data.get("total_frames_sampled", 0)
-        unique = data.get("unique_classes", {})
+    # Files are independent reads + parses, so load them on a thread pool;
+    # map() keeps the rows in file order
+    with ThreadPoolExecutor() as pool:
+        rows = list(pool.map(_load_summary_row, json_files))
 
-        total_objs = sum(unique.values())
-        top_3 = sorted(unique.items(), key=lambda x: x[1], reverse=True)[:3]
+    for source, frames_sampled, unique in rows:
+        total_objs = unique.total()
+        top_3 = unique.most_common(3)
         top_str = ", ".join(f"{n} ({c})" for n, c in top_3) if top_3 else "-"
 
         table.add_row(source, str(frames_sampled), str(total_objs), top_str)
 
         grand_frames += frames_sampled
         grand_objects += total_objs
-        for cls_name, count in unique.items():
-            grand_classes[cls_name] = grand_classes.get(cls_name, 0) + count
+        grand_classes.update(unique)
 
     # Grand total row
-    grand_top = sorted(grand_classes.items(), key=lambda x: x[1], reverse=True)[:3]
+    grand_top = grand_classes.most_common(3)
     grand_top_str = ", ".join(f"{n} ({c})" for n, c in grand_top) if grand_top else "-"
     table.add_section()
     table.add_row(
@@ -346,3 +426,99 @@ def summary(
     console.print()
     console.print(table)
     console.print()
+
+
+def _load_summary_row(json_file: Path) -> tuple[str, int, Counter[str]]:
+    """Load one detection JSON as (source name, frames sampled, class counts)."""
+    from skyforge.core.detector import load_detections
+
+    data = load_detections(json_file)
+    return (
+        Path(data.get("source", json_file.stem)).name,
+        data.get("total_frames_sampled", 0),
+        Counter(data.get("unique_classes", {})),
+    )
+
+
+def _reusable_detections(
+    out_path: Path, video_path: Path, detector, interval: float
+) -> dict | None:
+    """Return saved detections still valid for video_path, or None to re-run.
+
+    out_path is the plain <stem>_detections.json path; a gzipped file saved
+    by a --compress run is considered too. Results are reused only when they
+    record the same source mtime, model, engine/precision, sample interval,
+    confidence and class filter, so edited videos or changed options are
+    detected again.
+    """
+    from skyforge.core.detector import load_detections
+
+    saved = [p for p in (out_path, out_path.with_name(out_path.name + ".gz")) if p.exists()]
+    if not saved:
+        return None
+    try:
+        data = load_detections(max(saved, key=lambda p: p.stat().st_mtime_ns))
+    except (OSError, EOFError, ValueError):
+        return None
+    if (
+        data.get("source_mtime_ns") != video_path.stat().st_mtime_ns
+        or data.get("model") != detector.model_name
+        or data.get("engine") != detector.engine
+        or data.get("sample_interval") != interval
+        or data.get("confidence") != detector.confidence
+        or data.get("classes") != detector.classes
+    ):
+        return None
+    return data
+
+
+def _check_decoder(decoder: str, hwaccel: str | None) -> None:
+    """Exit early on a bad --decoder/--hwaccel choice or a missing PyAV."""
+    from skyforge.core.decode import DECODERS
+
+    if decoder not in DECODERS:
+        console.print(f"[red]Error:[/red] Unknown decoder '{decoder}' (use {', '.join(DECODERS)}).")
+        raise typer.Exit(1)
+    if hwaccel and decoder != "pyav":
+        console.print("[red]Error:[/red] --hwaccel requires --decoder pyav.")
+        raise typer.Exit(1)
+    if decoder == "pyav" and importlib.util.find_spec("av") is None:
+        console.print(_PYAV_HINT)
+        raise typer.Exit(1)
+
+
+def _load_detector(
+    model: str,
+    confidence: float,
+    engine: str,
+    batch_size: int,
+    calibration_videos: list[Path],
+    classes_filter: list[str] | None,
+    half: bool | None,
+):
+    """Construct and warm up the ObjectDetector, exiting with a hint on failure."""
+    from skyforge.core.detector import ObjectDetector
+
+    status = f"Loading {model}..."
+    if engine != "pt":
+        status = f"Preparing {engine} engine for {model} (first run exports it)..."
+    try:
+        with console.status(status):
+            detector = ObjectDetector(
+                model_name=model,
+                confidence=confidence,
+                device=None,
+                engine=engine,
+                batch_size=batch_size,
+                calibration_videos=calibration_videos,
+                classes=classes_filter,
+                half=half,
+            )
+            detector.warmup(batch=batch_size)
+            return detector
+    except ImportError:
+        console.print(_INSTALL_HINT)
+        raise typer.Exit(1) from None
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
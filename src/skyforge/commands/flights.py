@@ -1,12 +1,13 @@
 """Flights command — track and manage flight sessions."""
 
+import os
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from skyforge.core.media import scan_directory
+from skyforge.core.media import SCAN_CACHE, count_files, scan_directory
 from skyforge.core.project import load_project
 
 app = typer.Typer()
@@ -18,7 +19,12 @@ def list_flights(
     data_dir: Path = typer.Option(".", help="Parent directory containing flight projects"),
 ):
     """List all flight projects in a directory."""
-    candidates = [d for d in Path(data_dir).iterdir() if d.is_dir() and (d / "01_RAW").is_dir()]
+    with os.scandir(data_dir) as entries:
+        candidates = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, "01_RAW"))
+        ]
 
     if not candidates:
         console.print("[yellow]No flight projects found.[/yellow]")
@@ -37,9 +43,10 @@ def list_flights(
         raw_dir = proj_dir / "01_RAW"
         norm_dir = proj_dir / "02_NORMALIZED"
 
-        devices = [d.name for d in raw_dir.iterdir() if d.is_dir()]
-        raw_count = sum(1 for _ in raw_dir.rglob("*") if _.is_file())
-        norm_count = sum(1 for _ in norm_dir.rglob("*.mp4")) if norm_dir.exists() else 0
+        with os.scandir(raw_dir) as entries:
+            devices = [entry.name for entry in entries if entry.is_dir()]
+        raw_count = count_files(raw_dir)
+        norm_count = count_files(norm_dir, ".mp4") if norm_dir.exists() else 0
 
         status = meta.get("status", "unknown")
         if norm_count > 0:
@@ -75,7 +82,7 @@ def flight_info(
         console.print(f"[bold]Created:[/bold] {meta['created']}")
     console.print()
 
-    files = scan_directory(raw_dir)
+    files = scan_directory(raw_dir, cache_path=project_dir / SCAN_CACHE)
 
     # Group by device
     devices: dict[str, list] = {}
@@ -1,18 +1,29 @@
 """Ingest command — scan, normalize, and create proxies for aerial footage."""
 
+import asyncio
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.table import Table
 
-from skyforge.core.media import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, scan_directory
+from skyforge.core.media import SCAN_CACHE, VIDEO_EXTENSIONS, scan_directory, walk_device_files
 from skyforge.core.project import detect_project_dir
 
 app = typer.Typer()
 console = Console()
 
+# Videos uploaded to FlightDeck at once by `ingest run` in remote mode
+_UPLOAD_CONCURRENCY = 4
+
 
 @app.command("scan")
 def scan(
@@ -31,7 +42,7 @@ def scan(
     # If this is a project dir, scan only 01_RAW to avoid duplicates
     proj = detect_project_dir(source)
     scan_root = (proj / "01_RAW") if proj and (proj / "01_RAW").exists() else source
-    files = scan_directory(scan_root, recursive)
+    files = scan_directory(scan_root, recursive, cache_path=proj / SCAN_CACHE if proj else None)
 
     if not files:
         console.print("[yellow]No media files found.[/yellow]")
@@ -142,8 +153,12 @@ def run(
 
 
 def _run_remote(project_dir: Path, config) -> None:
-    """Run ingest via FlightDeck API."""
-    from skyforge.client import FlightDeckClient, FlightDeckError, FlightDeckUnavailableError
+    """Run ingest via FlightDeck API.
+
+    Videos are uploaded and submitted for processing concurrently, at most
+    _UPLOAD_CONCURRENCY at a time, so request latency overlaps across files.
+    """
+    from skyforge.client import FlightDeckError, FlightDeckUnavailableError, check_health
 
     proj = detect_project_dir(project_dir)
     if not proj:
@@ -151,15 +166,7 @@ def _run_remote(project_dir: Path, config) -> None:
         raise typer.Exit(1)
 
     raw_dir = proj / "01_RAW"
-    videos = sorted(
-        [
-            f
-            for d in raw_dir.iterdir()
-            if d.is_dir()
-            for f in d.rglob("*")
-            if f.is_file() and f.suffix.lower() in VIDEO_EXTENSIONS
-        ]
-    )
+    videos = [f for f, _ in walk_device_files(raw_dir, VIDEO_EXTENSIONS)]
 
     if not videos:
         console.print("[yellow]No video files found in 01_RAW/.[/yellow]")
@@ -170,37 +177,26 @@ def _run_remote(project_dir: Path, config) -> None:
     console.print(f"  Videos:  {len(videos)}")
     console.print(f"  API:     {config.api_url}\n")
 
-    try:
-        with FlightDeckClient(config) as client:
-            if not client.health_check():
-                console.print(
-                    "[yellow]FlightDeck unreachable. Falling back to local mode.[/yellow]"
-                )
-                _run_local(project_dir, 30, 18, False, False)
-                return
-
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeElapsedColumn(),
-                console=console,
-            ) as progress:
-                task = progress.add_task("Uploading...", total=len(videos))
-
-                for video in videos:
-                    progress.update(task, description=f"Uploading [cyan]{video.name}[/cyan]")
-                    asset_id = client.upload(video)
-                    job_id = client.start_processing(asset_id)
-                    progress.update(
-                        task,
-                        description=f"Processing [cyan]{video.name}[/cyan] (job {job_id})",
-                    )
-                    progress.advance(task)
+    if not check_health(config):
+        console.print("[yellow]FlightDeck unreachable. Falling back to local mode.[/yellow]")
+        _run_local(project_dir, 30, 18, False, False)
+        return
 
-            console.print("\n[bold green]Upload complete.[/bold green]")
-            console.print("[dim]Check status: skyforge status job <job_id>[/dim]")
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=console,
+            refresh_per_second=4,
+        ) as progress:
+            task = progress.add_task("Uploading...", total=len(videos))
+            asyncio.run(_upload_all(config, videos, progress, task))
+
+        console.print("\n[bold green]Upload complete.[/bold green]")
+        console.print("[dim]Check status: skyforge status job <job_id>[/dim]")
 
     except FlightDeckUnavailableError:
         console.print("[yellow]FlightDeck unreachable. Falling back to local mode.[/yellow]\n")
@@ -211,9 +207,44 @@ def _run_remote(project_dir: Path, config) -> None:
         _run_local(project_dir, 30, 18, False, False)
 
 
+async def _upload_all(config, videos: list[Path], progress: Progress, task: TaskID) -> list[str]:
+    """Upload each video and start its processing job; returns job ids in video order.
+
+    The first failure cancels the remaining uploads and is re-raised as is.
+    """
+    from skyforge.client import AsyncFlightDeckClient
+
+    limit = asyncio.Semaphore(_UPLOAD_CONCURRENCY)
+
+    async def upload(client: AsyncFlightDeckClient, video: Path) -> str:
+        async with limit:
+            progress.update(task, description=f"Uploading [cyan]{video.name}[/cyan]")
+            asset_id = await client.upload(video)
+            job_id = await client.start_processing(asset_id)
+        progress.update(
+            task,
+            advance=1,
+            description=f"Processing [cyan]{video.name}[/cyan] (job {job_id})",
+        )
+        return job_id
+
+    async with AsyncFlightDeckClient(config) as client:
+        try:
+            async with asyncio.TaskGroup() as group:
+                uploads = [group.create_task(upload(client, video)) for video in videos]
+        except* Exception as errors:
+            raise errors.exceptions[0] from None
+    return [done.result() for done in uploads]
+
+
 def _run_local(project_dir: Path, fps: int, crf: int, skip_proxies: bool, dry_run: bool) -> None:
     """Run ingest locally using Skyforge core modules."""
-    from skyforge.core.pipeline import PipelineConfig, generate_manifest, run_pipeline
+    from skyforge.core.pipeline import (
+        PipelineConfig,
+        generate_manifest,
+        prepare_pipeline,
+        run_pipeline,
+    )
 
     proj = detect_project_dir(project_dir)
     if not proj:
@@ -249,19 +280,14 @@ def _run_local(project_dir: Path, fps: int, crf: int, skip_proxies: bool, dry_ru
         TimeElapsedColumn(),
         console=console,
     ) as progress:
-        total = sum(
-            1
-            for d in raw_dir.iterdir()
-            if d.is_dir()
-            for f in d.rglob("*")
-            if f.is_file() and f.suffix.lower() in (VIDEO_EXTENSIONS | IMAGE_EXTENSIONS)
-        )
-        task = progress.add_task("Processing...", total=total)
+        # One walk sizes the progress bar and is handed to the pipeline
+        plan = prepare_pipeline(raw_dir)
+        task = progress.add_task("Processing...", total=len(plan.media))
 
         def on_progress(file: Path, device: str):
             progress.update(task, advance=1, description=f"[cyan]{device}[/cyan] {file.name}")
 
-        results = run_pipeline(raw_dir, norm_dir, proxy_dir, pipeline_config, on_progress)
+        results = run_pipeline(raw_dir, norm_dir, proxy_dir, pipeline_config, on_progress, plan)
 
     # Summary
     console.print()
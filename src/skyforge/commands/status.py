@@ -4,7 +4,13 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from skyforge.client import FlightDeckClient, FlightDeckError, FlightDeckUnavailableError, JobStatus
+from skyforge.client import (
+    FlightDeckClient,
+    FlightDeckError,
+    FlightDeckUnavailableError,
+    JobStatus,
+    check_health,
+)
 from skyforge.config import load_config
 
 app = typer.Typer()
@@ -63,10 +69,7 @@ def health() -> None:
     """
     config = load_config()
 
-    with FlightDeckClient(config) as client:
-        ok = client.health_check()
-
-    if ok:
+    if check_health(config):
         console.print(f"[green]FlightDeck is healthy[/green] at {config.api_url}")
     else:
         console.print(f"[red]FlightDeck is unreachable[/red] at {config.api_url}")
@@ -10,7 +10,7 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
-from skyforge.core.media import VIDEO_EXTENSIONS
+from skyforge.core.media import list_device_videos
 from skyforge.core.project import detect_project_dir
 
 app = typer.Typer()
@@ -82,13 +82,7 @@ def run(
         raise typer.Exit(1)
 
     # Collect normalized videos grouped by device
-    videos: list[tuple[str, Path]] = []
-    for device_dir in sorted(norm_dir.iterdir()):
-        if not device_dir.is_dir():
-            continue
-        for f in sorted(device_dir.iterdir()):
-            if f.is_file() and f.suffix.lower() in VIDEO_EXTENSIONS:
-                videos.append((device_dir.name, f))
+    videos = [(f.parent.name, f) for f in list_device_videos(norm_dir)]
 
     if not videos:
         console.print("[yellow]No normalized videos found.[/yellow]")
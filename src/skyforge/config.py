@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import tomllib
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 CONFIG_DIR = Path.home() / ".skyforge"
@@ -46,14 +47,16 @@ def load_config() -> SkyforgeConfig:
     2. ~/.skyforge/credentials.toml (API key only)
     3. ~/.skyforge/config.toml
     4. Defaults
+
+    The TOML files are parsed once per file version (see _read_toml), so
+    repeated calls within a command only re-check the environment. Each call
+    returns a new SkyforgeConfig that callers may modify.
     """
     config = SkyforgeConfig()
 
     # Load from TOML config file if it exists
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, "rb") as f:
-            data = tomllib.load(f)
-
+    data = _read_toml(CONFIG_FILE)
+    if data is not None:
         api = data.get("api", {})
         if "url" in api:
             config.api_url = api["url"]
@@ -75,11 +78,9 @@ def load_config() -> SkyforgeConfig:
             config.crf = processing["crf"]
 
     # Load credentials from separate file (overrides config.toml key)
-    if CREDENTIALS_FILE.exists():
-        with open(CREDENTIALS_FILE, "rb") as f:
-            creds = tomllib.load(f)
-        if "api_key" in creds:
-            config.api_key = creds["api_key"]
+    creds = _read_toml(CREDENTIALS_FILE)
+    if creds is not None and "api_key" in creds:
+        config.api_key = creds["api_key"]
 
     # Environment overrides (highest priority)
     if url := os.environ.get("FLIGHTDECK_URL"):
@@ -92,6 +93,27 @@ def load_config() -> SkyforgeConfig:
     return config
 
 
+def _read_toml(path: Path) -> dict | None:
+    """Parse a TOML file, cached per (path, mtime, size); None if it does not exist.
+
+    Saving or deleting the file changes its key, so updated credentials and
+    config are picked up without explicit invalidation. The returned dict is
+    shared between calls and must not be modified.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _parse_toml(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML file once per (path, mtime_ns, size); mtime/size only key the cache."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def save_config(config: SkyforgeConfig) -> None:
     """Save configuration to TOML file.
 
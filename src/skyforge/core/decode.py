@@ -0,0 +1,171 @@
+"""Frame decoding — sampled BGR frames from video via OpenCV or PyAV."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Decoders accepted by sampled_frames(); "pyav" needs the optional av package
+DECODERS = ("opencv", "pyav")
+
+# (fps, total frames, iterator of (frame index, BGR frame))
+SampledFrames = tuple[float, int, Iterator[tuple[int, "np.ndarray"]]]
+
+T = TypeVar("T")
+_DONE = object()
+
+
+class _Raised:
+    """Carries a producer exception across prefetch()'s queue."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def sampled_frames(
+    video_path: Path,
+    sample_interval: float,
+    decoder: str = "opencv",
+    hwaccel: str | None = None,
+) -> SampledFrames:
+    """Open a video and sample one BGR frame every `sample_interval` seconds.
+
+    Args:
+        video_path: Path to input video file.
+        sample_interval: Seconds between sampled frames.
+        decoder: "opencv" seeks to each sampled frame with cv2.VideoCapture;
+            "pyav" decodes sequentially with PyAV's frame/slice threading and
+            only converts the sampled frames to BGR.
+        hwaccel: PyAV hardware decode device ("cuda", "vaapi", "videotoolbox").
+            Decoding falls back to software when the device is unavailable.
+
+    Returns:
+        (fps, total frame count, iterator of (frame index, BGR frame)).
+    """
+    if decoder == "pyav":
+        return _pyav_sampled_frames(video_path, sample_interval, hwaccel)
+    if decoder != "opencv":
+        raise ValueError(f"Unknown decoder {decoder!r}; expected one of {DECODERS}")
+    return _opencv_sampled_frames(video_path, sample_interval)
+
+
+def prefetch(items: Iterator[T], depth: int) -> Iterator[T]:
+    """Iterate items from a background thread, keeping up to `depth` ready.
+
+    Decoding (OpenCV and PyAV both release the GIL) then overlaps whatever
+    the consumer does with each item, such as detector inference, so a
+    decode + infer pipeline runs at max(decode, infer) rather than the sum.
+    Exceptions raised by the producer are re-raised in the consumer, and
+    the producer stops once the consumer closes the iterator.
+    """
+    ready: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            put(_Raised(e))
+        else:
+            put(_DONE)
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="skyforge-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Raised):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _opencv_sampled_frames(video_path: Path, sample_interval: float) -> SampledFrames:
+    """Sample frames by seeking cv2.VideoCapture to each sampled index."""
+    import cv2
+
+    cap = cv2.VideoCapture(str(video_path))
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {video_path}")
+
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    frame_interval = int(fps * sample_interval)
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def frames() -> Iterator[tuple[int, np.ndarray]]:
+        try:
+            frame_idx = 0
+            while frame_idx < total_frames:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                yield frame_idx, frame
+                frame_idx += frame_interval
+        finally:
+            cap.release()
+
+    return fps, total_frames, frames()
+
+
+def _pyav_sampled_frames(
+    video_path: Path, sample_interval: float, hwaccel: str | None
+) -> SampledFrames:
+    """Sample frames from one threaded (optionally hardware) PyAV decode pass."""
+    import av
+
+    options = {}
+    if hwaccel:
+        from av.codec.hwaccel import HWAccel
+
+        options["hwaccel"] = HWAccel(device_type=hwaccel, allow_software_fallback=True)
+
+    try:
+        container = av.open(str(video_path), **options)
+    except av.error.FFmpegError as e:
+        raise RuntimeError(f"Cannot open video: {video_path}") from e
+    if not container.streams.video:
+        container.close()
+        raise RuntimeError(f"No video stream: {video_path}")
+
+    stream = container.streams.video[0]
+    stream.thread_type = "AUTO"  # frame + slice threading
+    stream.codec_context.thread_count = 0  # one thread per core
+    fps = float(stream.average_rate or 30.0)
+    total_frames = stream.frames
+    if not total_frames and stream.duration is not None and stream.time_base is not None:
+        total_frames = int(stream.duration * stream.time_base * fps)
+    frame_interval = max(1, int(fps * sample_interval))
+
+    def frames() -> Iterator[tuple[int, np.ndarray]]:
+        with container:
+            for frame_idx, frame in enumerate(container.decode(stream)):
+                if frame_idx % frame_interval == 0:
+                    yield frame_idx, frame.to_ndarray(format="bgr24")
+
+    return fps, total_frames, frames()
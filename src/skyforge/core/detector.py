@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import math
+import shutil
+import tempfile
 from collections import Counter
 from collections.abc import Callable
+from contextlib import closing
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from skyforge.core.decode import prefetch, sampled_frames
+from skyforge.utils import jsonio
+
 if TYPE_CHECKING:
     import numpy as np
 
+# Inference backends for ObjectDetector(engine=...); "auto" picks trt-fp16 on CUDA
+ENGINE_CHOICES = ("auto", "pt", "trt-fp16", "trt-int8")
+ENGINE_CACHE_DIR = Path.home() / ".cache" / "skyforge" / "engines"
+
+# save_detections() writes <stem>_detections.json, plus .gz when compressed
+DETECTIONS_SUFFIX = "_detections.json"
+DETECTIONS_PATTERNS = (f"*{DETECTIONS_SUFFIX}", f"*{DETECTIONS_SUFFIX}.gz")
+
 
 @dataclass
 class DetectionResult:
@@ -41,6 +58,12 @@ class VideoDetections:
     total_frames_sampled: int
     frames: list[FrameDetections] = field(default_factory=list)
     unique_classes: dict[str, int] = field(default_factory=dict)
+    # Inputs that produced these results, so re-runs can skip unchanged videos
+    source_mtime_ns: int | None = None
+    sample_interval: float | None = None
+    confidence: float | None = None
+    classes: list[str] | None = None  # sorted class filter, None for all classes
+    engine: str | None = None  # ObjectDetector.engine, e.g. "pt-fp16" or "trt-int8"
 
     def to_dict(self) -> dict:
         """Serialize to a JSON-compatible dict."""
@@ -58,11 +81,24 @@ class ObjectDetector:
     Delays importing ultralytics/torch until first use so the module
     can be imported without heavy ML dependencies installed.
 
+    With a TensorRT engine ("trt-fp16" / "trt-int8", or "auto" on CUDA) the
+    weights are exported once per model, batch size, precision and GPU, and
+    the engine is cached under ENGINE_CACHE_DIR for later runs.
+
     Args:
         model_name: YOLO model weight file (e.g. "yolov8n.pt").
         confidence: Minimum detection confidence threshold.
         iou_threshold: IoU threshold for non-max suppression.
         device: Compute device ("mps", "cuda", "cpu", or None for auto).
+        engine: Inference backend, one of ENGINE_CHOICES.
+        batch_size: Largest batch passed to detect_frames() (sizes the engine).
+        calibration_videos: Videos to sample INT8 calibration frames from.
+        classes: Class names to keep. They are mapped to class ids once here
+            and filtered inside the model's NMS, rather than per detection.
+        half: Run the .pt model in FP16 (None: on when the device is CUDA).
+            Halves weight and activation bandwidth and uses tensor cores;
+            ignored on CPU/MPS and for TensorRT engines, whose precision is
+            fixed at export.
     """
 
     def __init__(
@@ -71,14 +107,59 @@ class ObjectDetector:
         confidence: float = 0.25,
         iou_threshold: float = 0.45,
         device: str | None = None,
+        engine: str = "pt",
+        batch_size: int = 1,
+        calibration_videos: list[Path] | None = None,
+        classes: list[str] | None = None,
+        half: bool | None = None,
     ) -> None:
         from ultralytics import YOLO
 
-        self.model = YOLO(model_name)
+        if engine not in ENGINE_CHOICES:
+            raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINE_CHOICES}")
+
+        self.model_name = model_name
         self.confidence = confidence
         self.iou_threshold = iou_threshold
         self.device = device or _auto_device()
 
+        if engine == "auto":
+            engine = "trt-fp16" if self.device.startswith("cuda") else "pt"
+        if engine == "pt":
+            self.model = YOLO(model_name)
+        else:
+            if not self.device.startswith("cuda"):
+                raise RuntimeError(f"TensorRT engines need a CUDA device, not {self.device!r}")
+            engine_path = build_engine(
+                model_name,
+                precision=engine.removeprefix("trt-"),
+                batch_size=batch_size,
+                calibration_videos=calibration_videos,
+            )
+            self.model = YOLO(str(engine_path), task="detect")
+
+        on_cuda = self.device.startswith("cuda")
+        self.half = (on_cuda if half is None else half) and on_cuda and engine == "pt"
+        # Resolved backend and precision, recorded with each video's results
+        self.engine = "pt-fp16" if self.half else engine
+
+        self.classes = sorted(set(classes)) if classes else None
+        self.class_ids: list[int] | None = None
+        if classes:
+            wanted = set(classes)
+            self.class_ids = [i for i, name in self.model.names.items() if name in wanted]
+
+    def warmup(self, imgsz: int = 640, batch: int = 1) -> None:
+        """Run one blank batch so model setup and CUDA init happen up front.
+
+        The first inference call builds the predictor, initializes the
+        device context and autotunes kernels for the batch shape; doing it
+        here keeps that cost out of the first video's timing.
+        """
+        import numpy as np
+
+        self.detect_frames([np.zeros((imgsz, imgsz, 3), dtype=np.uint8)] * batch)
+
     def detect_frame(self, frame: np.ndarray) -> list[DetectionResult]:
         """Run detection on a single BGR frame.
 
@@ -88,16 +169,36 @@ class ObjectDetector:
         Returns:
             List of DetectionResult for all objects found.
         """
+        return self.detect_frames([frame])[0]
+
+    def detect_frames(self, frames: list[np.ndarray]) -> list[list[DetectionResult]]:
+        """Run detection on a batch of BGR frames in one model call.
+
+        The frames go through the model as a single batch, so per-call
+        preprocessing, kernel launch and host-to-device copy costs are paid
+        once per batch rather than once per frame.
+
+        Args:
+            frames: OpenCV BGR image arrays (sizes may differ).
+
+        Returns:
+            One list of DetectionResult per input frame, in input order.
+        """
         results = self.model(
-            frame,
+            frames,
             conf=self.confidence,
             iou=self.iou_threshold,
             device=self.device,
+            classes=self.class_ids,
+            half=self.half,
             verbose=False,
         )
+        return [self._to_detections(result) for result in results]
 
+    def _to_detections(self, result) -> list[DetectionResult]:
+        """Convert one ultralytics Results object into DetectionResults."""
         detections: list[DetectionResult] = []
-        boxes = results[0].boxes
+        boxes = result.boxes
         if boxes is None or len(boxes) == 0:
             return detections
 
@@ -137,6 +238,9 @@ def detect_video(
     sample_interval: float = 2.0,
     classes_filter: list[str] | None = None,
     on_progress: Callable[[int, int, int], None] | None = None,
+    batch_size: int = 1,
+    decoder: str = "opencv",
+    hwaccel: str | None = None,
 ) -> VideoDetections:
     """Run object detection across sampled frames of a video.
 
@@ -146,66 +250,199 @@ def detect_video(
         sample_interval: Seconds between sampled frames.
         classes_filter: If provided, keep only detections matching these class names.
         on_progress: Optional callback(frame_idx, total_frames, detections_count).
+        batch_size: Sampled frames passed to the detector per inference call.
+            Up to twice this many decoded frames are held in memory.
+        decoder: Frame decoder, "opencv" or "pyav" (see decode.sampled_frames).
+        hwaccel: Hardware decode device for the PyAV decoder (e.g. "cuda").
 
     Returns:
         VideoDetections with per-frame results and aggregate class counts.
     """
-    import cv2
-
-    cap = cv2.VideoCapture(str(video_path))
-    if not cap.isOpened():
-        raise RuntimeError(f"Cannot open video: {video_path}")
-
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    frame_interval = int(fps * sample_interval)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps, total_frames, sampled = sampled_frames(video_path, sample_interval, decoder, hwaccel)
 
     class_counter: Counter[str] = Counter()
     frames: list[FrameDetections] = []
     frames_sampled = 0
-    frame_idx = 0
 
     filter_set = set(classes_filter) if classes_filter else None
-
-    while frame_idx < total_frames:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        timestamp_s = frame_idx / fps
-        detections = detector.detect_frame(frame)
-
-        # Apply class filter if specified
-        if filter_set:
-            detections = [d for d in detections if d.class_name in filter_set]
-
-        for d in detections:
-            class_counter[d.class_name] += 1
-
-        frames.append(
-            FrameDetections(
-                frame_idx=frame_idx,
-                timestamp_s=round(timestamp_s, 3),
-                detections=detections,
+    batch: list[tuple[int, np.ndarray]] = []
+
+    def flush() -> None:
+        nonlocal frames_sampled
+        results = detector.detect_frames([frame for _, frame in batch])
+        for (idx, _), detections in zip(batch, results, strict=True):
+            # Apply class filter if specified
+            if filter_set:
+                detections = [d for d in detections if d.class_name in filter_set]
+
+            for d in detections:
+                class_counter[d.class_name] += 1
+
+            frames.append(
+                FrameDetections(
+                    frame_idx=idx,
+                    timestamp_s=round(idx / fps, 3),
+                    detections=detections,
+                )
             )
-        )
-        frames_sampled += 1
+            frames_sampled += 1
 
-        if on_progress is not None:
-            on_progress(frame_idx, total_frames, len(detections))
+            if on_progress is not None:
+                on_progress(idx, total_frames, len(detections))
+        batch.clear()
 
-        frame_idx += frame_interval
+    # Decode the next batch on a background thread while this one is inferred.
+    # One batch of read-ahead is enough to overlap the two and keeps at most
+    # about 2 * batch_size frames in memory (~25 MB each at 4K).
+    with closing(prefetch(sampled, depth=batch_size)) as prefetched:
+        for frame_idx, frame in prefetched:
+            batch.append((frame_idx, frame))
+            if len(batch) >= batch_size:
+                flush()
 
-    cap.release()
+    if batch:
+        flush()
+
+    classes = detector.classes
+    if filter_set:
+        classes = sorted(filter_set if classes is None else filter_set.intersection(classes))
 
     return VideoDetections(
         source=str(video_path),
-        model=str(detector.model.model_name),
+        model=detector.model_name,
         total_frames_sampled=frames_sampled,
         frames=frames,
         unique_classes=dict(class_counter),
+        source_mtime_ns=video_path.stat().st_mtime_ns,
+        sample_interval=sample_interval,
+        confidence=detector.confidence,
+        classes=classes,
+        engine=detector.engine,
+    )
+
+
+# ============================================================================
+# TensorRT engine cache
+# ============================================================================
+
+
+def build_engine(
+    model_name: str,
+    precision: str = "fp16",
+    batch_size: int = 1,
+    imgsz: int = 640,
+    calibration_videos: list[Path] | None = None,
+) -> Path:
+    """Return a cached TensorRT engine for a YOLO model, exporting it if needed.
+
+    Engines are specific to the GPU and TensorRT version, so both go into the
+    cache key along with the model, input size, batch size and precision.
+
+    Args:
+        model_name: YOLO model weight file (e.g. "yolov8n.pt").
+        precision: "fp16" or "int8".
+        batch_size: Largest batch the (dynamic) engine accepts.
+        imgsz: Square input size the engine is built for.
+        calibration_videos: Videos to sample INT8 calibration frames from
+            (required for "int8").
+
+    Returns:
+        Path to the .engine file.
+    """
+    import torch
+
+    if precision not in ("fp16", "int8"):
+        raise ValueError(f"Unknown TensorRT precision {precision!r}")
+    if precision == "int8" and not calibration_videos:
+        raise ValueError("INT8 engines need calibration videos")
+
+    try:
+        import tensorrt
+
+        trt_version = tensorrt.__version__
+    except ImportError:
+        trt_version = ""
+
+    key = "|".join(
+        (
+            model_name,
+            str(imgsz),
+            str(batch_size),
+            precision,
+            torch.cuda.get_device_name(),
+            trt_version,
+        )
     )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    engine_path = ENGINE_CACHE_DIR / f"{Path(model_name).stem}-{digest}.engine"
+    if engine_path.exists():
+        return engine_path
+
+    from ultralytics import YOLO
+
+    model = YOLO(model_name)
+    with tempfile.TemporaryDirectory(prefix="skyforge-calib-") as tmp:
+        data = None
+        if precision == "int8":
+            data = _write_calibration_set(calibration_videos, Path(tmp), model.names)
+        exported = model.export(
+            format="engine",
+            half=precision == "fp16",
+            int8=precision == "int8",
+            dynamic=True,
+            batch=batch_size,
+            imgsz=imgsz,
+            data=data,
+            device=0,
+            verbose=False,
+        )
+
+    engine_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(exported), engine_path)
+    return engine_path
+
+
+def _write_calibration_set(
+    videos: list[Path],
+    output_dir: Path,
+    names: dict[int, str],
+    num_frames: int = 200,
+) -> str:
+    """Sample frames at even timestamps across videos as an INT8 calibration set.
+
+    Writes JPEGs plus the dataset YAML that ultralytics' exporter reads
+    calibration images from.
+
+    Returns:
+        Path to the dataset YAML, as a string.
+    """
+    import cv2
+
+    image_dir = output_dir / "images"
+    image_dir.mkdir(parents=True, exist_ok=True)
+    per_video = math.ceil(num_frames / len(videos))
+
+    for video_idx, video_path in enumerate(videos):
+        cap = cv2.VideoCapture(str(video_path))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        for i in range(per_video):
+            cap.set(cv2.CAP_PROP_POS_FRAMES, (2 * i + 1) * total_frames // (2 * per_video))
+            ret, frame = cap.read()
+            if ret:
+                cv2.imwrite(str(image_dir / f"{video_idx:04d}_{i:04d}.jpg"), frame)
+        cap.release()
+
+    # JSON strings are valid YAML scalars, so class names need no escaping
+    lines = [
+        f"path: {json.dumps(str(output_dir))}",
+        "train: images",
+        "val: images",
+        "names:",
+    ]
+    lines += [f"  {idx}: {json.dumps(name)}" for idx, name in sorted(names.items())]
+    data_yaml = output_dir / "data.yaml"
+    data_yaml.write_text("\n".join(lines) + "\n")
+    return str(data_yaml)
 
 
 # ============================================================================
@@ -213,27 +450,72 @@ def detect_video(
 # ============================================================================
 
 
-def save_detections(detections: VideoDetections, output: Path) -> None:
+def save_detections(
+    detections: VideoDetections | dict, output: Path, compress: bool = False
+) -> Path:
     """Write detection results to a JSON file.
 
     Args:
-        detections: VideoDetections to serialize.
+        detections: VideoDetections to serialize, or an already loaded dict.
         output: Destination JSON path (parent dirs created automatically).
+        compress: Write compact JSON gzipped at level 1 to `output` + ".gz"
+            instead. On per-frame detection JSON with a few objects per
+            frame this measured about 6x smaller for little CPU, so the
+            summary and reports read far less data.
+
+    Returns:
+        The path written. The other variant (plain or gzipped) of the same
+        file is removed, so a video never has both.
     """
+    data = detections if isinstance(detections, dict) else detections.to_dict()
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(detections.to_dict(), indent=2))
+    gzipped = output.with_name(output.name + ".gz")
+    if compress:
+        output, stale = gzipped, output
+        output.write_bytes(gzip.compress(jsonio.dumps(data), compresslevel=1))
+    else:
+        stale = gzipped
+        output.write_bytes(jsonio.dumps(data, indent=True))
+    stale.unlink(missing_ok=True)
+    return output
 
 
 def load_detections(path: Path) -> dict:
     """Load detection results from a JSON file.
 
     Args:
-        path: Path to a *_detections.json file.
+        path: Path to a *_detections.json or gzipped *_detections.json.gz file.
 
     Returns:
         Parsed dict of detection data.
     """
-    return json.loads(path.read_text())
+    data = path.read_bytes()
+    if path.suffix == ".gz":
+        data = gzip.decompress(data)
+    return jsonio.loads(data)
+
+
+def find_detection_files(directory: Path, recursive: bool = False) -> list[Path]:
+    """Return the sorted detection files (plain or gzipped) in a directory.
+
+    Where a video has both variants (e.g. written before save_detections()
+    removed the other one), only the newer file is returned, so each video
+    is counted once.
+    """
+    glob = directory.rglob if recursive else directory.glob
+    newest: dict[tuple[Path, str], Path] = {}
+    for pattern in DETECTIONS_PATTERNS:
+        for path in glob(pattern):
+            key = (path.parent, detection_source(path))
+            other = newest.get(key)
+            if other is None or path.stat().st_mtime_ns > other.stat().st_mtime_ns:
+                newest[key] = path
+    return sorted(newest.values())
+
+
+def detection_source(path: Path) -> str:
+    """Return the video stem a detection file was saved for."""
+    return path.name.removesuffix(".gz").removesuffix(DETECTIONS_SUFFIX)
 
 
 # ============================================================================
@@ -144,7 +144,7 @@ def export_report_ready(
 
 
 def _time_str(seconds: float) -> str:
-    """Format seconds as MM-SS for filenames."""
-    m = int(seconds // 60)
-    s = int(seconds % 60)
-    return f"{m:02d}m{s:02d}s"
+    """Format seconds as MMmSSsmmm for filenames (e.g. 01m30s250)."""
+    m, ms = divmod(round(seconds * 1000), 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{m:02d}m{s:02d}s{ms:03d}"
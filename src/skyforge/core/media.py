@@ -1,29 +1,49 @@
 """Media file handling, detection, and metadata extraction via ffprobe."""
 
 import json
+import os
 import subprocess
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
-VIDEO_EXTENSIONS = {".mov", ".mp4", ".m4v", ".avi", ".mkv", ".mts", ".m2ts"}
-IMAGE_EXTENSIONS = {
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".dng",
-    ".raw",
-    ".tiff",
-    ".tif",
-    ".heic",
-    ".cr2",
-    ".arw",
-    ".nef",
-}
-TELEMETRY_EXTENSIONS = {".srt", ".csv", ".gpx", ".kml"}
-PROXY_EXTENSIONS = {".lrv"}
-THUMBNAIL_EXTENSIONS = {".thm"}
+from skyforge.utils import jsonio
+
+VIDEO_EXTENSIONS = frozenset({".mov", ".mp4", ".m4v", ".avi", ".mkv", ".mts", ".m2ts"})
+IMAGE_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".dng",
+        ".raw",
+        ".tiff",
+        ".tif",
+        ".heic",
+        ".cr2",
+        ".arw",
+        ".nef",
+    }
+)
+TELEMETRY_EXTENSIONS = frozenset({".srt", ".csv", ".gpx", ".kml"})
+PROXY_EXTENSIONS = frozenset({".lrv"})
+THUMBNAIL_EXTENSIONS = frozenset({".thm"})
 
 ALL_MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | IMAGE_EXTENSIONS
+# Everything scan_directory() picks up
+_SCAN_EXTENSIONS = (
+    ALL_MEDIA_EXTENSIONS | TELEMETRY_EXTENSIONS | PROXY_EXTENSIONS | THUMBNAIL_EXTENSIONS
+)
+
+# Per-project probe cache for scan_directory(cache_path=...), relative to the project root
+SCAN_CACHE = Path(".skyforge") / "scan_cache.json"
+# Bump when MediaInfo's fields change so stale caches are discarded
+_SCAN_CACHE_VERSION = 1
+
+# Directory tokens for detect_device(), matched against "/"-delimited upper-cased paths
+_DRONE_DIR_TOKENS = ("/ATOM_001/", "/ATOM/", "/DCIM/")
+_IPHONE_DIR_TOKENS = ("/IPHONE/", "/APPLE/")
+_META_DIR_TOKENS = ("/META_GLASSES/", "/META/", "/RAY-BAN/")
 
 
 @dataclass
@@ -214,45 +234,226 @@ def probe_file(path: Path) -> MediaInfo:
     return info
 
 
-def scan_directory(directory: Path, recursive: bool = True) -> list[MediaInfo]:
-    """Scan a directory for all media files and probe each one."""
-    all_extensions = (
-        VIDEO_EXTENSIONS
-        | IMAGE_EXTENSIONS
-        | TELEMETRY_EXTENSIONS
-        | PROXY_EXTENSIONS
-        | THUMBNAIL_EXTENSIONS
-    )
-    pattern = "**/*" if recursive else "*"
-    files = [
-        f for f in directory.glob(pattern) if f.is_file() and f.suffix.lower() in all_extensions
-    ]
+def scan_directory(
+    directory: Path, recursive: bool = True, cache_path: Path | None = None
+) -> list[MediaInfo]:
+    """Scan a directory for all media files and probe each one.
+
+    With cache_path (normally project / SCAN_CACHE), results are cached per
+    file keyed by (mtime_ns, size): unchanged files skip ffprobe and EXIF
+    reads on later scans, and new or modified files are probed again.
+    Entries for files outside this scan are kept, so scans of different
+    folders can share one cache.
+    """
+    if recursive:
+        files = _walk_files(str(directory), _SCAN_EXTENSIONS)
+    else:
+        cased = _with_upper(_SCAN_EXTENSIONS)
+        with os.scandir(directory) as entries:
+            files = sorted(
+                Path(entry.path)
+                for entry in entries
+                if ((ext := _extension(entry.name)) in cased or ext.lower() in _SCAN_EXTENSIONS)
+                and entry.is_file()
+            )
+    cache = _load_scan_cache(cache_path) if cache_path else {}
+    entries = {}
     results = []
-    for f in sorted(files):
-        info = probe_file(f)
-        if info.media_type == "image":
-            info.gps = extract_gps_from_image(f)
+    for f in files:
+        key = os.path.abspath(f)
+        stat = f.stat()
+        entry = cache.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            info = _info_from_cache(f, entry["info"])
+            entries[key] = entry
+        else:
+            info = probe_file(f)
+            if info.media_type == "image":
+                info.gps = extract_gps_from_image(f)
+            # A video ffprobe could not read is left uncached, so it is retried
+            if info.media_type != "video" or info.codec != "unknown":
+                entries[key] = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "info": _info_to_cache(info),
+                }
         results.append(info)
+
+    if cache_path:
+        # Other directories can share the cache (e.g. a subfolder scan), so
+        # only entries this scan covered and did not see are pruned
+        merged = dict(cache)
+        root = os.path.abspath(directory)
+        for key in cache:
+            parent = os.path.dirname(key)
+            covered = parent == root or (recursive and parent.startswith(os.path.join(root, "")))
+            if covered and key not in entries:
+                del merged[key]
+        merged.update(entries)
+        if merged != cache:
+            _save_scan_cache(cache_path, merged)
     return results
 
 
+def list_device_videos(root: Path) -> list[Path]:
+    """List video files one level down in root's device folders, sorted.
+
+    Matches `root/<device>/<file>` layouts such as 02_NORMALIZED/. A single
+    os.scandir pass per folder uses the type cached from the directory read
+    and only builds Paths for video files.
+    """
+    videos = []
+    cased = _with_upper(VIDEO_EXTENSIONS)
+    with os.scandir(root) as device_dirs:
+        for device_dir in device_dirs:
+            if not device_dir.is_dir():
+                continue
+            with os.scandir(device_dir.path) as entries:
+                videos.extend(
+                    entry.path
+                    for entry in entries
+                    if ((ext := _extension(entry.name)) in cased or ext.lower() in VIDEO_EXTENSIONS)
+                    and entry.is_file()
+                )
+    return sorted(map(Path, videos))
+
+
+def walk_device_files(root: Path, extensions: frozenset[str]) -> list[tuple[Path, str]]:
+    """Recursively list files with the given extensions in root's device folders.
+
+    Matches `root/<device>/**/<file>` layouts such as 01_RAW/ (nested DCIM/
+    trees included). Each device folder is walked with os.scandir in its own
+    thread, so stat latency on network or external drives overlaps across
+    devices. Like Path.rglob, symlinked subdirectories are not followed.
+
+    Returns:
+        (path, device) pairs, ordered by device then path.
+    """
+    with os.scandir(root) as entries:
+        device_dirs = sorted((e for e in entries if e.is_dir()), key=lambda e: e.name)
+    if not device_dirs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(device_dirs))) as pool:
+        per_device = pool.map(lambda d: _walk_files(d.path, extensions), device_dirs)
+        return [
+            (path, device_dir.name)
+            for device_dir, paths in zip(device_dirs, per_device, strict=True)
+            for path in paths
+        ]
+
+
+def count_files(root: Path, suffix: str = "") -> int:
+    """Count files under root (recursive) whose name ends with suffix.
+
+    The os.scandir equivalent of counting rglob(f"*{suffix}") files, without
+    a Path object or extra stat per entry. Like rglob, symlinked
+    subdirectories are not followed.
+    """
+    count = 0
+    pending = [str(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    count += 1
+    return count
+
+
+def _load_scan_cache(cache_path: Path) -> dict:
+    """Read a scan cache; missing, unreadable or outdated caches are empty."""
+    try:
+        data = jsonio.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _SCAN_CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def _save_scan_cache(cache_path: Path, entries: dict) -> None:
+    """Write a scan cache; failures (e.g. read-only media) are ignored."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(jsonio.dumps({"version": _SCAN_CACHE_VERSION, "files": entries}))
+    except OSError:
+        pass
+
+
+def _info_to_cache(info: MediaInfo) -> dict:
+    """MediaInfo fields as JSON-safe values, without the path (the cache key)."""
+    data = asdict(info)
+    del data["path"]
+    return data
+
+
+def _info_from_cache(path: Path, data: dict) -> MediaInfo:
+    """Rebuild a MediaInfo from _info_to_cache() output."""
+    info = MediaInfo(path=path, **data)
+    if info.gps is not None:
+        info.gps = tuple(info.gps)
+    return info
+
+
+def _walk_files(top: str, extensions: frozenset[str]) -> list[Path]:
+    """Sorted files under top (recursive) whose lower-cased suffix is in extensions."""
+    cased = _with_upper(extensions)
+    found = []
+    pending = [top]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif (
+                    (ext := _extension(entry.name)) in cased or ext.lower() in extensions
+                ) and entry.is_file():
+                    found.append(entry.path)
+    return sorted(map(Path, found))
+
+
+def _extension(name: str) -> str:
+    """os.path.splitext(name)[1] for a bare file name, without splitext's overhead.
+
+    Leading dots do not start an extension, so ".mp4" has none while
+    "._DJI_0001.MP4" (a macOS resource fork) has ".MP4", as with splitext.
+    """
+    i = name.rfind(".")
+    if i <= 0 or (name[0] == "." and not name[:i].strip(".")):
+        return ""
+    return name[i:]
+
+
+def _with_upper(extensions: frozenset[str]) -> frozenset[str]:
+    """Lower-case extensions plus their upper-case forms.
+
+    Camera files are named all upper-case (DJI_0001.MP4) or all lower-case,
+    so matching a suffix against this set first skips the per-file lower()
+    copy; only mixed-case suffixes fall back to lower-casing.
+    """
+    return extensions | {ext.upper() for ext in extensions}
+
+
 def detect_device(file_path: Path) -> str:
     """Detect the capture device from the file path or naming convention."""
-    parts = [p.upper() for p in file_path.parts]
+    # One upper-cased string with sentinel slashes so every component is "/NAME/"
+    path = f"/{file_path.as_posix().upper()}/"
     name = file_path.stem.upper()
 
     # Known device patterns
-    if any(d in parts for d in ("ATOM_001", "ATOM", "DCIM")) or name.startswith("PTSC_"):
+    if any(t in path for t in _DRONE_DIR_TOKENS) or name.startswith("PTSC_"):
         return "drone"
-    if "IPHONE" in parts or "APPLE" in parts:
+    if any(t in path for t in _IPHONE_DIR_TOKENS):
         return "iphone"
-    if "META_GLASSES" in parts or "META" in parts or "RAY-BAN" in parts:
+    if any(t in path for t in _META_DIR_TOKENS):
         return "meta_glasses"
-    if "GOPRO" in parts or name.startswith("GH") or name.startswith("GX"):
+    if "/GOPRO/" in path or name.startswith(("GH", "GX")):
         return "gopro"
-    if "DJI" in parts or name.startswith("DJI_"):
+    if "/DJI/" in path or name.startswith("DJI_"):
         return "dji"
-    if "INSTA360" in parts:
+    if "/INSTA360/" in path:
         return "insta360"
     if "SINGULAR_DISPLAY" in name:
         return "meta_glasses"
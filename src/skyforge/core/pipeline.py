@@ -2,10 +2,19 @@
 
 import json
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from skyforge.core.media import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, MediaInfo, probe_file
+from skyforge.core.media import (
+    ALL_MEDIA_EXTENSIONS,
+    VIDEO_EXTENSIONS,
+    MediaInfo,
+    probe_file,
+    walk_device_files,
+)
+
+# Media plus SRT telemetry, so one walk finds everything run_pipeline() touches
+_PLAN_EXTENSIONS = ALL_MEDIA_EXTENSIONS | {".srt"}
 
 
 @dataclass
@@ -52,6 +61,14 @@ class ProcessingResult:
     hdr_tonemapped: bool = False
 
 
+@dataclass
+class PipelinePlan:
+    """Files found under a raw directory, as (path, device) pairs."""
+
+    media: list[tuple[Path, str]] = field(default_factory=list)
+    telemetry: list[tuple[Path, str]] = field(default_factory=list)
+
+
 def process_video(
     source: Path,
     norm_dir: Path,
@@ -119,19 +136,46 @@ def process_image(source: Path, norm_dir: Path, config: PipelineConfig) -> Proce
     return result
 
 
+def prepare_pipeline(raw_dir: Path) -> PipelinePlan:
+    """Find the media and SRT telemetry files under raw_dir in one walk.
+
+    Recursive per device folder, so nested DCIM/ structures are included.
+    len(plan.media) is the number of files run_pipeline() will process.
+    """
+    plan = PipelinePlan()
+    for f, device in walk_device_files(raw_dir, _PLAN_EXTENSIONS):
+        if f.suffix.lower() in ALL_MEDIA_EXTENSIONS:
+            plan.media.append((f, device))
+        elif f.suffix in (".SRT", ".srt"):
+            plan.telemetry.append((f, device))
+    return plan
+
+
 def run_pipeline(
     raw_dir: Path,
     norm_dir: Path,
     proxy_dir: Path,
     config: PipelineConfig,
     progress_callback=None,
+    plan: PipelinePlan | None = None,
 ) -> list[ProcessingResult]:
     """Run the full ingest pipeline on a raw directory.
 
-    Processes all device subdirectories automatically.
+    Processes all device subdirectories automatically. Pass the plan from
+    prepare_pipeline() when the caller already needed it (e.g. to size a
+    progress bar), so raw_dir isn't walked again.
     """
     results = []
 
+    if plan is None:
+        plan = prepare_pipeline(raw_dir)
+    files_by_device: dict[str, list[Path]] = {}
+    for f, device in plan.media:
+        files_by_device.setdefault(device, []).append(f)
+    telemetry_by_device: dict[str, list[Path]] = {}
+    for f, device in plan.telemetry:
+        telemetry_by_device.setdefault(device, []).append(f)
+
     # Process each device subdirectory
     device_dirs = sorted([d for d in raw_dir.iterdir() if d.is_dir()])
 
@@ -142,16 +186,7 @@ def run_pipeline(
         device_norm.mkdir(parents=True, exist_ok=True)
         device_proxy.mkdir(parents=True, exist_ok=True)
 
-        # Collect media files (recursive — handles nested DCIM/ structures)
-        files = sorted(
-            [
-                f
-                for f in device_dir.rglob("*")
-                if f.is_file() and f.suffix.lower() in (VIDEO_EXTENSIONS | IMAGE_EXTENSIONS)
-            ]
-        )
-
-        for f in files:
+        for f in files_by_device.get(device_name, []):
             if progress_callback:
                 progress_callback(f, device_name)
 
@@ -166,11 +201,7 @@ def run_pipeline(
         # Copy telemetry/SRT files (recursive)
         import shutil
 
-        for srt in device_dir.rglob("*.SRT"):
-            dest = device_norm / srt.name
-            if not dest.exists():
-                shutil.copy2(srt, dest)
-        for srt in device_dir.rglob("*.srt"):
+        for srt in telemetry_by_device.get(device_name, []):
             dest = device_norm / srt.name
             if not dest.exists():
                 shutil.copy2(srt, dest)
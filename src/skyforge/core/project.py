@@ -15,6 +15,9 @@ PROJECT_DIRS = [
     "08_VISION",
 ]
 
+# Project roots already found by detect_project_dir(), keyed by resolved start path
+_project_roots: dict[Path, Path] = {}
+
 
 def create_project(base_dir: Path, name: str, devices: list[str] | None = None) -> Path:
     """Create a new flight project with standard directory structure.
@@ -66,10 +69,19 @@ def load_project(project_dir: Path) -> dict:
 
 
 def detect_project_dir(path: Path) -> Path | None:
-    """Walk up from path to find a project root (contains 01_RAW/)."""
-    current = path.resolve()
+    """Walk up from path to find a project root (contains 01_RAW/).
+
+    Roots found are remembered per resolved start path, so commands that look
+    the project up more than once walk the tree once. Misses are not cached,
+    so a project created later in the same process is still found.
+    """
+    start = path.resolve()
+    if (root := _project_roots.get(start)) is not None:
+        return root
+    current = start
     for _ in range(10):
         if (current / "01_RAW").is_dir():
+            _project_roots[start] = current
             return current
         if current == current.parent:
             break
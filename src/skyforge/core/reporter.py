@@ -7,6 +7,9 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from skyforge.core.detector import detection_source, find_detection_files, load_detections
+from skyforge.utils import jsonio
+
 
 def export_analysis_csv(analysis_dir: Path, output: Path) -> Path:
     """Export frame-level analysis data to a flat CSV file.
@@ -87,7 +90,7 @@ def export_segments_csv(analysis_dir: Path, output: Path) -> Path:
         writer.writeheader()
 
         for selects_json in sorted(analysis_dir.glob("selects_*.json")):
-            data = json.loads(selects_json.read_text())
+            data = jsonio.loads(selects_json.read_bytes())
 
             for segment in data.get("segments", []):
                 writer.writerow(
@@ -108,7 +111,7 @@ def export_segments_csv(analysis_dir: Path, output: Path) -> Path:
 def export_detections_csv(detections_dir: Path, output: Path) -> Path:
     """Export object detection data to a CSV file.
 
-    Walks detections_dir for ``*_detections.json`` files and writes one
+    Walks detections_dir for ``*_detections.json[.gz]`` files and writes one
     row per frame, summarising the detections found.
 
     Args:
@@ -130,9 +133,9 @@ def export_detections_csv(detections_dir: Path, output: Path) -> Path:
         writer = csv.DictWriter(fh, fieldnames=fieldnames)
         writer.writeheader()
 
-        for det_json in sorted(detections_dir.glob("*_detections.json")):
-            data = json.loads(det_json.read_text())
-            source = det_json.stem.removesuffix("_detections")
+        for det_json in find_detection_files(detections_dir):
+            data = load_detections(det_json)
+            source = detection_source(det_json)
 
             for frame in data.get("frames", []):
                 detections = frame.get("detections", [])
@@ -201,7 +204,7 @@ def export_project_excel(project_dir: Path, output: Path) -> Path:
         ("Selects Files", str(len(selects_files))),
     ]
     if detections_dir.exists():
-        det_count = len(list(detections_dir.glob("*_detections.json")))
+        det_count = len(find_detection_files(detections_dir))
         summary_rows.append(("Detection Files", str(det_count)))
 
     for row in summary_rows:
@@ -258,7 +261,7 @@ def export_project_excel(project_dir: Path, output: Path) -> Path:
     ws_segments.append(seg_headers)
 
     for selects_json in sorted(selects_files):
-        data = json.loads(selects_json.read_text())
+        data = jsonio.loads(selects_json.read_bytes())
         for segment in data.get("segments", []):
             ws_segments.append(
                 [
@@ -280,9 +283,9 @@ def export_project_excel(project_dir: Path, output: Path) -> Path:
         det_headers = ["source", "frame_idx", "timestamp_s", "total_detections", "classes"]
         ws_det.append(det_headers)
 
-        for det_json in sorted(detections_dir.glob("*_detections.json")):
-            data = json.loads(det_json.read_text())
-            source = det_json.stem.removesuffix("_detections")
+        for det_json in find_detection_files(detections_dir):
+            data = load_detections(det_json)
+            source = detection_source(det_json)
             for frame in data.get("frames", []):
                 detections = frame.get("detections", [])
                 unique_classes = sorted({d.get("class_name", "unknown") for d in detections})
@@ -1,10 +1,10 @@
 """Segment selector — score and select usable video segments from analysis data."""
 
-import json
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from skyforge.core.analyzer import FrameAnalysis, VideoAnalysis
+from skyforge.utils import jsonio
 
 
 @dataclass
@@ -37,6 +37,7 @@ class SelectsResult:
     segments: list[Segment] = field(default_factory=list)
     rejected_duration: float = 0.0
     selected_duration: float = 0.0
+    best_confidence: float = 0.0
 
     def to_dict(self) -> dict:
         d = asdict(self)
@@ -60,6 +61,11 @@ def select_segments(
     4. Split at scene changes
     5. Filter by minimum confidence and duration
     6. Tag each segment with reason codes
+
+    blur_threshold and dark_threshold are deprecated and ignored: scoring
+    reads the analyzer's is_blurry/is_dark flags, so set those thresholds
+    through analyze_video(). They stay in the signature so positional
+    callers keep working.
     """
     result = SelectsResult(
         source_file=analysis.source_file,
@@ -72,25 +78,22 @@ def select_segments(
     # Build scene change timestamps for splitting
     scene_times = {round(sc.timestamp, 1) for sc in analysis.scene_changes}
 
-    # Score each frame
-    scored_frames = []
-    for fa in analysis.frame_analyses:
-        score, tags = _score_frame(fa, blur_threshold, dark_threshold)
-        scored_frames.append((fa, score, tags))
+    # Score each frame (segment tags come from aggregates, not per-frame tags)
+    scored_frames = [(fa, _score_frame(fa)) for fa in analysis.frame_analyses]
 
     # Group consecutive good frames into candidate segments
     candidates = []
     current_start = None
     current_frames = []
 
-    for fa, score, tags in scored_frames:
+    for fa, score in scored_frames:
         is_good = score >= min_confidence
         at_scene_change = round(fa.timestamp, 1) in scene_times
 
         if is_good and not at_scene_change:
             if current_start is None:
                 current_start = fa.timestamp
-            current_frames.append((fa, score, tags))
+            current_frames.append((fa, score))
         else:
             # Flush current segment
             if current_frames:
@@ -101,7 +104,7 @@ def select_segments(
             # If this frame is good but at a scene change, start a new segment
             if is_good:
                 current_start = fa.timestamp
-                current_frames = [(fa, score, tags)]
+                current_frames = [(fa, score)]
 
     # Flush final segment
     if current_frames:
@@ -128,18 +131,25 @@ def select_segments(
                 # Too short after splitting — merge with previous if possible
                 break
 
-            # Compute segment-level stats
-            seg_frames = [f for f, s, t in frames if seg_start <= f.timestamp < seg_end]
+            # Compute segment-level stats in one pass over the candidate's frames
+            seg_frames = []
+            sum_blur = sum_brightness = sum_motion = sum_score = 0.0
+            for f, s in frames:
+                if seg_start <= f.timestamp < seg_end:
+                    seg_frames.append(f)
+                    sum_blur += f.blur_score
+                    sum_brightness += f.brightness
+                    sum_motion += f.motion_score
+                    sum_score += s
             if not seg_frames:
                 seg_start = seg_end
                 continue
 
-            avg_blur = sum(f.blur_score for f in seg_frames) / len(seg_frames)
-            avg_brightness = sum(f.brightness for f in seg_frames) / len(seg_frames)
-            avg_motion = sum(f.motion_score for f in seg_frames) / len(seg_frames)
-            avg_score = sum(s for f, s, t in frames if seg_start <= f.timestamp < seg_end) / len(
-                seg_frames
-            )
+            n = len(seg_frames)
+            avg_blur = sum_blur / n
+            avg_brightness = sum_brightness / n
+            avg_motion = sum_motion / n
+            avg_score = sum_score / n
 
             # Determine tags
             tags = _tag_segment(seg_frames, avg_motion, avg_blur, avg_brightness, analysis)
@@ -160,6 +170,7 @@ def select_segments(
             segment.notes = _generate_notes(segment)
 
             result.segments.append(segment)
+            result.best_confidence = max(result.best_confidence, segment.confidence)
             seg_id += 1
             seg_start = seg_end
 
@@ -186,12 +197,12 @@ def generate_master_timeline(selects_list: list[SelectsResult], output: Path) ->
         "segments": all_segments,
     }
 
-    output.write_text(json.dumps(master, indent=2))
+    output.write_bytes(jsonio.dumps(master, indent=True))
 
 
 def save_selects(selects: SelectsResult, output: Path) -> None:
     """Save per-video selects to JSON."""
-    output.write_text(json.dumps(selects.to_dict(), indent=2))
+    output.write_bytes(jsonio.dumps(selects.to_dict(), indent=True))
 
 
 # ============================================================================
@@ -199,56 +210,43 @@ def save_selects(selects: SelectsResult, output: Path) -> None:
 # ============================================================================
 
 
-def _score_frame(
-    fa: FrameAnalysis,
-    blur_threshold: float,
-    dark_threshold: float,
-) -> tuple[float, list[str]]:
-    """Score a single frame 0-1 and return reason tags."""
+def _score_frame(fa: FrameAnalysis) -> float:
+    """Score a single frame 0-1.
+
+    Blur and darkness come from the analyzer's is_blurry/is_dark flags, so
+    their thresholds are applied at analysis time (analyze_video).
+    """
     score = 1.0
-    tags = []
 
     # Penalize blur
     if fa.is_blurry:
         score -= 0.5
-        tags.append("blurry")
-    elif fa.blur_score > blur_threshold * 3:
-        tags.append("sharp")
 
     # Penalize darkness
     if fa.is_dark:
         score -= 0.6
-        tags.append("too_dark")
     elif fa.brightness < 60:
         score -= 0.2
-        tags.append("dim")
 
     # Penalize overexposure
     if fa.is_overexposed:
         score -= 0.4
-        tags.append("overexposed")
 
     # Low contrast (lens covered, fog, etc.)
     if fa.contrast < 15:
         score -= 0.5
-        tags.append("low_contrast")
 
-    # Reward moderate motion (interesting content)
+    # Reward moderate motion (interesting content), penalize shake
     if 2.0 < fa.motion_score < 20.0:
         score += 0.1
-        tags.append("good_motion")
-    elif fa.motion_score < 0.5:
-        tags.append("static")
     elif fa.motion_score > 30.0:
         score -= 0.2
-        tags.append("shaky")
 
     # Reward good exposure
     if 80 < fa.brightness < 180 and fa.contrast > 30:
         score += 0.1
-        tags.append("well_exposed")
 
-    return max(0.0, min(1.0, score)), tags
+    return max(0.0, min(1.0, score))
 
 
 def _tag_segment(
@@ -0,0 +1,32 @@
+"""JSON encode/decode with orjson when installed, falling back to the stdlib.
+
+orjson parses and serialises several times faster than the json module,
+which matters for quality reports and analysis files holding thousands of
+per-frame entries. It is an optional dependency (``pip install skyforge[fast]``);
+without it these helpers behave the same through ``json``.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialise obj to UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
@@ -0,0 +1,63 @@
+"""Tests for skyforge.client's streamed multipart upload body."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from skyforge import client
+from skyforge.client import _multipart_astream, _multipart_envelope, _multipart_stream
+
+FIELDS = {
+    "project": "North field",
+    "flight": 3,
+    "altitude": 120.5,
+    "hdr": True,
+    "normalized": False,
+    "notes": None,
+    'say "hi"': "quoted name",
+}
+
+
+def _httpx_body(path, fields: dict) -> tuple[str, bytes]:
+    """Return the boundary and body httpx encodes for data= plus files=."""
+    with open(path, "rb") as f:
+        request = httpx.Request(
+            "POST",
+            "https://flightdeck.test/api/v1/upload",
+            data=fields,
+            files={"file": (path.name, f, "video/mp4")},
+        )
+        body = request.read()
+    boundary = request.headers["Content-Type"].partition("boundary=")[2]
+    assert int(request.headers["Content-Length"]) == len(body)
+    return boundary, body
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["DJI_0001.MP4", 'clip "final".mp4', "back\\slash.mp4", "naïve café.mov"],
+)
+@pytest.mark.parametrize("fields", [{}, FIELDS])
+def test_multipart_body_matches_httpx(tmp_path, monkeypatch, filename, fields):
+    monkeypatch.setattr(client, "_UPLOAD_CHUNK", 7)  # several reads per file
+    path = tmp_path / filename
+    path.write_bytes(bytes(range(256)) * 3)
+
+    boundary, expected = _httpx_body(path, fields)
+    head, tail = _multipart_envelope(boundary, path.name, fields)
+
+    assert b"".join(_multipart_stream(path, head, tail)) == expected
+    assert len(head) + path.stat().st_size + len(tail) == len(expected)
+
+
+def test_async_multipart_body_matches_sync(tmp_path, monkeypatch):
+    monkeypatch.setattr(client, "_UPLOAD_CHUNK", 7)
+    path = tmp_path / "DJI_0001.MP4"
+    path.write_bytes(bytes(range(256)))
+    head, tail = _multipart_envelope("b0undary", path.name, FIELDS)
+
+    async def collect() -> bytes:
+        return b"".join([chunk async for chunk in _multipart_astream(path, head, tail)])
+
+    assert asyncio.run(collect()) == b"".join(_multipart_stream(path, head, tail))
@@ -0,0 +1,50 @@
+"""Tests for skyforge.core.decode.prefetch — the background frame producer."""
+
+import threading
+from itertools import count
+
+import pytest
+
+from skyforge.core.decode import prefetch
+
+
+def _prefetch_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "skyforge-prefetch"]
+
+
+def test_prefetch_passes_items_through_in_order():
+    assert list(prefetch(iter(range(100)), depth=3)) == list(range(100))
+    assert _prefetch_threads() == []
+
+
+def test_prefetch_reraises_producer_exception():
+    def frames():
+        yield 1
+        yield 2
+        raise ValueError("decode failed")
+
+    received = []
+    with pytest.raises(ValueError, match="decode failed"):
+        for item in prefetch(frames(), depth=1):
+            received.append(item)
+
+    assert received == [1, 2]
+    assert _prefetch_threads() == []
+
+
+def test_prefetch_close_stops_producer():
+    closed = threading.Event()
+
+    def frames():
+        try:
+            yield from count()
+        finally:
+            closed.set()
+
+    prefetched = prefetch(frames(), depth=2)
+    assert [next(prefetched), next(prefetched)] == [0, 1]
+
+    prefetched.close()
+
+    assert closed.is_set()
+    assert _prefetch_threads() == []
@@ -0,0 +1,128 @@
+"""Tests for skyforge.core.media — extension matching and the scan cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from skyforge.core import media
+from skyforge.core.media import SCAN_CACHE, MediaInfo, scan_directory
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "DJI_0001.MP4",
+        "clip.mov",
+        "archive.tar.gz",
+        "noext",
+        ".mp4",
+        "..mp4",
+        "._DJI_0001.MP4",
+        ".hidden.srt",
+        "trailing.",
+        "a..mp4",
+        "...",
+    ],
+)
+def test_extension_matches_splitext(name):
+    assert media._extension(name) == os.path.splitext(name)[1]
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Replace ffprobe with a stub that records every probed path."""
+    probed: list[Path] = []
+
+    def fake_probe(path: Path) -> MediaInfo:
+        probed.append(path)
+        return MediaInfo(
+            path=path,
+            codec="h264",
+            size_bytes=path.stat().st_size,
+            media_type=media._classify_type(path),
+        )
+
+    monkeypatch.setattr(media, "probe_file", fake_probe)
+    monkeypatch.setattr(media, "extract_gps_from_image", lambda path: None)
+    return probed
+
+
+def _write(path: Path, data: bytes = b"x") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_scan_cache_hit_skips_probe(tmp_path, probes):
+    raw = tmp_path / "01_RAW"
+    _write(raw / "drone" / "DJI_0001.MP4")
+    _write(raw / "drone" / "DJI_0001.SRT")
+    cache = tmp_path / SCAN_CACHE
+
+    first = scan_directory(raw, cache_path=cache)
+    assert len(probes) == 2
+    assert cache.exists()
+
+    second = scan_directory(raw, cache_path=cache)
+    assert len(probes) == 2
+    assert second == first
+
+
+def test_scan_cache_miss_for_new_and_modified_files(tmp_path, probes):
+    raw = tmp_path / "01_RAW"
+    clip = _write(raw / "drone" / "DJI_0001.MP4")
+    cache = tmp_path / SCAN_CACHE
+    scan_directory(raw, cache_path=cache)
+
+    os.utime(clip, ns=(1, 1))
+    added = _write(raw / "drone" / "DJI_0002.MP4")
+    scan_directory(raw, cache_path=cache)
+
+    assert probes[1:] == [clip, added]
+
+
+def test_scan_cache_prunes_only_files_within_the_scan(tmp_path, probes):
+    raw = tmp_path / "01_RAW"
+    top = _write(raw / "top.mp4")
+    nested = _write(raw / "drone" / "DJI_0001.MP4")
+    gone = _write(raw / "drone" / "DJI_0002.MP4")
+    cache = tmp_path / SCAN_CACHE
+    scan_directory(raw, cache_path=cache)
+
+    # A non-recursive scan must not drop cached files in subfolders
+    scan_directory(raw, recursive=False, cache_path=cache)
+    gone.unlink()
+    # A subfolder scan drops its vanished file but keeps the parent's entries
+    scan_directory(raw / "drone", cache_path=cache)
+
+    del probes[:]
+    scan_directory(raw, cache_path=cache)
+    assert probes == []
+    assert set(media._load_scan_cache(cache)) == {str(top), str(nested)}
+
+
+def test_scan_cache_does_not_store_unreadable_videos(tmp_path, monkeypatch):
+    raw = tmp_path / "01_RAW"
+    _write(raw / "drone" / "broken.mp4")
+    probed = []
+
+    def failed_probe(path: Path) -> MediaInfo:
+        probed.append(path)
+        return MediaInfo(path=path, media_type="video")  # codec stays "unknown"
+
+    monkeypatch.setattr(media, "probe_file", failed_probe)
+    cache = tmp_path / SCAN_CACHE
+    scan_directory(raw, cache_path=cache)
+    scan_directory(raw, cache_path=cache)
+    assert len(probed) == 2
+
+
+def test_scan_cache_ignores_outdated_version(tmp_path, probes):
+    raw = tmp_path / "01_RAW"
+    _write(raw / "drone" / "DJI_0001.MP4")
+    cache = _write(tmp_path / SCAN_CACHE, b'{"version": 0, "files": {}}')
+
+    scan_directory(raw, cache_path=cache)
+    assert len(probes) == 1
+    assert media._load_scan_cache(cache)
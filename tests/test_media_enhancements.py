@@ -0,0 +1,35 @@
+"""Tests for flightdeck_contrib.ingestion.media_enhancements command builders."""
+
+from pathlib import Path
+
+import pytest
+from flightdeck_contrib.ingestion.media_enhancements import build_normalize_command
+
+
+def _normalize(**kwargs) -> list[str]:
+    return build_normalize_command(Path("in.mov"), Path("out.mp4"), **kwargs)
+
+
+def test_vaapi_with_libplacebo_tonemap_is_rejected():
+    with pytest.raises(ValueError, match="libplacebo"):
+        _normalize(is_hdr=True, tonemap_backend="libplacebo", hwaccel="vaapi")
+
+
+def test_vaapi_with_libplacebo_backend_is_fine_for_sdr():
+    cmd = _normalize(is_hdr=False, tonemap_backend="libplacebo", hwaccel="vaapi")
+    assert "vulkan=vk" not in cmd
+    assert cmd.count("-filter_hw_device") == 1
+
+
+@pytest.mark.parametrize("hwaccel", [None, "cuda", "vaapi", "videotoolbox"])
+@pytest.mark.parametrize("backend", ["cpu", "libplacebo", "vaapi"])
+def test_hdr_normalize_sets_at_most_one_filter_device(hwaccel, backend):
+    if hwaccel == "vaapi" and backend == "libplacebo":
+        pytest.skip("rejected, see test_vaapi_with_libplacebo_tonemap_is_rejected")
+    cmd = _normalize(is_hdr=True, tonemap_backend=backend, hwaccel=hwaccel)
+
+    assert cmd.count("-filter_hw_device") <= 1
+    if backend == "libplacebo":
+        assert cmd[cmd.index("-filter_hw_device") + 1] == "vk"
+    elif backend == "vaapi" or hwaccel == "vaapi":
+        assert cmd[cmd.index("-filter_hw_device") + 1] == "va"